@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Measure how long importing pyalteon takes, and fail if it is over budget.
+
+Run it from the top of the repository, e.g.:
+
+    python -m benchmarks.import_time --repeat 10
+
+Each statement is run in fresh interpreters, and the fastest run is kept.  Only the statement itself is timed, so the
+interpreter's own startup is left out, but every module the statement imports is counted.  The script also checks
+that the statements don't import modules they don't need, such as requests for the endpoint classes.  It exits
+with status 1 if any statement is over budget or imports a module it shouldn't.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+# The statements to measure, their budget in milliseconds and the modules they must not import
+STATEMENTS = {
+    "import pyalteon": (20.0, ["requests", "pyalteon.client", "pyalteon.vadc"]),
+    "from pyalteon import Real, Virt, Group": (60.0, ["requests", "sqlite3", "orjson"]),
+    "from pyalteon import Client": (250.0, ["sqlite3", "pyalteon.vadc"]),
+}
+
+
+def measure(statement):
+    """Run a statement in a fresh interpreter and return the seconds it took and the modules it imported."""
+    code = (
+        "import time\nstart = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\nimport json, sys\nprint(json.dumps([elapsed, sorted(sys.modules)]))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    return json.loads(result.stdout)
+
+
+def main(argv=None):
+    """Parse the command line, measure the statements and check them against their budgets."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs of each statement; the fastest is kept")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply the budgets, e.g. on slow machines")
+    parser.add_argument("--output", help="Write the results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    results = []
+    failed = False
+    for statement, (budget, forbidden) in STATEMENTS.items():
+        runs = [measure(statement) for _ in range(args.repeat)]
+        best = min(run[0] for run in runs)
+        imported = sorted(set(runs[0][1]).intersection(forbidden))
+        ok = best * 1000 <= budget * args.scale and not imported
+        failed = failed or not ok
+
+        results.append({
+            "statement": statement, "import_time": best, "budget": budget * args.scale / 1000,
+            "unexpected_imports": imported, "ok": ok,
+        })
+        print(f"{statement}: {best * 1000:.1f}ms (budget {budget * args.scale:.0f}ms){'' if ok else ' FAILED'}",
+              file=sys.stderr)
+
+    output = json.dumps({"python": sys.version.split()[0], "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(output + "\n")
+    else:
+        print(output)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""Serve synthetic Radware Alteon REST API tables from a local HTTP server.
+
+The server answers GET requests for /config/<Table> with generated SlbNewCfgEnh*, SlbOper*, SlbStat* and VADC*
+tables of a configurable size, optionally after a fixed latency.  It can also answer the first requests for each table
+with a 503, to exercise retries.  PUT, POST and DELETE requests (including the ?action=apply and ?action=save calls) are
+answered with {"status": "ok"}, and counters of the requests can be read from /_stats.
+"""
+
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import hashlib
+import json
+import multiprocessing
+import sys
+import threading
+import time
+from urllib.parse import urlparse
+
+from pyalteon.vadc.virt import Virt
+
+
+def build_tables(rows):
+    """Generate the tables of a device with the given number of real servers and virtual services.
+
+    :param int rows: The number of real servers, group links and virtual services to generate
+    :return dict: The tables, as {table name: list of rows}
+    """
+    groups = max(rows // 10, 1)
+    virts = max(rows // 2, 1)
+    tables = {}
+
+    tables["SlbNewCfgEnhRealServerTable"] = [
+        {"Index": str(i), "IpAddr": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}", "Weight": 1,
+         "MaxConns": 200000, "TimeOut": 10, "State": 2, "Name": f"real{i}"}
+        for i in range(1, rows + 1)
+    ]
+    tables["SlbNewCfgEnhRealServerSecondPartTable"] = [
+        {"Index": str(i), "Ipv6Addr": "", "PingInterval": 2, "FailRetry": 4, "SuccRetry": 2, "SrvType": 1}
+        for i in range(1, rows + 1)
+    ]
+    tables["SlbNewCfgEnhRealServerThirdPartTable"] = [
+        {"Index": str(i), "ExcludeStr": 2, "Submac": 2, "Idsvlan": 1, "Delete": 1}
+        for i in range(1, rows + 1)
+    ]
+
+    tables["SlbNewCfgEnhGroupTable"] = [
+        {"Index": str(g), "Metric": 1, "HealthCheckLayer": 1, "Name": f"group{g}", "BackupServer": ""}
+        for g in range(1, groups + 1)
+    ]
+    tables["SlbOperEnhGroupRealServerTable"] = [
+        {"RealServGroupIndex": str(i % groups + 1), "RealServRealServIndex": str(i), "State": 1, "Status": 2}
+        for i in range(1, rows + 1)
+    ]
+
+    tables["SlbNewCfgEnhVirtServerTable"] = [
+        {"Index": str(v), "VirtServerIpAddress": f"192.0.{v // 256 % 256}.{v % 256}", "VirtServerState": 2,
+         "VirtServerVname": f"virt{v}"}
+        for v in range(1, virts + 1)
+    ]
+    for part, endpoint in enumerate(Virt.PART_TABLES):
+        idx = Virt.index_name(part)
+        part_rows = []
+        for i in range(rows):
+            row = {"Serv" + idx: str(i % virts + 1), idx: i // virts + 1}
+            if part == 0:
+                row.update({"VirtPort": 80 + i // virts, "RealGroup": str(i % groups + 1), "RealPort": 8080})
+            else:
+                row.update({f"Part{part}Setting{col}": col for col in range(4)})
+            part_rows.append(row)
+        tables[endpoint] = part_rows
+
+    tables["SlbStatEnhRServerTable"] = [
+        {"Index": str(i), "CurrSessions": i % 50, "TotalSessions": i * 1000, "HighestSessions": i % 50 + 10,
+         "HCOctets": i * 1000000, "FailedChecks": i % 3}
+        for i in range(1, rows + 1)
+    ]
+    tables["SlbStatEnhGroupTable"] = [
+        {"Index": str(g), "CurrSessions": g % 50, "TotalSessions": g * 10000, "HCOctets": g * 10000000}
+        for g in range(1, groups + 1)
+    ]
+
+    vadcs = max(rows // 100, 1)
+    tables["VADCNewCfgTable"] = [{"Id": v, "State": 2, "CapacityUnits": 2} for v in range(1, vadcs + 1)]
+    tables["VADCNewCfgSysTable"] = [{"Id": v, "HostName": f"vadc{v}", "Ntp": 1} for v in range(1, vadcs + 1)]
+    tables["VADCNewCfgNetTable"] = [
+        {"Id": v, "MgmtAddr": f"172.16.0.{v % 256}", "MgmtMask": "255.255.255.0"} for v in range(1, vadcs + 1)
+    ]
+    tables["VADCUsersPswdTable"] = [{"Id": v, "UserName": "admin"} for v in range(1, vadcs + 1)]
+
+    return tables
+
+
+class MockAlteonHandler(BaseHTTPRequestHandler):
+    """Answer requests the way an Alteon device does."""
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Don't log every request to stderr."""
+
+    def __send(self, code, body, headers=None):
+        """Send a response and count it."""
+        server = self.server
+        with server.lock:
+            server.stats["requests"] += 1
+            server.stats["bytes"] += len(body)
+
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer a GET with a table, or with the server's counters."""
+        path = urlparse(self.path).path.rstrip("/")
+        if path == "/_stats":
+            body = json.dumps(self.server.stats).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        time.sleep(self.server.latency)
+
+        # /config/<Table>/<index> asks for one row, with the index columns (the first ones of the rows) joined by "/"
+        parts = path.split("/")
+        name = parts[2] if len(parts) > 2 else ""
+        index = parts[3:]
+        with self.server.lock:
+            failures = self.server.failures.get(name, 0)
+            self.server.failures[name] = failures + 1
+        if failures < self.server.fail_first:
+            self.__send(503, b'{"status": "err", "description": "Service%20Unavailable"}')
+            return
+
+        if name not in self.server.bodies:
+            body = json.dumps({"status": "err", "description": f"Table%20{name}%20not%20found"}).encode()
+            self.__send(404, body)
+            return
+
+        if index:
+            rows = [
+                row for row in self.server.tables[name] if [str(value) for value in row.values()][:len(index)] == index
+            ]
+            self.__send(200 if rows else 404, json.dumps({name: rows}).encode())
+            return
+
+        body, etag = self.server.bodies[name]
+        if self.headers.get("If-None-Match") == etag:
+            self.__send(304, b"", {"ETag": etag})
+            return
+
+        self.__send(200, body, {"ETag": etag})
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        """Accept a configuration change, unless its URL is in the server's rejected set."""
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        time.sleep(self.server.latency)
+
+        with self.server.lock:
+            self.server.writes.append((self.command, self.path, body))
+        if urlparse(self.path).path in self.server.rejected:
+            self.__send(400, b'{"status": "err", "description": "Invalid%20value"}')
+            return
+
+        self.__send(200, b'{"status": "ok"}')
+
+    do_POST = do_PUT
+    do_DELETE = do_PUT
+
+
+class MockAlteonServer(ThreadingHTTPServer):
+    """Serve synthetic Alteon tables on a local port."""
+
+    daemon_threads = True
+
+    def __init__(self, rows=100, latency=0.0, fail_first=0, address=("127.0.0.1", 0)):
+        """Initialize the class.
+
+        :param int rows: The number of rows to generate in the large tables (default: 100)
+        :param float latency: The number of seconds to wait before answering each request (default: 0.0)
+        :param int fail_first: The number of GET requests for each table to answer with a 503 (default: 0)
+        :param tuple address: The address to listen on; port 0 picks a free port (default: ("127.0.0.1", 0))
+        """
+        super().__init__(address, MockAlteonHandler)
+
+        self.latency = latency
+        self.fail_first = fail_first
+        self.failures = {}
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "bytes": 0}
+        # The configuration changes received, as (method, path, body), and the paths to refuse changes to
+        self.writes = []
+        self.rejected = set()
+
+        # Encode the tables once, so serving them costs as little as possible
+        self.tables = {}
+        self.bodies = {}
+        for name, data in build_tables(rows).items():
+            self.set_table(name, data)
+
+    def set_table(self, name, rows):
+        """Replace (or add) a table, e.g. to make a change for a client to find.
+
+        :param str name: The name of the table
+        :param list rows: The new rows of the table
+        """
+        body = json.dumps({name: rows}).encode()
+        self.tables[name] = rows
+        self.bodies[name] = (body, '"' + hashlib.sha1(body).hexdigest() + '"')
+
+    def remove_table(self, name):
+        """Remove a table, so that requests for it are answered with a 404.
+
+        :param str name: The name of the table
+        """
+        self.tables.pop(name, None)
+        self.bodies.pop(name, None)
+
+    def handle_error(self, request, client_address):
+        """Ignore clients that hung up before their answer was sent, e.g. after a timeout."""
+        if not isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            super().handle_error(request, client_address)
+
+    @property
+    def base_url(self):
+        """Return the base URL to give to a pyalteon.Client."""
+        return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+
+def _serve(rows, latency, fail_first, queue):
+    """Run a MockAlteonServer until the process is terminated, sending its base URL back through a queue."""
+    server = MockAlteonServer(rows=rows, latency=latency, fail_first=fail_first)
+    queue.put(server.base_url)
+    server.serve_forever()
+
+
+def start_in_thread(rows=100, latency=0.0, fail_first=0):
+    """Start a MockAlteonServer in a background thread of this process.
+
+    :return obj: The MockAlteonServer; call its shutdown() method when done
+    """
+    server = MockAlteonServer(rows=rows, latency=latency, fail_first=fail_first)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    return server
+
+
+def start_in_process(rows=100, latency=0.0, fail_first=0):
+    """Start a MockAlteonServer in a separate process, so it doesn't affect measurements of this one.
+
+    :return tuple: The multiprocessing.Process, which should be terminated when done, and the base URL to use
+    """
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(rows, latency, fail_first, queue), daemon=True)
+    process.start()
+
+    return process, queue.get(timeout=60)
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Benchmark the pyalteon endpoint classes against a local mock Alteon server.
+
+Run it from the top of the repository, e.g.:
+
+    python -m benchmarks.run --rows 10,1000,100000 --latency 0.005 --output results.json
+
+Each scenario is run against a fresh Client, and the results are written as JSON: one record per scenario and table
+size, with the wall time, the number of requests, the number of response bytes and the peak memory allocated by
+Python while the scenario ran.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from urllib.request import urlopen
+
+from pyalteon import Client
+from pyalteon import Group
+from pyalteon import Real
+from pyalteon import VADC
+from pyalteon import Virt
+
+from .mock_alteon import start_in_process
+
+SCENARIOS = {
+    "Real.combined": lambda client, workers: Real(client, max_workers=workers).combined,
+    "Virt.combined": lambda client, workers: Virt(client, max_workers=workers).combined,
+    "Group.all_combined": lambda client, workers: Group(client).all_combined,
+    "VADC.all": lambda client, workers: VADC(client).all,
+    "VADC.system": lambda client, workers: VADC(client).system,
+    "VADC.network": lambda client, workers: VADC(client).network,
+    "VADC.users": lambda client, workers: VADC(client).users,
+}
+
+
+def server_stats(base_url):
+    """Return the request and byte counters of the mock server."""
+    with urlopen(base_url + "/_stats") as response:
+        return json.loads(response.read())
+
+
+def run_scenario(name, base_url, workers=None):
+    """Run one scenario against a fresh Client and measure it.
+
+    :param str name: The name of the scenario, a key of SCENARIOS
+    :param str base_url: The base URL of the mock server
+    :param int workers: The max_workers to give to the classes that take it (default: None)
+    :return dict: The measurements
+    """
+    client = Client(base_url, "admin", "admin")
+    before = server_stats(base_url)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    SCENARIOS[name](client, workers)
+    wall_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    after = server_stats(base_url)
+
+    return {
+        "scenario": name,
+        "wall_time": wall_time,
+        "requests": after["requests"] - before["requests"],
+        "bytes": after["bytes"] - before["bytes"],
+        "peak_memory": peak,
+    }
+
+
+def main(argv=None):
+    """Parse the command line and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", default="10,100,1000,10000", help="Comma-separated table sizes")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of latency per request (default: 0)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs of each scenario; the fastest is kept (default: 3)")
+    parser.add_argument("--max-workers", type=int, default=None, help="max_workers for Real and Virt (default: None)")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Only run these scenarios")
+    parser.add_argument("--output", help="Write the results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    results = []
+    for rows in [int(size) for size in args.rows.split(",")]:
+        process, base_url = start_in_process(rows=rows, latency=args.latency)
+        try:
+            for name in args.scenario or list(SCENARIOS):
+                runs = [run_scenario(name, base_url, args.max_workers) for _ in range(args.repeat)]
+                best = min(runs, key=lambda run: run["wall_time"])
+                best.update({"rows": rows, "latency": args.latency, "max_workers": args.max_workers})
+                results.append(best)
+                print(f"{name} rows={rows}: {best['wall_time']:.4f}s", file=sys.stderr)
+        finally:
+            process.terminate()
+            process.join()
+
+    output = json.dumps({"python": sys.version.split()[0], "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
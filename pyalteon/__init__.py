@@ -1,10 +1,52 @@
 # -*- coding: utf-8 -*-
-"""Initialize the pyalteon module."""
+"""Initialize the pyalteon module.
 
-from .client import Client
-from .vadc.group import Group
-from .vadc.real import Real
-from .vx.vadc import VADC
-from .vadc.virt import Virt
+The classes are imported the first time they are used, so short-lived scripts only pay for the modules they need.
+"""
 
-__all__ = ["Client", "Group", "Real", "VADC", "Virt"]
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    # Let type checkers and linters see the names that __getattr__() imports
+    from ._helpers import set_traffic_log_options
+    from .client import Client
+    from .fleet import Fleet
+    from .vadc.group import Group
+    from .vadc.real import Real
+    from .vadc.stats import Stats
+    from .vadc.stats import StatsSampler
+    from .vx.vadc import VADC
+    from .vadc.virt import Virt
+
+# The public names of the package, and the modules they are defined in
+_LAZY = {
+    "Client": ".client",
+    "Fleet": ".fleet",
+    "Group": ".vadc.group",
+    "Real": ".vadc.real",
+    "Stats": ".vadc.stats",
+    "StatsSampler": ".vadc.stats",
+    "VADC": ".vx.vadc",
+    "Virt": ".vadc.virt",
+    "set_traffic_log_options": "._helpers",
+}
+
+__all__ = ["Client", "Fleet", "Group", "Real", "Stats", "StatsSampler", "VADC", "Virt", "set_traffic_log_options"]
+
+
+def __getattr__(name):
+    """Import a public name of the package the first time it is used."""
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    """List the public names of the package along with the names already loaded."""
+    return sorted(set(globals()) | set(__all__))
@@ -3,6 +3,7 @@
 # pylint: disable=unused-import
 # pylint: disable=no-name-in-module
 # pylint: disable=import-error
+# pylint: disable=import-outside-toplevel
 
 import sys
 
@@ -12,3 +13,24 @@ if sys.version_info[0] > 2:
 else:
     from urllib import unquote
     from urlparse import urlparse
+
+# The JSON decoder used by json_loads(), chosen on first use since importing orjson or ujson takes a while
+_JSON_LOADS = []
+
+
+def json_loads(data):
+    """Decode JSON with the fastest decoder available: orjson, ujson or the json module.
+
+    They all take bytes or str, and raise a subclass of ValueError on invalid JSON.
+    """
+    if not _JSON_LOADS:
+        try:
+            from orjson import loads
+        except ImportError:
+            try:
+                from ujson import loads
+            except ImportError:
+                from json import loads
+        _JSON_LOADS.append(loads)
+
+    return _JSON_LOADS[0](data)
@@ -1,21 +1,61 @@
 # -*- coding: utf-8 -*-
 """Define the pyalteon._endpoint.Endpoint base class."""
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+from ._helpers import HttpError
+from ._helpers import SingleFlight
+from ._helpers import decode_json
+from ._helpers import iter_json_rows
+from ._helpers import row_index
+from .bulk import BulkWriter
+from .cache import CacheEntry
+
 LOGGER = logging.getLogger(__name__)
 
+# The columns seen in each (base_url, endpoint) table, and the requested fields known to be missing from the tables
+# whose columns aren't known, used to skip tables that have none of the requested fields.  They are only learned by
+# this process, from the tables it retrieves or finds in a cache.
+COLUMNS = {}
+MISSING = {}
+
+# The table downloads in flight, shared by every Endpoint so that threads asking a client for the same table at the
+# same time wait for one download
+FETCHES = SingleFlight()
+
 
 class Endpoint(object):  # pylint: disable=too-few-public-methods
-    """Act as a superclass for all Radware Alteon REST API endpoints."""
+    """Act as a superclass for all Radware Alteon REST API endpoints.
+
+    Endpoint objects can be shared between threads.  Threads that read a property while its value is being built
+    wait for it rather than building it again, and threads that need the same table from the same client at the same
+    time share one download, even through different Endpoint objects.  The values returned are shared too, and must
+    not be modified.
+    """
 
-    def __init__(self, client):
+    # The configuration table that bulk() writes to by default
+    TABLE = None
+
+    # The index columns of the tables whose rows are not identified by their "Index" column alone, as
+    # {table: [columns]}
+    INDEX_KEYS = {}
+
+    def __init__(self, client, max_workers=None, fields=None):
         """Initialize the class.
 
         :param object client: An instantiated cert_manager.Client object
+        :param int max_workers: The maximum number of endpoints to fetch at the same time when a property needs to
+            merge several endpoints; None or 1 fetches them one after another (default: None)
+        :param list fields: Only retrieve these columns (plus the index columns) of each table; None retrieves all
+            of them (default: None)
         """
         self._client = client
-        self.__all = None
+        self._max_workers = max_workers
+        self._fields = list(fields) if fields is not None else None
+        self.__memo = {}
+        self.__derived = {}
+        self.__flights = SingleFlight()
 
     def _url(self, suffix):
         """Build the endpoint URL based on the API URL inside this object.
@@ -30,19 +70,388 @@ class Endpoint(object):  # pylint: disable=too-few-public-methods
         return url
 
     def _all(self, endpoint):
-        """Retrieve all data from a given endpoint, return it as a dictionary, and internal __all."""
-        # Return the cached copy if we've already fetched it
-        if self.__all:
-            return self.__all
+        """Retrieve all data from a given endpoint, return it as a dictionary, and cache it."""
+        return self._cached(endpoint, [endpoint])
+
+    def _cached(self, name, endpoints, build=None):
+        """Retrieve the data from some endpoints, build a value from it, and cache that value in this object.
+
+        Without a cache on the client, the value is kept for the life of this object.  With one, the endpoints are
+        looked up in the client's cache on every call, and the value is only rebuilt when one of them was fetched
+        again.
+
+        :param str name: The name under which to cache the value
+        :param list endpoints: The names of the endpoints to retrieve
+        :param callable build: A function that takes the list of endpoint data and returns the value to cache;
+            None returns the data of the first endpoint as-is
+        :return: The cached value
+        """
+        memo = self.__memo.get(name)
+        if memo is not None and self._client.cache is None:
+            return memo[2]
+
+        return self.__flights.do(("cached", name), lambda: self.__build_cached(name, endpoints, build))
+
+    def __build_cached(self, name, endpoints, build):
+        """Retrieve the data from some endpoints and build the value of _cached(), unless it is up to date."""
+        memo = self.__memo.get(name)
+        if memo is not None and self._client.cache is None:
+            return memo[2]
+
+        tables = self._get_endpoints(endpoints)
+        if memo is not None and all(old is new for old, new in zip(memo[1], tables)):
+            return memo[2]
+
+        value = tables[0] if build is None else build(tables)
+
+        # Only hold on to the tables if they are needed to tell when the value is out of date
+        self.__memo[name] = (endpoints, tables if self._client.cache is not None else [], value)
+
+        return value
+
+    def _derive(self, name, sources, build):
+        """Build a value from some source data, and cache it in this object until the source data changes.
+
+        :param str name: The name under which to cache the value
+        :param list sources: The data the value is built from; passing a different object for any of them rebuilds
+            the value
+        :param callable build: A function that takes the sources as arguments and returns the value
+        :return: The cached value
+        """
+        derived = self.__derived.get(name)
+        if derived is not None and all(old is new for old, new in zip(derived[0], sources)):
+            return derived[1]
+
+        def derive():
+            """Build the value, unless another thread just did."""
+            derived = self.__derived.get(name)
+            if derived is None or any(old is not new for old, new in zip(derived[0], sources)):
+                derived = (sources, build(*sources))
+                self.__derived[name] = derived
+
+            return derived[1]
+
+        return self.__flights.do(("derived", name, tuple(id(source) for source in sources)), derive)
+
+    def _is_cached(self, name, endpoints):
+        """Return True if the value _cached() holds under a name can be returned without downloading any table.
+
+        :param str name: The name under which the value is cached
+        :param list endpoints: The names of the endpoints the value is built from
+        :return bool: True if the value and the data it is built from are at hand
+        """
+        if name not in self.__memo:
+            return False
+
+        cache = self._client.cache
+        if cache is None:
+            return True
+
+        for endpoint in endpoints:
+            entry = cache.get(self._cache_key(endpoint, self._projection(endpoint)))
+            if entry is None or not cache.is_fresh(entry):
+                return False
 
-        self.__all = self._get_endpoint(endpoint)
+        return True
 
-        return self.__all
+    def _lookup(self, name, endpoint, index):
+        """Find one row of a table by its index.
 
-    def _get_endpoint(self, endpoint):
-        """Retrieve all data from a given endpoint and return it as a dictionary."""
+        If this object already holds the table (under name, as cached by _cached()), the row is found in an index
+        built once over it.  Otherwise only that row is retrieved, using its own URL.
+
+        :param str name: The name under which the table is cached
+        :param str endpoint: The name of the table
+        :param str index: The index of the row; multi-column indexes are joined with "/"
+        :return dict: The row, or None if there is no such row
+        """
+        if self._is_cached(name, [endpoint]):
+            keys = self.index_keys(endpoint)
+
+            def build(data):
+                """Index the rows of the table."""
+                return {row_index(row, keys): row for row in data}
+
+            return self._derive("index:" + name, [self._cached(name, [endpoint])], build).get(str(index))
+
+        return self._get_row(endpoint, index)
+
+    def _get_row(self, endpoint, index):
+        """Retrieve one row of a table, using its own URL, without using any cache.
+
+        :param str endpoint: The name of the table
+        :param str index: The index of the row; multi-column indexes are joined with "/"
+        :return dict: The row, or None if there is no such row
+        """
+        url = self._url(f"{endpoint}/{str(index).strip('/')}")
+
+        params = None
+        fields = self._projection(endpoint)
+        if fields is not None:
+            params = {"props": ",".join(fields)}
+
+        try:
+            rows = decode_json(self._client.get(url, params=params)).get(endpoint)
+        except HttpError as exc:
+            if exc.http_result.status_code == 404:
+                return None
+            raise
+
+        if not rows:
+            return None
+
+        return self.project(rows, fields)[0] if params is not None else rows[0]
+
+    def _get_rows(self, endpoints, index):
+        """Retrieve the row with the same index from several tables, in parallel if max_workers allows it.
+
+        :param list endpoints: The names of the tables
+        :param str index: The index of the rows; multi-column indexes are joined with "/"
+        :return list: The row from each table (None where it has no such row), in the same order as endpoints
+        """
+        return self._map(lambda endp: self._get_row(endp, index), endpoints)
+
+    def invalidate(self):
+        """Forget the data cached by this object, and drop its endpoints from the client's cache."""
+        cache = self._client.cache
+        if cache is not None:
+            for endpoints, _, _ in list(self.__memo.values()):
+                for endpoint in endpoints:
+                    cache.invalidate(device=self._client.base_url, endpoint=endpoint)
+
+        self.__memo = {}
+        self.__derived = {}
+
+    def bulk(self, endpoint=None, max_workers=4):
+        """Start a set of row changes that are sent together, followed by a single apply and save.
+
+        The data cached by this object is forgotten once the changes are sent.
+
+        :param str endpoint: The table to write to by default (default: the main table of this class)
+        :param int max_workers: The maximum number of requests to send at the same time (default: 4)
+        :return obj: A pyalteon.bulk.BulkWriter object
+        """
+        return BulkWriter(
+            self._client, endpoint=endpoint or self.TABLE, max_workers=max_workers, on_commit=self.invalidate
+        )
+
+    def index_keys(self, endpoint):
+        """Return the index columns of a table, which together identify each of its rows.
+
+        :param str endpoint: The name of the table
+        :return list: The names of the index columns
+        """
+        return list(self.INDEX_KEYS.get(endpoint, ["Index"]))
+
+    @staticmethod
+    def project(data, fields):
+        """Keep only some of the columns of each row.
+
+        :param list data: The rows of a table
+        :param list fields: The columns to keep
+        :return list: New rows with only the columns from fields that are present
+        """
+        return [{field: row[field] for field in fields if field in row} for row in data]
+
+    def _cache_key(self, endpoint, fields=None):
+        """Return the key of an endpoint in the client's cache.
+
+        :param str endpoint: The name of the endpoint
+        :param list fields: The columns retrieved; None for all of them (default: None)
+        :return tuple: (base_url, endpoint), or (base_url, endpoint, fields) for a partial table
+        """
+        if fields is None:
+            return (self._client.base_url, endpoint)
+
+        return (self._client.base_url, endpoint, tuple(fields))
+
+    def _get_endpoint(self, endpoint, fields=None):
+        """Retrieve all data from a given endpoint and return it as a dictionary.
+
+        If the client has a cache, a fresh copy is returned from it without contacting the device.  A stale copy is
+        revalidated with a conditional GET if the device sent an ETag or Last-Modified header with it.
+
+        If fields is set, only those columns are requested from the device (using the "props" query parameter) and
+        any other columns it sends anyway are removed.  Those partial tables are cached separately from the whole
+        table, under the fields requested; a fresh copy of the whole table is projected instead of downloaded.
+
+        :param str endpoint: The name of the endpoint to retrieve
+        :param list fields: The columns to retrieve; None retrieves all of them (default: None)
+        :return list: The rows of the endpoint
+        """
+        cache = self._client.cache
+        if cache is not None:
+            entry = cache.get(self._cache_key(endpoint, fields))
+            if entry is not None and cache.is_fresh(entry):
+                self.__learn_columns(endpoint, entry.data, fields, refresh=False)
+                return entry.data
+
+        key = (self._client, endpoint, tuple(fields) if fields is not None else None)
+
+        return FETCHES.do(key, lambda: self.__fetch_endpoint(endpoint, fields))
+
+    def __fetch_endpoint(self, endpoint, fields):
+        """Retrieve the data from an endpoint for _get_endpoint(), revalidating or updating the client's cache."""
         url = self._url(endpoint)
-        data = self._client.get(url).json()
+        cache = self._client.cache
+        key = self._cache_key(endpoint, fields)
+        params = {"props": ",".join(fields)} if fields is not None else None
+
+        if cache is None:
+            data = decode_json(self._client.get(url, params=params))
+
+            # JSON returned has a top-level key that is the name of the endpoint, so return the list under that.
+            data = data[endpoint]
+            if fields is not None:
+                data = self.project(data, fields)
+            self.__learn_columns(endpoint, data, fields)
+
+            return data
+
+        entry = cache.get(key)
+        if entry is not None and cache.is_fresh(entry):
+            self.__learn_columns(endpoint, entry.data, fields, refresh=False)
+            return entry.data
+
+        if fields is not None:
+            whole = cache.get(self._cache_key(endpoint))
+            if whole is not None and cache.is_fresh(whole):
+                self.__learn_columns(endpoint, whole.data, refresh=False)
+                data = self.project(whole.data, fields)
+                cache.set(key, CacheEntry(data, stored_at=whole.stored_at))
+                return data
+
+        result = self._client.get(url, params=params, headers=entry.validators if entry is not None else None)
+        if entry is not None and result.status_code == 304:
+            LOGGER.debug("Endpoint %s not modified", endpoint)
+            entry.touch()
+            cache.set(key, entry)
+            self.__learn_columns(endpoint, entry.data, fields, refresh=False)
+            return entry.data
+
+        data = decode_json(result)[endpoint]
+        if fields is not None:
+            data = self.project(data, fields)
+        self.__learn_columns(endpoint, data, fields)
+
+        etag = result.headers.get("ETag")
+        last_modified = result.headers.get("Last-Modified")
+        cache.set(key, CacheEntry(data, etag=etag, last_modified=last_modified))
+
+        return data
+
+    def __learn_columns(self, endpoint, data, fields=None, refresh=True):
+        """Record the columns of a table, or the requested fields it is missing, for _get_projected().
+
+        :param str endpoint: The name of the table
+        :param list data: The rows of the table, or of the columns retrieved from it
+        :param list fields: The columns retrieved; None for all of them (default: None)
+        :param bool refresh: Look at the rows even if something is already known about the table, e.g. because they
+            were just downloaded rather than found in a cache (default: True)
+        """
+        key = (self._client.base_url, endpoint)
+        if not data:
+            return
+
+        if fields is None:
+            if refresh or key not in COLUMNS:
+                COLUMNS[key] = set().union(*data)
+                MISSING.pop(key, None)
+        elif key not in COLUMNS and (refresh or key not in MISSING):
+            # The fields requested that none of the rows have
+            missing = set(fields).difference(set().union(*data))
+            MISSING[key] = MISSING.get(key, frozenset()).union(missing)
+
+    def _iter_endpoint(self, endpoint, params=None, chunk_size=65536):
+        """Retrieve the data from a given endpoint, yielding each row as soon as it is parsed.
+
+        The response is read in chunks and parsed incrementally, so only one row at a time is held in memory.
+
+        :param str endpoint: The name of the endpoint to retrieve
+        :param dict params: Any query string parameters to send, e.g. a filter the device supports
+        :param int chunk_size: The number of bytes to read from the response at a time (default: 65536)
+        :return generator: The rows of the endpoint
+        """
+        url = self._url(endpoint)
+        result = self._client.get(url, params=params, stream=True)
+        try:
+            document = yield from iter_json_rows(result.iter_content(chunk_size=chunk_size), endpoint)
+        finally:
+            result.close()
+
+        if document is not None:
+            # Test for a 200-level error Alteon can throw
+            if document.get("status") == "err":
+                raise HttpError(result, data=document)
+
+            # The top-level key that is the name of the endpoint wasn't in the JSON returned
+            raise KeyError(endpoint)
+
+    def iter_table(self, endpoint, params=None):
+        """Retrieve any table of the device, yielding each row as soon as it is parsed.
+
+        This keeps memory use constant for very large tables, at the cost of not caching the data.
+
+        :param str endpoint: The name of the table, e.g. "SlbOperEnhGroupRealServerTable"
+        :param dict params: Any query string parameters to send, e.g. a filter the device supports
+        :return generator: The rows of the table
+        """
+        return self._iter_endpoint(endpoint, params=params)
+
+    def _get_endpoints(self, endpoints):
+        """Retrieve all data from several endpoints, in parallel if max_workers allows it.
+
+        The requests share the client's requests.Session, so its connection pool is reused by the worker threads.
+
+        :param list endpoints: The names of the endpoints to retrieve
+        :return list: The data from each endpoint, in the same order as the endpoints parameter
+        """
+        return self._map(self._get_projected, endpoints)
+
+    def _map(self, func, items):
+        """Call a function on each item, from up to max_workers threads at a time.
+
+        :param callable func: The function to call, e.g. one that retrieves an endpoint
+        :param list items: The arguments to call it with, one call per item
+        :return list: The value returned for each item, in the same order as items
+        """
+        workers = min(self._max_workers or 1, len(items))
+        if workers <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
+
+    def _projection(self, endpoint):
+        """Return the columns retrieved from an endpoint for this object: its index columns and the fields requested.
+
+        :param str endpoint: The name of the endpoint
+        :return list: The names of the columns, or None to retrieve all of them
+        """
+        if self._fields is None:
+            return None
+
+        index_keys = self.index_keys(endpoint)
+
+        return index_keys + [field for field in self._fields if field not in index_keys]
+
+    def _get_projected(self, endpoint):
+        """Retrieve the fields requested for this object from an endpoint.
+
+        If the endpoint is known to have none of the requested fields (other than its index columns), no request is
+        made and an empty list is returned.  That is only known once this process has seen the whole table (fetched,
+        or found in the client's cache), or has retrieved the same fields from it before: until then, every table is
+        requested.
+        """
+        if self._fields is None:
+            return self._get_endpoint(endpoint)
+
+        fields = self._projection(endpoint)
+        key = (self._client.base_url, endpoint)
+        wanted = set(fields).difference(self.index_keys(endpoint))
+        columns = COLUMNS.get(key)
+        if (columns is not None and not columns.intersection(wanted)) or (wanted and wanted <= MISSING.get(key, set())):
+            LOGGER.debug("Skipping endpoint %s, which has none of the fields %s", endpoint, self._fields)
+            return []
 
-        # JSON returned has a top-level key that is the name of the endpoint, so return the list under that.
-        return data[endpoint]
+        return self._get_endpoint(endpoint, fields=fields)
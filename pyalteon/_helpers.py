@@ -1,90 +1,307 @@
 # -*- coding: utf-8 -*-
 """Define helper functions used by classes in this module."""
 
+import codecs
+from concurrent.futures import Future
 from functools import wraps
+import json
 import logging
+import random
+import re
+import threading
 
+from ._compat import json_loads
 from ._compat import unquote
 
 
+# The options used by traffic_log, changed with set_traffic_log_options()
+TRAFFIC_LOG_OPTIONS = {
+    # The maximum number of bytes of each response body to log; None logs the whole body
+    "max_body": 4096,
+    # The fraction of requests to log, between 0.0 and 1.0
+    "sample_rate": 1.0,
+}
+
+
+def set_traffic_log_options(max_body=4096, sample_rate=1.0):
+    """Set how much traffic the traffic_log decorator logs when the "DEBUG" level is enabled.
+
+    :param int max_body: The maximum number of bytes of each response body to log; None logs the whole body
+        (default: 4096)
+    :param float sample_rate: The fraction of requests to log, between 0.0 and 1.0 (default: 1.0)
+    """
+    TRAFFIC_LOG_OPTIONS["max_body"] = max_body
+    TRAFFIC_LOG_OPTIONS["sample_rate"] = sample_rate
+
+
+class _Body(object):  # pylint: disable=too-few-public-methods
+    """Format the body of a response for logging, only when the log message is actually rendered."""
+
+    __slots__ = ("result", )
+
+    def __init__(self, result):
+        """Initialize the class."""
+        self.result = result
+
+    def __str__(self):
+        """Decode the body, truncated to the max_body option."""
+        content = self.result.content or b""
+        max_body = TRAFFIC_LOG_OPTIONS["max_body"]
+        if max_body is None or len(content) <= max_body:
+            return content.decode("utf-8", errors="replace")
+
+        return content[:max_body].decode("utf-8", errors="replace") + f"... ({len(content)} bytes)"
+
+
 def traffic_log(traffic_logger=None, method="GET"):
     """Log traffic for the wrapped function.
 
     This will wrap any function with a call to `logger.debug()` displaying useful before and after information from
-    API calls.  This obeys the log level set in logging, so if the level is not set to "DEBUG", no messages will be
-    logged.
+    API calls.  This obeys the log level set in logging, so if the level is not set to "DEBUG", the wrapped function
+    is called directly and nothing is inspected or formatted.  Response bodies are truncated and requests can be
+    sampled, see set_traffic_log_options().
 
     Note: The "DEBUG" level should *never* be used in production.
 
     :param obj traffic_logger: a logging.Logger to use for logging messages.
     :param str method: The HTTP method being used, to be noted in the logging. (Default: "GET")
     """
-    # pylint: disable=too-many-branches
+    # Make sure traffic_logger was set correctly
+    if not isinstance(traffic_logger, logging.Logger):
+        raise Exception("traffic_log: No logging.Logger instance provided")
+
     def decorator(func):
         """Wrap the actual decorator so a reference to the function can be returned."""
         @wraps(func)
-        # pylint: disable=too-many-branches
         def log_traffic(*args, **kwargs):
             """Decorate the wrapped function."""
-            # Make sure traffic_logger was set correctly
-            if not isinstance(traffic_logger, logging.Logger):
-                raise Exception("traffic_log: No logging.Logger instance provided")
+            if not traffic_logger.isEnabledFor(logging.DEBUG):
+                return func(*args, **kwargs)
+
+            sample_rate = TRAFFIC_LOG_OPTIONS["sample_rate"]
+            if sample_rate < 1.0 and random.random() >= sample_rate:
+                return func(*args, **kwargs)
 
             # Check if the URL or headers exist in the parameters
             # Note: *self* will be the first argument, so actual arguments start after that.
-            url = kwargs.get("url", "")
-            if not url:
-                if len(args) > 1:
-                    url = args[1]
-            headers = kwargs.get("headers", "")
-            if not headers:
-                if len(args) > 2:
-                    headers = args[2]
-            data = kwargs.get("data", "")
-            if not data:
-                if len(args) > 3:
-                    data = args[3]
+            url = kwargs.get("url") or (args[1] if len(args) > 1 else "")
+            headers = kwargs.get("headers") or (args[2] if len(args) > 2 else "")
+            data = kwargs.get("data") or (args[3] if len(args) > 3 else "")
 
             # Print out before messages with URL and header data
             if url:
-                traffic_logger.debug(f"Performing a {method} on url: {url}")
+                traffic_logger.debug("Performing a %s on url: %s", method, url)
             if headers:
-                traffic_logger.debug(f"Extra request headers: {headers}")
+                traffic_logger.debug("Extra request headers: %s", headers)
             if data:
-                traffic_logger.debug(f"Data: {data}")
+                traffic_logger.debug("Data: %s", data)
 
             # Run the wrapped function
             try:
                 result = func(*args, **kwargs)
             except HttpError as herr:
                 # If it's of type HttpError, we can still usually get the result data
-                traffic_logger.debug(f"Result code: {herr.http_result.status_code}")
-                traffic_logger.debug(f"Result headers: {herr.http_result.headers}")
-                traffic_logger.debug(f"Text result: {herr.http_result.text}")
+                traffic_logger.debug("Result code: %s", herr.http_result.status_code)
+                traffic_logger.debug("Result headers: %s", herr.http_result.headers)
+                traffic_logger.debug("Text result: %s", _Body(herr.http_result))
 
                 # Re-raise the original exception
                 raise herr
-            except Exception as exc:
-                # Re-raise the original exception
-                raise exc
 
             # If everything went fine, more logging
             if result:
-                traffic_logger.debug(f"Result code: {result.status_code}")
-                traffic_logger.debug(f"Result headers: {result.headers}")
-                traffic_logger.debug(f"Text result: {result.text}")
+                traffic_logger.debug("Result code: %s", result.status_code)
+                traffic_logger.debug("Result headers: %s", result.headers)
+                # Reading the body of a streamed response would consume it before the caller could
+                if not kwargs.get("stream"):
+                    traffic_logger.debug("Text result: %s", _Body(result))
             return result
         return log_traffic
     return decorator
 
 
+def decode_json(result):
+    """Decode the JSON body of a response, only once however many times it is called.
+
+    The decoded body is kept on the response, so the client's error test, the endpoint classes and HttpError all
+    share one decode.  orjson or ujson are used instead of the json module when installed.
+
+    :param obj result: A requests.Response object
+    :return: The decoded body
+    """
+    data = getattr(result, "_pyalteon_json", None)
+    if data is None:
+        data = json_loads(result.content)
+        result._pyalteon_json = data  # pylint: disable=protected-access
+
+    return data
+
+
+def row_index(row, keys):
+    """Return the index of a row, joining multi-column indexes with "/" like the Alteon REST API URLs do.
+
+    :param dict row: A row of a table
+    :param list keys: The index columns of the table
+    :return str: The index of the row
+    """
+    return "/".join(str(row[key]) for key in keys)
+
+
+def iter_json_rows(chunks, key):
+    """Parse a JSON document incrementally, yielding the objects in the list under one of its top-level keys.
+
+    Only one row at a time is kept in memory, plus the chunk being parsed.  If the key is not in the document, no
+    rows are yielded and the parsed document is returned instead (as the value of the StopIteration), so the caller
+    can look for an error in it.
+
+    :param iter chunks: The document, as an iterable of bytes
+    :param str key: The top-level key holding the list of rows
+    :return generator: The rows in the list
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    start = re.compile(f'"{re.escape(key)}"' + r"\s*:\s*\[")
+    chunks = iter(chunks)
+
+    buf = ""
+    pos = None
+    for chunk in chunks:
+        buf += utf8.decode(chunk)
+        match = start.search(buf)
+        if match:
+            pos = match.end()
+            break
+    else:
+        # The key was never found, so hand the (presumably small) document back to the caller
+        buf += utf8.decode(b"", final=True)
+        return json.loads(buf) if buf.strip() else {}
+
+    while True:
+        # Skip to the start of the next row, or the end of the list
+        while pos < len(buf) and buf[pos] in " \t\r\n,":
+            pos += 1
+
+        if pos < len(buf) and buf[pos] == "]":
+            return None
+
+        try:
+            if pos >= len(buf):
+                raise ValueError("Incomplete row")
+            row, pos = decoder.raw_decode(buf, pos)
+        except ValueError:
+            # The row isn't complete yet, so read more of the document after dropping what was already parsed
+            chunk = next(chunks, None)
+            if chunk is None:
+                raise
+            buf = buf[pos:] + utf8.decode(chunk)
+            pos = 0
+            continue
+
+        yield row
+
+
+class SingleFlight(object):  # pylint: disable=too-few-public-methods
+    """Run a function at most once at a time per key; callers asking for a key already in flight share its result.
+
+    This keeps threads that need the same data at the same time from each downloading or building it.
+    """
+
+    def __init__(self):
+        """Initialize the class."""
+        self.__lock = threading.Lock()
+        self.__calls = {}
+
+    def do(self, key, func):
+        """Call func, unless a call for the same key is running, in which case wait for it and return its result.
+
+        A function must not ask for its own key, or it would wait for itself forever.
+
+        :param key: Any hashable value identifying the work
+        :param callable func: A function that takes no arguments
+        :return: The value returned by func, either from this call or the one in flight; the exception it raised is
+            raised in every caller sharing the call
+        """
+        with self.__lock:
+            call = self.__calls.get(key)
+            leader = call is None
+            if leader:
+                call = Future()
+                self.__calls[key] = call
+
+        if not leader:
+            return call.result()
+
+        try:
+            call.set_result(func())
+        except BaseException as exc:
+            call.set_exception(exc)
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+
+        return call.result()
+
+
+class BackgroundThread(object):
+    """Run a function from a daemon thread until stop() is called, as the polling loops of the package do.
+
+    The function is called once, with no arguments; it should loop until stopping is True, sleeping with wait() so
+    that stop() interrupts it.
+    """
+
+    def __init__(self, target, name):
+        """Initialize the class.
+
+        :param callable target: The function to run
+        :param str name: The name of the thread
+        """
+        self.__target = target
+        self.__name = name
+        self.__stop = threading.Event()
+        self.__thread = None
+
+    @property
+    def stopping(self):
+        """Return True once stop() was called."""
+        return self.__stop.is_set()
+
+    def wait(self, seconds):
+        """Sleep for a number of seconds, returning early (and True) if stop() is called.
+
+        :param float seconds: The number of seconds to sleep; a negative number doesn't sleep
+        :return bool: True if stop() was called
+        """
+        return self.__stop.wait(max(seconds, 0))
+
+    def start(self):
+        """Start the thread, unless it is already running."""
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+
+        self.__stop.clear()
+        self.__thread = threading.Thread(target=self.__target, name=self.__name, daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout=None):
+        """Ask the function to return, and wait for its thread to finish.
+
+        :param float timeout: The maximum number of seconds to wait (default: None)
+        """
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            self.__thread = None
+
+
 class HttpError(Exception):
     """Serve as a generic Exception indicating an HTTP error."""
 
-    def __init__(self, result):
-        """Initialize the exception class."""
-        data = None
+    def __init__(self, result, data=None):
+        """Initialize the exception class.
 
+        :param obj result: The requests.Response object of the failed request
+        :param dict data: The already decoded body of the response, if it can't be read from result again
+        """
         # Store the result in the exception object
         self.__result = result
 
@@ -92,10 +309,11 @@ class HttpError(Exception):
         msg = "Unknown HTTP error"
 
         # Make sure that not receiving JSON doesn't trigger a nested Exception
-        try:
-            data = result.json()
-        except Exception:  # pylint: disable=broad-except
-            data = {}
+        if data is None:
+            try:
+                data = decode_json(result)
+            except Exception:  # pylint: disable=broad-except
+                data = {}
 
         if "description" in data:
             msg = unquote(data["description"])
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""Initialize the pyalteon.aio module.
+
+This module mirrors the pyalteon interface on top of asyncio, so a single event loop can query many Alteon devices.
+It requires the optional aiohttp dependency (pip install pyalteon[aio]).
+"""
+
+from .client import AsyncClient
+from .vadc.group import AsyncGroup
+from .vadc.real import AsyncReal
+from .vx.vadc import AsyncVADC
+from .vadc.virt import AsyncVirt
+
+__all__ = ["AsyncClient", "AsyncGroup", "AsyncReal", "AsyncVADC", "AsyncVirt"]
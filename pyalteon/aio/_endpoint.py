@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Define the pyalteon.aio._endpoint.AsyncEndpoint base class."""
+
+import asyncio
+import logging
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncEndpoint(object):  # pylint: disable=too-few-public-methods
+    """Act as a superclass for all asynchronous Radware Alteon REST API endpoints."""
+
+    def __init__(self, client, max_workers=None):
+        """Initialize the class.
+
+        :param object client: An instantiated pyalteon.aio.AsyncClient object
+        :param int max_workers: The maximum number of endpoints to fetch at the same time when a property needs to
+            merge several endpoints; None fetches them all at once (default: None)
+        """
+        self._client = client
+        self._max_workers = max_workers
+        self.__all = None
+
+    def _url(self, suffix):
+        """Build the endpoint URL based on the API URL inside this object.
+
+        :param str suffix: The suffix of the URL you wish to create
+        :return str: The full URL
+        """
+        url = self._client.base_url
+        url += "/" + suffix.strip("/")
+        LOGGER.debug("URL created: %s", url)
+
+        return url
+
+    async def _all(self, endpoint):
+        """Retrieve all data from a given endpoint, return it as a dictionary, and internal __all."""
+        # Return the cached copy if we've already fetched it
+        if self.__all is not None:
+            return self.__all
+
+        self.__all = await self._get_endpoint(endpoint)
+
+        return self.__all
+
+    async def _get_endpoint(self, endpoint):
+        """Retrieve all data from a given endpoint and return it as a dictionary."""
+        url = self._url(endpoint)
+        result = await self._client.get(url)
+        data = result.json()
+
+        # JSON returned has a top-level key that is the name of the endpoint, so return the list under that.
+        return data[endpoint]
+
+    async def _get_endpoints(self, endpoints):
+        """Retrieve all data from several endpoints concurrently.
+
+        :param list endpoints: The names of the endpoints to retrieve
+        :return list: The data from each endpoint, in the same order as the endpoints parameter
+        """
+        if not self._max_workers:
+            return list(await asyncio.gather(*[self._get_endpoint(endp) for endp in endpoints]))
+
+        semaphore = asyncio.Semaphore(self._max_workers)
+
+        async def limited(endpoint):
+            """Fetch one endpoint once the semaphore allows it."""
+            async with semaphore:
+                return await self._get_endpoint(endpoint)
+
+        return list(await asyncio.gather(*[limited(endp) for endp in endpoints]))
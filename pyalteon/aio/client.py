@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""Define the pyalteon.aio.client.AsyncClient class."""
+# pylint: disable=import-error
+
+import base64
+import logging
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from .._compat import urlparse
+from .._helpers import HttpError
+from .._helpers import decode_json
+from ..client import USER_AGENT
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncResponse(object):
+    """Hold a fully read HTTP response, exposing the parts of a requests.Response that pyalteon uses."""
+
+    def __init__(self, status_code, headers, content, url):
+        """Initialize the class.
+
+        :param int status_code: The HTTP status code of the response
+        :param dict headers: The response headers
+        :param bytes content: The body of the response
+        :param str url: The URL that was requested
+        """
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+    @property
+    def text(self):
+        """Return the body of the response decoded as a string."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        """Return the body of the response decoded from JSON, decoding it only once."""
+        return decode_json(self)
+
+
+class AsyncClient(object):
+    """Make asynchronous HTTP calls to the Radware Alteon REST API."""
+
+    def __init__(self, base_url, username, password, verify_ssl=True, connector=None):
+        """Initialize the class.
+
+        The underlying aiohttp.ClientSession is created on the first request, so the client can be built outside of a
+        running event loop.  Call close() (or use the client as an async context manager) when done with it.
+
+        :param string base_url: The base URL of the Alteon device (protocol, hostname, and port only)
+        :param string username: The username with which to login
+        :param string password: The password with which to login
+        :param bool verify_ssl: Verify the certificate on the Alteon device (default: True)
+        :param obj connector: An aiohttp.BaseConnector to use, e.g. to share a connection pool between clients
+        """
+        if aiohttp is None:
+            raise ImportError("pyalteon.aio requires the aiohttp package: pip install pyalteon[aio]")
+
+        self.__username = username
+        self.__password = password
+        self.__verify_ssl = verify_ssl
+        self.__connector = connector
+        self.__session = None
+
+        # Set the default HTTP headers
+        self.__headers = {
+            "Accept": "application/json",
+            "User-Agent": self.user_agent,
+        }
+
+        # Setup the authentication, as the Authorization header sent by the session
+        credentials = f"{self.__username}:{self.__password}".encode("latin1")
+        self.__authstring = "Basic " + base64.b64encode(credentials).decode("ascii")
+
+        # Manually build the base URL to find any errors
+        url = urlparse(base_url)
+        self.__base_url = url.scheme
+        self.__base_url += "://" + url.netloc
+        self.__base_url += "/config"
+
+        if url.scheme != "https":
+            # If not using https, force SSL verification to False
+            self.__verify_ssl = False
+
+    async def __aenter__(self):
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Close the session when leaving the async context manager."""
+        await self.close()
+
+    @staticmethod
+    def __test_200_error(result):
+        """Test for a 200-level error that the Alteon can return sometimes."""
+        data = result.json()
+        if ("status" in data) and (data["status"] == "err"):
+            raise HttpError(result)
+
+    @property
+    def base_url(self):
+        """Return the internal __base_url value."""
+        return self.__base_url
+
+    @property
+    def user_agent(self):
+        """Return a user-agent string including the module version and Python version."""
+        return USER_AGENT
+
+    @property
+    def headers(self):
+        """Return the internal __headers value."""
+        return self.__headers
+
+    @property
+    def session(self):
+        """Return the internal __session aiohttp.ClientSession object, creating it if needed."""
+        if self.__session is None or self.__session.closed:
+            self.__session = aiohttp.ClientSession(
+                headers={"Authorization": self.__authstring},
+                connector=self.__connector,
+                connector_owner=self.__connector is None,
+            )
+
+        return self.__session
+
+    async def close(self):
+        """Close the internal aiohttp.ClientSession."""
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    def add_headers(self, headers=None):
+        """Add the provided headers to the internally stored headers.
+
+        Note: This function will overwrite an existing header if the key in the headers parameter matches one of the
+        keys in the internal dictionary of headers.
+
+        :param dict headers: A dictionary where key is the header with its value being the setting for that header.
+        """
+        if headers:
+            head = self.__headers.copy()
+            head.update(headers)
+            self.__headers = head
+
+    def remove_headers(self, headers=None):
+        """Remove the requested header keys from the internally stored headers.
+
+        Note: If any of the headers in provided the list do not exist, the header will be ignored and will not raise
+        an exception.
+
+        :param list headers: A list of header keys to delete
+        """
+        if headers:
+            for head in headers:
+                if head in self.__headers:
+                    del self.__headers[head]
+
+    async def __request(self, method, url, headers=None, **kwargs):
+        """Submit a request and read the whole response.
+
+        :param str method: The HTTP method to use
+        :param str url: A URL to query
+        :param dict headers: A dictionary with any extra headers to add to the request
+        :return obj: An AsyncResponse object holding the response
+        """
+        LOGGER.debug("Performing a %s on url: %s", method, url)
+
+        head = self.__headers.copy()
+        if headers:
+            head.update(headers)
+
+        # aiohttp uses its default SSL context unless ssl=False is passed
+        ssl = None if self.__verify_ssl else False
+
+        async with self.session.request(method, url, headers=head, ssl=ssl, **kwargs) as resp:
+            content = await resp.read()
+            result = AsyncResponse(resp.status, dict(resp.headers), content, str(resp.url))
+
+        LOGGER.debug("Result code: %s", result.status_code)
+
+        # Raise an exception if the return code is in an error range
+        if result.status_code > 299:
+            raise HttpError(result)
+
+        # Test for a 200-level error Alteon can throw
+        self.__test_200_error(result)
+
+        return result
+
+    async def get(self, url, headers=None):
+        """Submit a GET request to the provided URL.
+
+        :param str url: A URL to query
+        :param dict headers: A dictionary with any extra headers to add to the request
+        :return obj: An AsyncResponse object received as a response
+        """
+        return await self.__request("GET", url, headers=headers)
+
+    async def post(self, url, headers=None, data=None):
+        """Submit a POST request to the provided URL and data.
+
+        :param str url: A URL to query
+        :param dict headers: A dictionary with any extra headers to add to the request
+        :param dict data: A dictionary with the data to use for the body of the POST
+        :return obj: An AsyncResponse object received as a response
+        """
+        return await self.__request("POST", url, headers=headers, json=data)
+
+    async def put(self, url, headers=None, data=None):
+        """Submit a PUT request to the provided URL and data.
+
+        :param str url: A URL to query
+        :param dict headers: A dictionary with any extra headers to add to the request
+        :param dict data: A dictionary with the data to use for the body of the PUT
+        :return obj: An AsyncResponse object received as a response
+        """
+        return await self.__request("PUT", url, headers=headers, data=data)
+
+    async def delete(self, url, headers=None):
+        """Submit a DELETE request to the provided URL.
+
+        :param str url: A URL to query
+        :param dict headers: A dictionary with any extra headers to add to the request
+        :return obj: An AsyncResponse object received as a response
+        """
+        return await self.__request("DELETE", url, headers=headers)
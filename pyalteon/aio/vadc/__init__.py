@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Initialize the pyalteon.aio.vadc module."""
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""Define the pyalteon.aio.vadc.group.AsyncGroup class."""
+
+import logging
+
+from pyalteon.aio._endpoint import AsyncEndpoint
+from pyalteon.vadc.group import Group
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncGroup(AsyncEndpoint):
+    """Asynchronously query the Radware Alteon REST API for group configurations.
+
+    The properties of this class return awaitables, e.g. ``groups = await AsyncGroup(client).all_combined``.
+    """
+
+    def __init__(self, client):
+        """Initialize the class.
+
+        :param object client: An instantiated pyalteon.aio.AsyncClient object
+        """
+        super().__init__(client=client)
+
+        self._reals = None
+
+    @property
+    async def all(self):
+        """Retrieve the groups list."""
+        endpoint = "SlbNewCfgEnhGroupTable"
+        return await self._all(endpoint)
+
+    @property
+    async def servers(self):
+        """Retrieve the real servers that are in the SLB groups."""
+        # Return the cached copy if we've already fetched it
+        if self._reals is not None:
+            return self._reals
+
+        endpoint = "SlbOperEnhGroupRealServerTable"
+        self._reals = await self._get_endpoint(endpoint)
+
+        return self._reals
+
+    @property
+    async def all_combined(self):
+        """Combine the groups list and the real server linking data into one dictionary."""
+        return Group.combine(await self.all, await self.servers)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""Define the pyalteon.aio.vadc.real.AsyncReal class."""
+
+import logging
+
+from pyalteon.aio._endpoint import AsyncEndpoint
+from pyalteon.vadc.real import Real
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncReal(AsyncEndpoint):
+    """Asynchronously query the Radware Alteon REST API for real server configuration.
+
+    The properties of this class return awaitables, e.g. ``reals = await AsyncReal(client).combined``.
+    """
+
+    def __init__(self, client, max_workers=None):
+        """Initialize the class.
+
+        :param object client: An instantiated pyalteon.aio.AsyncClient object
+        :param int max_workers: The maximum number of part tables to fetch at the same time (default: None)
+        """
+        super().__init__(client=client, max_workers=max_workers)
+
+        self._combined = None
+
+    @property
+    async def all(self):
+        """Retrieve the real servers list."""
+        endpoint = "SlbNewCfgEnhRealServerTable"
+        return await self._all(endpoint)
+
+    @property
+    async def combined(self):
+        """Retrieve the real servers configuration from multiple endpoints and merge into one dictionary."""
+        # Return the cached copy if we've already fetched it
+        if self._combined is not None:
+            return self._combined
+
+        self._combined = Real.merge(await self._get_endpoints(Real.PART_TABLES))
+
+        return self._combined
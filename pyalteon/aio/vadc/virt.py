@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Define the pyalteon.aio.vadc.virt.AsyncVirt class."""
+
+import logging
+
+from pyalteon.aio._endpoint import AsyncEndpoint
+from pyalteon.vadc.virt import Virt
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncVirt(AsyncEndpoint):
+    """Asynchronously query the Radware Alteon REST API for virtual service configuration.
+
+    The properties of this class return awaitables, e.g. ``services = await AsyncVirt(client).combined``.
+    """
+
+    def __init__(self, client, max_workers=None):
+        """Initialize the class.
+
+        :param object client: An instantiated pyalteon.aio.AsyncClient object
+        :param int max_workers: The maximum number of part tables to fetch at the same time (default: None)
+        """
+        super().__init__(client=client, max_workers=max_workers)
+
+        self._combined = None
+
+    @property
+    async def all(self):
+        """Retrieve the virtual servers list."""
+        endpoint = "SlbNewCfgEnhVirtServerTable"
+        return await self._all(endpoint)
+
+    @property
+    async def combined(self):
+        """Retrieve the virtual services configuration from multiple endpoints and merge into one dictionary."""
+        if self._combined is not None:
+            return self._combined
+
+        self._combined = Virt.merge(await self._get_endpoints(Virt.PART_TABLES))
+
+        return self._combined
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Define the pyalteon.aio.vx.vadc.AsyncVADC class."""
+
+import logging
+
+from pyalteon.aio._endpoint import AsyncEndpoint
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncVADC(AsyncEndpoint):
+    """Asynchronously query the Radware Alteon REST API of a hardware appliance for vADC configurations.
+
+    The properties of this class return awaitables, e.g. ``system = await AsyncVADC(client).system``.
+    """
+
+    def __init__(self, client):
+        """Initialize the class.
+
+        :param object client: An instantiated pyalteon.aio.AsyncClient object
+        """
+        super().__init__(client=client)
+
+        self._network = None
+        self._system = None
+        self._users = None
+
+    @property
+    async def all(self):
+        """Retrieve the list of all vADCs on the VX device."""
+        endpoint = "VADCNewCfgTable"
+        return await self._all(endpoint)
+
+    @property
+    async def system(self):
+        """Retrieve the system configurations for all vADCs."""
+        # Return the cached copy if we've already fetched it
+        if self._system is not None:
+            return self._system
+
+        endpoint = "VADCNewCfgSysTable"
+        self._system = await self._get_endpoint(endpoint)
+
+        return self._system
+
+    @property
+    async def network(self):
+        """Retrieve the network configurations for all vADCs."""
+        # Return the cached copy if we've already fetched it
+        if self._network is not None:
+            return self._network
+
+        endpoint = "VADCNewCfgNetTable"
+        self._network = await self._get_endpoint(endpoint)
+
+        return self._network
+
+    @property
+    async def users(self):
+        """Retrieve the user accounts and passwords for all vADCs."""
+        # Return the cached copy if we've already fetched it
+        if self._users is not None:
+            return self._users
+
+        endpoint = "VADCUsersPswdTable"
+        self._users = await self._get_endpoint(endpoint)
+
+        return self._users
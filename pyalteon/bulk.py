@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""Define the pyalteon.bulk.BulkWriter class."""
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+
+LOGGER = logging.getLogger(__name__)
+
+
+class BulkResult(object):
+    """Hold the outcome of a BulkWriter.commit()."""
+
+    def __init__(self):
+        """Initialize the class."""
+        self.succeeded = []
+        self.errors = {}
+        self.applied = False
+        self.saved = False
+
+    def __repr__(self):
+        """Return a short description of the result."""
+        return f"<BulkResult succeeded={len(self.succeeded)} errors={len(self.errors)} applied={self.applied}>"
+
+    @property
+    def ok(self):
+        """Return True if every row was written."""
+        return not self.errors
+
+
+class BulkWriter(object):
+    """Queue row changes for a device and send them all at once, followed by a single apply and save.
+
+    The Alteon REST API takes one row per request, so the queued requests are sent in parallel rather than batched
+    into one request.  It can also be used as a context manager, which commits the changes when the block exits
+    without an exception:
+
+        with Real(client).bulk() as writer:
+            writer.update("1", {"Weight": 10})
+            writer.update("2", {"Weight": 20})
+    """
+
+    def __init__(self, client, endpoint=None, max_workers=4, on_commit=None):
+        """Initialize the class.
+
+        :param object client: An instantiated pyalteon.Client object
+        :param str endpoint: The table to write to when a change does not name one (default: None)
+        :param int max_workers: The maximum number of requests to send at the same time (default: 4)
+        :param callable on_commit: A function called with no arguments after the changes were sent (default: None)
+        """
+        self._client = client
+        self._endpoint = endpoint
+        self._max_workers = max_workers
+        self._on_commit = on_commit
+        self.__queue = []
+        self.result = None
+
+    def __enter__(self):
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Commit the queued changes if the block did not raise an exception."""
+        if exc_type is None:
+            self.commit()
+
+    def __len__(self):
+        """Return the number of queued changes."""
+        return len(self.__queue)
+
+    def __queue_change(self, method, index, data, endpoint):
+        """Add a change to the queue."""
+        endpoint = endpoint or self._endpoint
+        if not endpoint:
+            raise ValueError("BulkWriter: No endpoint given for the change")
+
+        self.__queue.append((method, endpoint, str(index), data))
+
+    def create(self, index, data, endpoint=None):
+        """Queue the creation of a row.
+
+        :param str index: The index of the row; multi-part indexes are joined with "/"
+        :param dict data: The values of the row
+        :param str endpoint: The table of the row (default: the endpoint given to the constructor)
+        """
+        self.__queue_change("POST", index, data, endpoint)
+
+    def update(self, index, data, endpoint=None):
+        """Queue a change to a row.
+
+        :param str index: The index of the row; multi-part indexes are joined with "/"
+        :param dict data: The values to change
+        :param str endpoint: The table of the row (default: the endpoint given to the constructor)
+        """
+        self.__queue_change("PUT", index, data, endpoint)
+
+    def delete(self, index, endpoint=None):
+        """Queue the deletion of a row.
+
+        :param str index: The index of the row; multi-part indexes are joined with "/"
+        :param str endpoint: The table of the row (default: the endpoint given to the constructor)
+        """
+        self.__queue_change("DELETE", index, None, endpoint)
+
+    def __send(self, change):
+        """Send one change, returning the exception it raised or None."""
+        method, endpoint, index, data = change
+        url = f"{self._client.base_url}/{endpoint}/{index.strip('/')}"
+
+        try:
+            if method == "POST":
+                self._client.post(url, data=data)
+            elif method == "PUT":
+                self._client.put(url, headers={"Content-Type": "application/json"}, data=json.dumps(data))
+            else:
+                self._client.delete(url)
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.debug("%s of %s/%s failed: %s", method, endpoint, index, exc)
+            return exc
+
+        return None
+
+    def commit(self, apply=True, save=True):
+        """Send the queued changes, then apply and save the configuration once.
+
+        Failed rows do not stop the others from being sent.  If any row failed, the configuration is neither applied
+        nor saved, so the pending changes can be inspected (or reverted) on the device.
+
+        :param bool apply: Apply the new configuration once every row was written (default: True)
+        :param bool save: Save the applied configuration (default: True)
+        :return obj: A BulkResult object; its errors map (endpoint, index) to the pyalteon.HttpError (or other
+            exception) raised for that row
+        """
+        queue, self.__queue = self.__queue, []
+        result = BulkResult()
+
+        if queue:
+            with ThreadPoolExecutor(max_workers=max(min(self._max_workers, len(queue)), 1)) as executor:
+                for change, error in zip(queue, executor.map(self.__send, queue)):
+                    key = (change[1], change[2])
+                    if error is None:
+                        result.succeeded.append(key)
+                    else:
+                        result.errors[key] = error
+
+            # The data cached for the tables that changed is now stale
+            cache = self._client.cache
+            if cache is not None:
+                for endpoint in {change[1] for change in queue}:
+                    cache.invalidate(device=self._client.base_url, endpoint=endpoint)
+
+            if self._on_commit:
+                self._on_commit()
+
+        if result.ok and result.succeeded:
+            if apply:
+                self._client.post(self._client.base_url + "?action=apply")
+                result.applied = True
+            if apply and save:
+                self._client.post(self._client.base_url + "?action=save")
+                result.saved = True
+
+        self.result = result
+
+        return result
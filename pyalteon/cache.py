@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""Define the response caches that can be shared by pyalteon.Client objects."""
+
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+import json
+import os
+import threading
+import time
+import zlib
+
+from ._compat import json_loads
+
+
+class CacheEntry(object):
+    """Hold the data of one endpoint along with the validators needed to revalidate it."""
+
+    __slots__ = ("data", "etag", "last_modified", "stored_at")
+
+    def __init__(self, data, etag=None, last_modified=None, stored_at=None):
+        """Initialize the class.
+
+        :param list data: The rows returned by the endpoint
+        :param str etag: The ETag header the device sent with the data, if any
+        :param str last_modified: The Last-Modified header the device sent with the data, if any
+        :param float stored_at: The time.time() when the data was fetched or last revalidated (default: now)
+        """
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = time.time() if stored_at is None else stored_at
+
+    @property
+    def age(self):
+        """Return the number of seconds since the data was fetched or last revalidated."""
+        return time.time() - self.stored_at
+
+    @property
+    def validators(self):
+        """Return the headers to send with a conditional GET for this data."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+    def touch(self):
+        """Mark the data as just revalidated."""
+        self.stored_at = time.time()
+
+
+class Cache(ABC):
+    """Act as an abstract superclass for the response caches.
+
+    Entries are keyed on a (base_url, endpoint) tuple, or a (base_url, endpoint, fields) tuple for a table retrieved
+    with only some of its columns.  Subclasses must implement get(), set() and invalidate().
+    """
+
+    def __init__(self, ttl=None):
+        """Initialize the class.
+
+        :param float ttl: The number of seconds an entry is used without revalidating it; None never revalidates, and
+            0 revalidates on every access (default: None)
+        """
+        self.ttl = ttl
+
+    def is_fresh(self, entry):
+        """Return True if an entry can be used without revalidating it.
+
+        :param obj entry: A CacheEntry object
+        :return bool: True if the entry is younger than the TTL
+        """
+        return self.ttl is None or entry.age < self.ttl
+
+    @abstractmethod
+    def get(self, key):
+        """Return the CacheEntry stored for a key, or None."""
+
+    @abstractmethod
+    def set(self, key, entry):
+        """Store a CacheEntry for a key."""
+
+    @abstractmethod
+    def invalidate(self, device=None, endpoint=None):
+        """Remove entries from the cache.
+
+        :param str device: Only remove the entries for this base URL
+        :param str endpoint: Only remove the entries for this endpoint
+        """
+
+
+class MemoryCache(Cache):
+    """Keep responses in memory, evicting the least recently used entries beyond a maximum size."""
+
+    def __init__(self, ttl=None, maxsize=256):
+        """Initialize the class.
+
+        :param float ttl: The number of seconds an entry is used without revalidating it (default: None)
+        :param int maxsize: The maximum number of endpoints to keep; None keeps all of them (default: 256)
+        """
+        super().__init__(ttl=ttl)
+
+        self.maxsize = maxsize
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        """Return the number of entries in the cache."""
+        return len(self.__entries)
+
+    def get(self, key):
+        """Return the CacheEntry stored for a key, or None."""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+
+            return entry
+
+    def set(self, key, entry):
+        """Store a CacheEntry for a key, evicting the least recently used entries if the cache is full."""
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+
+            while self.maxsize is not None and len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, device=None, endpoint=None):
+        """Remove entries from the cache.
+
+        :param str device: Only remove the entries for this base URL
+        :param str endpoint: Only remove the entries for this endpoint
+        """
+        with self.__lock:
+            for key in list(self.__entries):
+                if device is not None and key[0] != device:
+                    continue
+                if endpoint is not None and key[1] != endpoint:
+                    continue
+                del self.__entries[key]
+
+
+class SqliteCache(Cache):
+    """Keep responses in an SQLite database, so they outlive the process and can be shared between processes.
+
+    Each table is stored as one compressed JSON document, along with the device, the time it was fetched and its
+    validators.  Nothing is read when the cache is opened: a table is only loaded and decoded the first time it is
+    requested, and kept decoded in memory for as long as the copy in the database doesn't change.  A short-lived
+    script with a persistent cache therefore only downloads the tables that are stale, and only decodes the ones it
+    uses:
+
+        client = Client(base_url, username, password, cache=SqliteCache("~/.cache/pyalteon.db", ttl=300))
+    """
+
+    def __init__(self, path, ttl=None):
+        """Initialize the class.
+
+        :param str path: The path of the database file; it is created if needed
+        :param float ttl: The number of seconds an entry is used without revalidating it (default: None)
+        """
+        super().__init__(ttl=ttl)
+
+        self.path = os.path.expanduser(path)
+        self.__lock = threading.Lock()
+        # The decoded data of the entries read or written by this object, as {key: (version, data)}
+        self.__loaded = {}
+
+        import sqlite3  # pylint: disable=import-outside-toplevel
+
+        self.__db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.__db.execute("PRAGMA journal_mode=WAL")
+        self.__db.execute(
+            "CREATE TABLE IF NOT EXISTS entries (device TEXT, endpoint TEXT, version TEXT, etag TEXT, "
+            "last_modified TEXT, stored_at REAL, data BLOB, PRIMARY KEY (device, endpoint))"
+        )
+
+    def __len__(self):
+        """Return the number of entries in the cache."""
+        with self.__lock:
+            return self.__db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @staticmethod
+    def __row_key(key):
+        """Return the device and endpoint columns of the row that stores a key.
+
+        A partial table is stored under its endpoint name followed by the columns it holds, e.g. "Table?props=A,B".
+        """
+        if len(key) > 2:
+            return (key[0], f"{key[1]}?props={','.join(key[2])}")
+
+        return (key[0], key[1])
+
+    @staticmethod
+    def __key(device, endpoint):
+        """Return the key stored in the row with some device and endpoint columns."""
+        endpoint, _, props = endpoint.partition("?props=")
+        if props:
+            return (device, endpoint, tuple(props.split(",")))
+
+        return (device, endpoint)
+
+    def close(self):
+        """Close the database."""
+        with self.__lock:
+            self.__db.close()
+            self.__loaded = {}
+
+    def get(self, key):
+        """Return the CacheEntry stored for a key, or None."""
+        row_key = self.__row_key(key)
+        with self.__lock:
+            row = self.__db.execute(
+                "SELECT version, etag, last_modified, stored_at FROM entries WHERE device = ? AND endpoint = ?", row_key
+            ).fetchone()
+            if row is None:
+                self.__loaded.pop(key, None)
+                return None
+
+            version, etag, last_modified, stored_at = row
+            loaded = self.__loaded.get(key)
+            if loaded is None or loaded[0] != version:
+                blob = self.__db.execute(
+                    "SELECT data FROM entries WHERE device = ? AND endpoint = ?", row_key
+                ).fetchone()[0]
+                loaded = (version, json_loads(zlib.decompress(blob)))
+                self.__loaded[key] = loaded
+
+            return CacheEntry(loaded[1], etag=etag, last_modified=last_modified, stored_at=stored_at)
+
+    def set(self, key, entry):
+        """Store a CacheEntry for a key.
+
+        The data is only written again if it changed; an entry that was just revalidated only updates its timestamp.
+        """
+        row_key = self.__row_key(key)
+        with self.__lock:
+            loaded = self.__loaded.get(key)
+            if loaded is not None and loaded[1] is entry.data:
+                cursor = self.__db.execute(
+                    "UPDATE entries SET etag = ?, last_modified = ?, stored_at = ? "
+                    "WHERE device = ? AND endpoint = ? AND version = ?",
+                    (entry.etag, entry.last_modified, entry.stored_at, row_key[0], row_key[1], loaded[0]),
+                )
+                if cursor.rowcount:
+                    return
+
+            version = os.urandom(16).hex()
+            blob = zlib.compress(json.dumps(entry.data, separators=(",", ":")).encode("utf-8"))
+            self.__db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (row_key[0], row_key[1], version, entry.etag, entry.last_modified, entry.stored_at, blob),
+            )
+            self.__loaded[key] = (version, entry.data)
+
+    def invalidate(self, device=None, endpoint=None):
+        """Remove entries from the cache.
+
+        :param str device: Only remove the entries for this base URL
+        :param str endpoint: Only remove the entries for this endpoint, including its partial tables
+        """
+        query = (
+            "DELETE FROM entries WHERE (? IS NULL OR device = ?) "
+            "AND (? IS NULL OR endpoint = ? OR substr(endpoint, 1, length(?)) = ?)"
+        )
+        prefix = f"{endpoint}?props=" if endpoint is not None else None
+        with self.__lock:
+            self.__db.execute(query, (device, device, endpoint, endpoint, prefix, prefix))
+            for key in list(self.__loaded):
+                if (device is None or key[0] == device) and (endpoint is None or key[1] == endpoint):
+                    del self.__loaded[key]
+
+    def timestamps(self, device=None):
+        """Return the time each table was fetched or last revalidated, without loading any data.
+
+        :param str device: Only return the tables of this base URL (default: all of them)
+        :return dict: The times, keyed on the same tuples as get(), e.g. {(device, endpoint): time.time()}
+        """
+        query = "SELECT device, endpoint, stored_at FROM entries WHERE ? IS NULL OR device = ?"
+        with self.__lock:
+            return {self.__key(row[0], row[1]): row[2] for row in self.__db.execute(query, (device, device))}
@@ -2,37 +2,78 @@
 """Define the pyalteon.client.Client class."""
 # pylint: disable=import-error
 
+from functools import lru_cache
 import logging
 import sys
+import threading
+import time
 
 import requests
 
 from . import __version__
 from ._compat import urlparse
 from ._helpers import HttpError
+from ._helpers import decode_json
 from ._helpers import traffic_log
+from .metrics import Metrics
+from .metrics import RequestEvent
+from .transport import TransportPolicy
 
 LOGGER = logging.getLogger(__name__)
 
+# The user agent sent by every client, including the module version and Python version
+USER_AGENT = f"pyalteon/{__version__.__version__} (Python {'.'.join(map(str, sys.version_info[:3]))})"
 
-class Client(object):
-    """Make HTTP calls to the Radware Alteon REST API."""
 
-    def __init__(self, base_url, username, password, verify_ssl=True):
+@lru_cache(maxsize=None)
+def _disable_insecure_warnings():
+    """Disable the urllib3 warnings about unverified HTTPS requests, the first time a client needs it."""
+    requests.packages.urllib3.disable_warnings()  # pylint: disable=no-member
+
+
+class Client(object):  # pylint: disable=too-many-instance-attributes
+    """Make HTTP calls to the Radware Alteon REST API.
+
+    A Client can be shared between threads: the requests share its connection pool, and add_headers() and
+    remove_headers() replace the headers in one step, so a request sent meanwhile uses either the old or the new set.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self, base_url, username, password, verify_ssl=True, timeout=None, cache=None, metrics=None, policy=None
+    ):
         """Initialize the class.
 
         :param string base_url: The base URL of the Alteon device (protocol, hostname, and port only)
         :param string username: The username with which to login
         :param string password: The password with which to login
         :param bool verify_ssl: Verify the certificate on the Alteon device (default: True)
+        :param timeout: The number of seconds to wait for each request, or a (connect, read) tuple; None uses the
+            timeouts of the policy (default: None)
+        :param obj cache: A pyalteon.cache.Cache object in which to keep the data fetched by the endpoint classes; it
+            can be shared between clients (default: None)
+        :param obj metrics: A pyalteon.metrics.Metrics object that receives a RequestEvent for every request
+            (default: a Metrics object that does nothing)
+        :param obj policy: A pyalteon.transport.TransportPolicy object with the timeouts, retries, rate limit and
+            connection pool size to use (default: no timeouts, retries or rate limit)
         """
         self.__base_url = base_url
         self.__username = username
         self.__password = password
         self.__verify_ssl = verify_ssl
-
-        # Create a new Requests Session
+        self.__cache = cache
+        self.__metrics = metrics if metrics is not None else Metrics()
+        self.__policy = policy if policy is not None else TransportPolicy()
+        self.__timeout = timeout if timeout is not None else self.__policy.timeout
+        self.__rate_limiter = self.__policy.rate_limiter()
+        self.__headers_lock = threading.Lock()
+
+        # Create a new Requests Session, with connection pools sized by the policy
         self.__session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.__policy.pool_connections, pool_maxsize=self.__policy.pool_maxsize
+        )
+        self.__session.mount("http://", adapter)
+        self.__session.mount("https://", adapter)
 
         # Set the default HTTP headers
         self.__headers = {
@@ -53,15 +94,18 @@ class Client(object):
         if url.scheme == "https":
             # If verify_ssl is False, also disable the urllib3 warnings
             if not self.__verify_ssl:
-                requests.packages.urllib3.disable_warnings()  # pylint: disable=no-member
+                _disable_insecure_warnings()
         else:
             # If not using https, force SSL verification to False
             self.__verify_ssl = False
 
     @staticmethod
     def __test_200_error(result):
-        """Test for a 200-level error that the Alteon can return sometimes."""
-        data = result.json()
+        """Test for a 200-level error that the Alteon can return sometimes.
+
+        The decoded body is kept on the response for decode_json(), so callers don't decode it again.
+        """
+        data = decode_json(result)
         if ("status" in data) and (data["status"] == "err"):
             raise HttpError(result)
 
@@ -73,11 +117,27 @@ class Client(object):
     @property
     def user_agent(self):
         """Return a user-agent string including the module version and Python version."""
-        ver_info = list(map(str, sys.version_info))
-        pyver = ".".join(ver_info[:3])
-        useragent = f"pyalteon/{__version__.__version__} (Python {pyver})"
+        return USER_AGENT
+
+    @property
+    def cache(self):
+        """Return the internal __cache value."""
+        return self.__cache
 
-        return useragent
+    @property
+    def metrics(self):
+        """Return the internal __metrics value."""
+        return self.__metrics
+
+    @property
+    def policy(self):
+        """Return the internal __policy value."""
+        return self.__policy
+
+    @property
+    def timeout(self):
+        """Return the internal __timeout value."""
+        return self.__timeout
 
     @property
     def headers(self):
@@ -98,10 +158,16 @@ class Client(object):
         :param dict headers: A dictionary where key is the header with its value being the setting for that header.
         """
         if headers:
-            head = self.__headers.copy()
-            head.update(headers)
-            self.__headers = head
-            self.__session.headers.update(self.__headers)
+            # Replace the dictionaries rather than changing them, so requests being sent from other threads never see
+            # them half-updated
+            with self.__headers_lock:
+                head = self.__headers.copy()
+                head.update(headers)
+                session_headers = self.__session.headers.copy()
+                session_headers.update(head)
+
+                self.__headers = head
+                self.__session.headers = session_headers
 
     def remove_headers(self, headers=None):
         """Remove the requested header keys from the internally stored headers.
@@ -112,28 +178,108 @@ class Client(object):
         :param list headers: A list of header keys to delete
         """
         if headers:
-            for head in headers:
-                if head in self.__headers:
-                    del self.__headers[head]
-                    del self.__session.headers[head]
+            with self.__headers_lock:
+                head = self.__headers.copy()
+                session_headers = self.__session.headers.copy()
+                for key in headers:
+                    if key in head:
+                        del head[key]
+                        del session_headers[key]
+
+                self.__headers = head
+                self.__session.headers = session_headers
+
+    def __endpoint_name(self, url):
+        """Return the name of the table a URL is for, or "config" for device-wide actions like apply and save."""
+        path = urlparse(url).path
+        prefix = urlparse(self.__base_url).path
+        if path.startswith(prefix):
+            path = path[len(prefix):]
+
+        return path.strip("/").split("/")[0] or "config"
+
+    def __send(self, event, method, url, **kwargs):
+        """Send a request, retrying it as the policy allows, and return the last response.
+
+        Connection errors, timeouts and the policy's retry_statuses are retried with exponential backoff, for the
+        methods the policy considers safe to retry.  The number of retries is recorded in the event.
+        """
+        policy = self.__policy
+        while True:
+            if self.__rate_limiter is not None:
+                self.__rate_limiter.acquire()
+
+            try:
+                result = self.__session.request(
+                    method, url, auth=self.__authstring, verify=self.__verify_ssl, timeout=self.__timeout, **kwargs
+                )
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if not policy.can_retry(method, event.retries):
+                    raise
+                delay = policy.backoff(event.retries)
+                LOGGER.debug("Retrying %s %s in %.2fs after %s", method, url, delay, exc)
+            else:
+                if result.status_code not in policy.retry_statuses or not policy.can_retry(method, event.retries):
+                    return result
+                delay = policy.backoff(event.retries, retry_after=result.headers.get("Retry-After"))
+                LOGGER.debug("Retrying %s %s in %.2fs after HTTP %s", method, url, delay, result.status_code)
+                result.close()
+
+            event.retries += 1
+            time.sleep(delay)
+
+    def __request(self, method, url, headers=None, stream=False, **kwargs):
+        """Submit a request, test the response for errors, and report it to the metrics hooks.
+
+        :param str method: The HTTP method to use
+        :param str url: A URL to query
+        :param dict headers: A dictionary with any extra headers to add to the request
+        :param bool stream: Return before the body is downloaded, skipping the 200-level error test (default: False)
+        :return obj: A requests.Response object received as a response
+        """
+        event = RequestEvent(self.__base_url, method, url, self.__endpoint_name(url))
+        start = time.perf_counter()
+        try:
+            result = self.__send(event, method, url, headers=headers, stream=stream, **kwargs)
+            event.status_code = result.status_code
+            if not stream:
+                event.response_size = len(result.content)
+
+            # A conditional GET (If-None-Match/If-Modified-Since) can come back with no body
+            if result.status_code == 304:
+                return result
+
+            # Raise an exception if the return code is in an error range
+            if result.status_code > 299:
+                raise HttpError(result)
+
+            # Test for a 200-level error Alteon can throw
+            if not stream:
+                decode_start = time.perf_counter()
+                self.__test_200_error(result)
+                event.decode_time = time.perf_counter() - decode_start
+
+            return result
+        except Exception as exc:
+            event.error = exc
+            raise
+        finally:
+            event.elapsed = time.perf_counter() - start
+            self.__metrics.on_request(event)
 
     @traffic_log(traffic_logger=LOGGER)
-    def get(self, url, headers=None):
+    def get(self, url, headers=None, params=None, stream=False):
         """Submit a GET request to the provided URL.
 
         :param str url: A URL to query
         :param dict headers: A dictionary with any extra headers to add to the request
-        :return obj: A requests.Response object received as a response
+        :param dict params: A dictionary with any query string parameters to add to the URL
+        :param bool stream: Return before the body is downloaded, so it can be read in chunks; the 200-level error
+            test is left to the caller, and the response must be closed once read (default: False)
+        :return obj: A requests.Response object received as a response; its status code is 304 if headers made the
+            request conditional and the data has not changed
         """
-        result = self.__session.get(url, auth=self.__authstring, verify=self.__verify_ssl, headers=headers)
-        # Raise an exception if the return code is in an error range
-        if result.status_code > 299:
-            raise HttpError(result)
-
-        # Test for a 200-level error Alteon can throw
-        self.__test_200_error(result)
-
-        return result
+        return self.__request("GET", url, headers=headers, params=params, stream=stream)
 
     @traffic_log(traffic_logger=LOGGER, method="POST")
     def post(self, url, headers=None, data=None):
@@ -144,16 +290,7 @@ class Client(object):
         :param dict data: A dictionary with the data to use for the body of the POST
         :return obj: A requests.Response object received as a response
         """
-        result = self.__session.post(url, auth=self.__authstring, verify=self.__verify_ssl, json=data, headers=headers)
-
-        # Raise an exception if the return code is in an error range
-        if result.status_code > 299:
-            raise HttpError(result)
-
-        # Test for a 200-level error Alteon can throw
-        self.__test_200_error(result)
-
-        return result
+        return self.__request("POST", url, headers=headers, json=data)
 
     @traffic_log(traffic_logger=LOGGER, method="PUT")
     def put(self, url, headers=None, data=None):
@@ -164,16 +301,7 @@ class Client(object):
         :param dict data: A dictionary with the data to use for the body of the PUT
         :return obj: A requests.Response object received as a response
         """
-        result = self.__session.put(url, auth=self.__authstring, verify=self.__verify_ssl, data=data, headers=headers)
-
-        # Raise an exception if the return code is in an error range
-        if result.status_code > 299:
-            raise HttpError(result)
-
-        # Test for a 200-level error Alteon can throw
-        self.__test_200_error(result)
-
-        return result
+        return self.__request("PUT", url, headers=headers, data=data)
 
     @traffic_log(traffic_logger=LOGGER, method="DELETE")
     def delete(self, url, headers=None):
@@ -183,13 +311,4 @@ class Client(object):
         :param dict headers: A dictionary with any extra headers to add to the request
         :return obj: A requests.Response object received as a response
         """
-        result = self.__session.delete(url, auth=self.__authstring, verify=self.__verify_ssl, headers=headers)
-
-        # Raise an exception if the return code is in an error range
-        if result.status_code > 299:
-            raise HttpError(result)
-
-        # Test for a 200-level error Alteon can throw
-        self.__test_200_error(result)
-
-        return result
+        return self.__request("DELETE", url, headers=headers)
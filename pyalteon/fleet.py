@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""Define the pyalteon.fleet.Fleet class."""
+# pylint: disable=import-error
+
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+import logging
+import threading
+import time
+
+import requests
+
+from .client import Client
+
+LOGGER = logging.getLogger(__name__)
+
+
+class FleetResult(object):
+    """Hold the outcome of running a query against one device of a Fleet."""
+
+    def __init__(self, base_url, value=None, error=None, elapsed=None):
+        """Initialize the class.
+
+        :param str base_url: The base URL of the device the query ran against
+        :param value: The value returned by the query, if it succeeded
+        :param Exception error: The exception raised by the query, if it failed
+        :param float elapsed: The number of seconds the query took
+        """
+        self.base_url = base_url
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        """Return a short description of the result."""
+        state = "ok" if self.ok else f"error={self.error!r}"
+        return f"<FleetResult {self.base_url} {state}>"
+
+    @property
+    def ok(self):
+        """Return True if the query succeeded."""
+        return self.error is None
+
+
+class Fleet(object):  # pylint: disable=too-many-instance-attributes
+    """Run the same query against many Radware Alteon devices in parallel."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self, devices, username=None, password=None, verify_ssl=True, timeout=None, max_workers=10,
+        device_timeout=None, cache=None, metrics=None, policy=None
+    ):
+        """Initialize the class.
+
+        All of the clients share a single connection pool, sized so that each worker can keep a connection open, or
+        as the policy sets it if one is given.  They also share the cache, metrics and policy objects given, if any;
+        the policy's rate limit applies to each device separately.
+
+        A query past device_timeout can't be stopped, so it keeps its worker until it returns, and the devices
+        waiting for a worker wait for it too.  Unless a timeout is given, either directly or by the policy, each
+        request is therefore given device_timeout as its timeout, so a device that doesn't answer frees its worker.
+        A query that makes many slow requests can still keep its worker for longer than device_timeout.
+
+        :param list devices: The base URLs of the devices; an item can also be a (base_url, username, password) tuple
+            to use different credentials for that device
+        :param string username: The username with which to login to devices without their own credentials
+        :param string password: The password with which to login to devices without their own credentials
+        :param bool verify_ssl: Verify the certificates on the Alteon devices (default: True)
+        :param timeout: The timeout used for each request to a device, as accepted by pyalteon.Client; None uses
+            the timeouts of the policy, or else device_timeout (default: None)
+        :param int max_workers: The maximum number of devices to query at the same time (default: 10)
+        :param float device_timeout: The maximum number of seconds a query may take on one device, however many
+            requests it makes; None waits as long as it takes (default: None)
+        :param obj cache: A pyalteon.cache.Cache object given to every client (default: None)
+        :param obj metrics: A pyalteon.metrics.Metrics object given to every client (default: None)
+        :param obj policy: A pyalteon.transport.TransportPolicy object given to every client (default: None)
+        """
+        self.__devices = []
+        for device in devices:
+            if isinstance(device, str):
+                device = (device, username, password)
+            self.__devices.append(tuple(device))
+
+        if timeout is None and (policy is None or policy.timeout is None):
+            timeout = device_timeout
+
+        self.__verify_ssl = verify_ssl
+        self.__timeout = timeout
+        self.__max_workers = max_workers
+        self.__device_timeout = device_timeout
+        self.__cache = cache
+        self.__metrics = metrics
+        self.__policy = policy
+        self.__clients = {}
+        self.__lock = threading.Lock()
+
+        # The adapter's pool manager keeps one pool per host, so every client can share it
+        pool_maxsize = policy.pool_maxsize if policy is not None else max_workers
+        pool_connections = max(len(self.__devices), policy.pool_connections if policy is not None else 1)
+        self.__adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+    @property
+    def devices(self):
+        """Return the base URLs of the devices in the fleet."""
+        return [device[0] for device in self.__devices]
+
+    def client(self, base_url):
+        """Return the pyalteon.Client for a device, creating it on first use.
+
+        :param str base_url: The base URL of a device in the fleet
+        :return obj: A pyalteon.Client object using the fleet's shared connection pool
+        """
+        with self.__lock:
+            return self.__client(base_url)
+
+    def __client(self, base_url):
+        """Return the pyalteon.Client for a device, creating it if needed; the lock must be held."""
+        if base_url not in self.__clients:
+            for url, username, password in self.__devices:
+                if url == base_url:
+                    break
+            else:
+                raise KeyError(base_url)
+
+            client = Client(
+                url, username, password, verify_ssl=self.__verify_ssl, timeout=self.__timeout, cache=self.__cache,
+                metrics=self.__metrics, policy=self.__policy
+            )
+            client.session.mount("http://", self.__adapter)
+            client.session.mount("https://", self.__adapter)
+            self.__clients[base_url] = client
+
+        return self.__clients[base_url]
+
+    def __run_one(self, base_url, query, started):
+        """Run the query against one device and capture the outcome in a FleetResult."""
+        start = time.monotonic()
+        started[base_url] = start
+        try:
+            value = query(self.client(base_url))
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.debug("Query against %s failed: %s", base_url, exc)
+            return FleetResult(base_url, error=exc, elapsed=time.monotonic() - start)
+
+        return FleetResult(base_url, value=value, elapsed=time.monotonic() - start)
+
+    def __next_timeout(self, pending, started):
+        """Return the number of seconds until the first pending device is past its deadline, or None."""
+        if self.__device_timeout is None:
+            return None
+
+        now = time.monotonic()
+        # A device that hasn't started yet can't reach its deadline before now + device_timeout
+        deadlines = [started.get(base_url, now) + self.__device_timeout for base_url in pending.values()]
+
+        return max(min(deadlines) - now, 0)
+
+    def run(self, query):
+        """Run a query against every device, yielding a FleetResult for each device as soon as it finishes.
+
+        An exception raised by the query is stored in the FleetResult of that device instead of being raised.  A
+        query that runs longer than device_timeout gets a FleetResult with a TimeoutError; its thread can't be
+        stopped, so it keeps a worker busy until the query returns, and whatever it returns is dropped.
+
+        :param callable query: A function that takes a pyalteon.Client and returns the data to collect, e.g.
+            ``lambda client: Group(client).all_combined``
+        :return generator: FleetResult objects, in the order the devices finish
+        """
+        # Create the clients up front so the worker threads don't race to create them
+        for base_url in self.devices:
+            self.client(base_url)
+
+        started = {}
+        executor = ThreadPoolExecutor(max_workers=self.__max_workers)
+        pending = {
+            executor.submit(self.__run_one, base_url, query, started): base_url for base_url in self.devices
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, timeout=self.__next_timeout(pending, started), return_when=FIRST_COMPLETED)
+                for future in done:
+                    del pending[future]
+                    yield future.result()
+
+                if self.__device_timeout is None:
+                    continue
+
+                now = time.monotonic()
+                for future, base_url in list(pending.items()):
+                    start = started.get(base_url)
+                    if start is not None and now - start >= self.__device_timeout and not future.done():
+                        del pending[future]
+                        LOGGER.debug("Query against %s timed out after %.1fs", base_url, now - start)
+                        yield FleetResult(
+                            base_url, error=TimeoutError(f"{base_url}: no result after {self.__device_timeout}s"),
+                            elapsed=now - start
+                        )
+        finally:
+            # If the caller stopped early, don't start queries for the remaining devices
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def run_endpoint(self, endpoint_class, attribute):
+        """Read a property of an endpoint class on every device, e.g. ``fleet.run_endpoint(Group, "all_combined")``.
+
+        :param class endpoint_class: The pyalteon endpoint class to instantiate for each device
+        :param str attribute: The name of the property to read
+        :return generator: FleetResult objects, in the order the devices finish
+        """
+        return self.run(lambda client: getattr(endpoint_class(client), attribute))
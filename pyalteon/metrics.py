@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""Define the request instrumentation hooks used by pyalteon.Client."""
+# pylint: disable=import-error
+# pylint: disable=import-outside-toplevel
+
+import threading
+
+
+class RequestEvent(object):  # pylint: disable=too-many-instance-attributes
+    """Describe one HTTP request made by a pyalteon.Client."""
+
+    __slots__ = (
+        "device", "method", "url", "endpoint", "status_code", "elapsed", "response_size", "retries", "decode_time",
+        "error",
+    )
+
+    def __init__(self, device, method, url, endpoint):
+        """Initialize the class.
+
+        :param str device: The base URL of the device
+        :param str method: The HTTP method of the request
+        :param str url: The URL of the request
+        :param str endpoint: The name of the table the request was for, or "config" for device-wide actions
+        """
+        self.device = device
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        # The HTTP status code, or None if no response was received
+        self.status_code = None
+        # The number of seconds from sending the request to reading the whole response
+        self.elapsed = 0.0
+        # The number of bytes in the body of the response
+        self.response_size = 0
+        # The number of times the request was retried before this outcome
+        self.retries = 0
+        # The number of seconds spent decoding the JSON body of the response
+        self.decode_time = 0.0
+        # The exception raised for the request, if any
+        self.error = None
+
+    def __repr__(self):
+        """Return a short description of the event."""
+        return f"<RequestEvent {self.method} {self.endpoint} {self.status_code} {self.elapsed:.3f}s>"
+
+    @property
+    def attributes(self):
+        """Return the event as a flat dictionary, e.g. for OpenTelemetry span attributes or structured logging."""
+        ret = {name: getattr(self, name) for name in self.__slots__}
+        ret["error"] = type(self.error).__name__ if self.error is not None else None
+
+        return ret
+
+
+class Metrics(object):  # pylint: disable=too-few-public-methods
+    """Receive a RequestEvent for every request a pyalteon.Client makes.
+
+    This default implementation does nothing; subclass it and override on_request() to record the events.
+    on_request() may be called from several threads at once.
+    """
+
+    def on_request(self, event):
+        """Record a finished request.
+
+        :param obj event: A RequestEvent object
+        """
+
+
+class CounterMetrics(Metrics):
+    """Aggregate requests per (device, endpoint), to find which devices and tables dominate polling time."""
+
+    def __init__(self):
+        """Initialize the class."""
+        self.__lock = threading.Lock()
+        self.__counters = {}
+
+    def on_request(self, event):
+        """Add a finished request to the counters of its device and endpoint."""
+        key = (event.device, event.endpoint)
+        with self.__lock:
+            counters = self.__counters.get(key)
+            if counters is None:
+                counters = {
+                    "requests": 0, "errors": 0, "retries": 0, "elapsed": 0.0, "max_elapsed": 0.0, "bytes": 0,
+                    "decode_time": 0.0,
+                }
+                self.__counters[key] = counters
+
+            counters["requests"] += 1
+            counters["errors"] += event.error is not None
+            counters["retries"] += event.retries
+            counters["elapsed"] += event.elapsed
+            counters["max_elapsed"] = max(counters["max_elapsed"], event.elapsed)
+            counters["bytes"] += event.response_size
+            counters["decode_time"] += event.decode_time
+
+    def counters(self):
+        """Return a copy of the counters, as {(device, endpoint): {counter: value}}."""
+        with self.__lock:
+            return {key: dict(value) for key, value in self.__counters.items()}
+
+    def top(self, count=10, counter="elapsed"):
+        """Return the (device, endpoint) pairs with the highest value of a counter.
+
+        :param int count: The number of pairs to return (default: 10)
+        :param str counter: The counter to sort on (default: "elapsed")
+        :return list: (device, endpoint, counters) tuples, highest first
+        """
+        items = sorted(self.counters().items(), key=lambda item: item[1][counter], reverse=True)
+
+        return [(key[0], key[1], value) for key, value in items[:count]]
+
+    def reset(self):
+        """Clear all of the counters."""
+        with self.__lock:
+            self.__counters = {}
+
+
+class PrometheusMetrics(Metrics):  # pylint: disable=too-few-public-methods
+    """Export requests as Prometheus metrics.  This requires the prometheus_client package.
+
+    The metrics are labelled with the device, endpoint, method and status code:
+
+    - pyalteon_request_seconds: a histogram of the request latencies
+    - pyalteon_response_bytes_total: the number of response bytes received
+    - pyalteon_decode_seconds_total: the time spent decoding JSON responses
+    - pyalteon_retries_total: the number of retried requests
+    """
+
+    def __init__(self, registry=None, prefix="pyalteon"):
+        """Initialize the class.
+
+        :param obj registry: The prometheus_client.CollectorRegistry to register with (default: the global registry)
+        :param str prefix: The prefix of the metric names (default: "pyalteon")
+        """
+        import prometheus_client
+
+        kwargs = {"registry": registry} if registry is not None else {}
+        labels = ["device", "endpoint", "method", "status"]
+
+        self.latency = prometheus_client.Histogram(
+            f"{prefix}_request_seconds", "Alteon REST API request latency", labels, **kwargs
+        )
+        self.size = prometheus_client.Counter(
+            f"{prefix}_response_bytes", "Alteon REST API response bytes", labels, **kwargs
+        )
+        self.decode = prometheus_client.Counter(
+            f"{prefix}_decode_seconds", "Time spent decoding Alteon REST API responses", labels, **kwargs
+        )
+        self.retries = prometheus_client.Counter(
+            f"{prefix}_retries", "Retried Alteon REST API requests", labels, **kwargs
+        )
+
+    def on_request(self, event):
+        """Add a finished request to the Prometheus metrics."""
+        status = str(event.status_code) if event.status_code is not None else type(event.error).__name__
+        labels = (event.device, event.endpoint, event.method, status)
+
+        self.latency.labels(*labels).observe(event.elapsed)
+        self.size.labels(*labels).inc(event.response_size)
+        self.decode.labels(*labels).inc(event.decode_time)
+        if event.retries:
+            self.retries.labels(*labels).inc(event.retries)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""Define the pyalteon.offload.Offload class."""
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+from ._compat import json_loads
+from ._helpers import HttpError
+from .table import Table
+from .vadc.group import Group
+from .vadc.real import Real
+from .vadc.virt import Virt
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _decode(endpoints, bodies):
+    """Decode the raw bodies of some tables in a worker process.
+
+    :return tuple: (list of the rows of each table, None), or (None, (index, document)) for the first body that holds
+        an error instead of its table
+    """
+    parts = []
+    for i, (endpoint, body) in enumerate(zip(endpoints, bodies)):
+        document = json_loads(body)
+        if endpoint not in document:
+            return None, (i, document)
+        parts.append(document[endpoint])
+
+    return parts, None
+
+
+def _real(endpoints, bodies):
+    """Decode and merge the real server part tables in a worker process, returning a compact Table."""
+    parts, error = _decode(endpoints, bodies)
+    if error is not None:
+        return None, error
+
+    return Table.from_rows(Real.merge(parts).values()), None
+
+
+def _virt(endpoints, bodies):
+    """Decode and join the virtual service part tables in a worker process, returning a compact Table."""
+    parts, error = _decode(endpoints, bodies)
+    if error is not None:
+        return None, error
+
+    return Table.from_rows(Virt.flatten(parts)), None
+
+
+def _group(endpoints, bodies):
+    """Decode the group tables and attach the real server links in a worker process."""
+    parts, error = _decode(endpoints, bodies)
+    if error is not None:
+        return None, error
+
+    return Group.combine(*parts), None
+
+
+class Offload(object):
+    """Decode and merge large tables in a pool of processes instead of the calling thread.
+
+    Decoding JSON and merging the part tables holds the GIL, so threads polling many large devices at once mostly
+    wait for each other.  With an Offload, the calling thread only downloads the raw response bodies; a worker
+    process decodes and merges them, and sends back a compact pyalteon.table.Table, whose numeric columns are
+    pickled as arrays and whose repeated strings are pickled once.  This pays off for tables of many thousands of
+    rows; for small ones, the cost of sending the bodies to another process outweighs the gain.  It is opt-in, and
+    can be shared by the threads of a pyalteon.Fleet:
+
+        with Offload(max_workers=4) as offload:
+            for result in fleet.run(offload.real):
+                ...
+
+    Nothing is cached: every call downloads the tables again.
+    """
+
+    def __init__(self, max_workers=None, mp_context=None):
+        """Initialize the class.
+
+        :param int max_workers: The number of worker processes (default: the number of CPUs)
+        :param obj mp_context: The multiprocessing context used to start the workers (default: the platform default)
+        """
+        self.__executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+
+    def __enter__(self):
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Shut the worker processes down."""
+        self.shutdown()
+
+    def shutdown(self, wait=True):
+        """Shut the worker processes down.
+
+        :param bool wait: Wait for the work in progress to finish (default: True)
+        """
+        self.__executor.shutdown(wait=wait)
+
+    @staticmethod
+    def fetch_raw(client, endpoints, max_workers=None):
+        """Download the bodies of some tables without decoding them.
+
+        :param object client: An instantiated pyalteon.Client object
+        :param list endpoints: The names of the tables
+        :param int max_workers: The maximum number of tables to download at the same time (default: all of them)
+        :return list: The response of each table, with its body read, in the same order as endpoints
+        """
+        def fetch(endpoint):
+            """Download one table; streaming skips the client's decoding of the body."""
+            result = client.get(f"{client.base_url}/{endpoint}", stream=True)
+            result.content  # pylint: disable=pointless-statement
+
+            return result
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(endpoints)) as executor:
+            return list(executor.map(fetch, endpoints))
+
+    def __run(self, func, client, endpoints):
+        """Download some tables and process them in a worker process, raising the error a table held if any."""
+        results = self.fetch_raw(client, endpoints)
+        value, error = self.__executor.submit(func, endpoints, [result.content for result in results]).result()
+        if error is not None:
+            index, document = error
+            raise HttpError(results[index], data=document)
+
+        return value
+
+    def real(self, client):
+        """Retrieve the real servers configuration, merged from the part tables as in pyalteon.Real.combined_table.
+
+        :param object client: An instantiated pyalteon.Client object
+        :return obj: A pyalteon.table.Table with one row per real server
+        """
+        return self.__run(_real, client, Real.PART_TABLES)
+
+    def virt(self, client):
+        """Retrieve the virtual services configuration, joined across the part tables as in pyalteon.Virt.services.
+
+        :param object client: An instantiated pyalteon.Client object
+        :return obj: A pyalteon.table.Table with one row per virtual service
+        """
+        return self.__run(_virt, client, Virt.PART_TABLES)
+
+    def group(self, client):
+        """Retrieve the groups combined with their real server linking data, as in pyalteon.Group.all_combined.
+
+        :param object client: An instantiated pyalteon.Client object
+        :return list: The groups, each with a "RealServers" list of its real server links
+        """
+        return self.__run(_group, client, [Group.TABLE, "SlbOperEnhGroupRealServerTable"])
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""Define the pyalteon.snapshot.Snapshot class."""
+
+import gzip
+import hashlib
+import json
+import time
+
+from ._endpoint import Endpoint
+from ._helpers import row_index
+from .vadc.group import Group
+from .vadc.real import Real
+from .vadc.stats import Stats
+from .vadc.virt import Virt
+from .vx.vadc import VADC
+
+# The tables captured by Snapshot.capture() when none are given
+DEFAULT_TABLES = (
+    Real.PART_TABLES
+    + ["SlbNewCfgEnhVirtServerTable"]
+    + Virt.PART_TABLES
+    + ["SlbNewCfgEnhGroupTable", "SlbOperEnhGroupRealServerTable"]
+)
+
+
+def row_hash(row):
+    """Return a short hash of the content of a row, which doesn't depend on the order of its keys.
+
+    :param dict row: A row of a table
+    :return str: The hash, as a hexadecimal string
+    """
+    data = json.dumps(row, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+# The index columns of the tables the endpoint classes know of, as {table: [columns]}
+INDEX_KEYS = {**Group.INDEX_KEYS, **Virt.INDEX_KEYS, **Stats.INDEX_KEYS, **VADC.INDEX_KEYS}
+
+
+def table_index_keys(table):
+    """Return the index columns of a table, as known by the endpoint class that reads it.
+
+    :param str table: The name of the table
+    :return list: The names of the index columns
+    """
+    return list(INDEX_KEYS.get(table, ["Index"]))
+
+
+class TableDiff(object):
+    """Hold the indexes of the rows added to, removed from and modified in one table."""
+
+    def __init__(self, added=None, removed=None, modified=None):
+        """Initialize the class.
+
+        :param list added: The indexes of the rows that are new
+        :param list removed: The indexes of the rows that are gone
+        :param list modified: The indexes of the rows whose content changed
+        """
+        self.added = added or []
+        self.removed = removed or []
+        self.modified = modified or []
+
+    def __bool__(self):
+        """Return True if anything changed."""
+        return bool(self.added or self.removed or self.modified)
+
+    def __repr__(self):
+        """Return a short description of the changes."""
+        return f"<TableDiff added={len(self.added)} removed={len(self.removed)} modified={len(self.modified)}>"
+
+
+class Snapshot(object):
+    """Hold a hash of the content of every row of some tables of a device.
+
+    Only the hashes are kept, unless keep_rows is set, so a snapshot of even a large device is small enough to keep
+    around, persist with save() and compare with diff() on every polling cycle.
+    """
+
+    def __init__(self, device=None, taken_at=None, keep_rows=False):
+        """Initialize the class.
+
+        :param str device: The base URL of the device the snapshot is of (default: None)
+        :param float taken_at: The time.time() when the snapshot was taken (default: now)
+        :param bool keep_rows: Keep the rows themselves as well as their hashes (default: False)
+        """
+        self.device = device
+        self.taken_at = time.time() if taken_at is None else taken_at
+        self.keep_rows = keep_rows
+        self.tables = {}
+        self.rows = {}
+
+    def __repr__(self):
+        """Return a short description of the snapshot."""
+        return f"<Snapshot {self.device} tables={len(self.tables)}>"
+
+    @classmethod
+    def capture(cls, client, tables=None, keep_rows=False):
+        """Take a snapshot of some tables of a device.
+
+        The tables are streamed and hashed row by row, so they are never held in memory as a whole unless keep_rows
+        is set.
+
+        :param object client: An instantiated pyalteon.Client object
+        :param list tables: The names of the tables to capture (default: DEFAULT_TABLES)
+        :param bool keep_rows: Keep the rows themselves as well as their hashes (default: False)
+        :return obj: A Snapshot object
+        """
+        snapshot = cls(device=client.base_url, keep_rows=keep_rows)
+        endpoint = Endpoint(client)
+
+        for table in tables or DEFAULT_TABLES:
+            snapshot.add(table, endpoint.iter_table(table), table_index_keys(table))
+
+        return snapshot
+
+    def add(self, table, rows, keys=("Index", )):
+        """Add (or replace) the hashes of the rows of a table.
+
+        :param str table: The name of the table
+        :param iter rows: The rows of the table
+        :param list keys: The index columns of the table (default: ["Index"])
+        """
+        hashes = {}
+        kept = {}
+        for row in rows:
+            index = row_index(row, keys)
+            hashes[index] = row_hash(row)
+            if self.keep_rows:
+                kept[index] = row
+
+        self.tables[table] = hashes
+        if self.keep_rows:
+            self.rows[table] = kept
+
+    def diff(self, previous):
+        """Find the rows that changed since a previous snapshot.
+
+        Only the hashes are compared, so this is linear in the number of rows.  A table that is only in one of the
+        snapshots has all of its rows added or removed.
+
+        :param obj previous: The older Snapshot object
+        :return dict: A TableDiff object for each table that changed, as {table: TableDiff}
+        """
+        ret = {}
+        for table in set(self.tables) | set(previous.tables):
+            old = previous.tables.get(table, {})
+            new = self.tables.get(table, {})
+
+            changes = TableDiff(
+                added=[index for index in new if index not in old],
+                removed=[index for index in old if index not in new],
+                modified=[index for index, digest in new.items() if index in old and old[index] != digest],
+            )
+            if changes:
+                ret[table] = changes
+
+        return ret
+
+    def to_dict(self):
+        """Return the snapshot as a dictionary that can be serialized as JSON."""
+        data = {"device": self.device, "taken_at": self.taken_at, "tables": self.tables}
+        if self.keep_rows:
+            data["rows"] = self.rows
+
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a Snapshot from the output of to_dict().
+
+        :param dict data: A dictionary as returned by to_dict()
+        :return obj: A Snapshot object
+        """
+        snapshot = cls(device=data.get("device"), taken_at=data.get("taken_at"), keep_rows="rows" in data)
+        snapshot.tables = data.get("tables", {})
+        snapshot.rows = data.get("rows", {})
+
+        return snapshot
+
+    def save(self, path):
+        """Write the snapshot to a JSON file, compressed with gzip if the path ends with ".gz".
+
+        :param str path: The path of the file to write
+        """
+        opener = gzip.open if str(path).endswith(".gz") else open
+        with opener(path, "wt", encoding="utf-8") as handle:
+            json.dump(self.to_dict(), handle, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        """Read a snapshot written by save().
+
+        :param str path: The path of the file to read
+        :return obj: A Snapshot object
+        """
+        opener = gzip.open if str(path).endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as handle:
+            return cls.from_dict(json.load(handle))
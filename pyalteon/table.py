@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""Define the pyalteon.table.Table class."""
+# pylint: disable=import-error
+# pylint: disable=import-outside-toplevel
+
+from array import array
+import sys
+
+# The array.array integer types, from the smallest
+INT_TYPECODES = ("b", "h", "i", "q")
+
+
+class _Missing(object):  # pylint: disable=too-few-public-methods
+    """Stand for a column that a row doesn't have, as opposed to one whose value is None (JSON null)."""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        """Return a short description of the value."""
+        return "<missing>"
+
+    def __reduce__(self):
+        """Pickle the value as a reference to MISSING, so it is still MISSING in another process."""
+        return "MISSING"
+
+
+# The value stored for a column that a row doesn't have
+MISSING = _Missing()
+
+
+def _compact(values):
+    """Store a column in the most compact form its values allow.
+
+    Columns that are all integers or all floats are stored in an array.array (of the smallest integer type that holds
+    every value), and strings are interned so that values repeated across rows (e.g. "enabled") are only stored once.
+
+    :param list values: The values of the column
+    :return: An array.array or a list
+    """
+    if values and all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+        low, high = min(values), max(values)
+        for typecode in INT_TYPECODES:
+            bits = array(typecode).itemsize * 8
+            if -(2 ** (bits - 1)) <= low and high < 2 ** (bits - 1):
+                return array(typecode, values)
+
+        return values
+    if values and all(isinstance(value, float) for value in values):
+        return array("d", values)
+
+    return [sys.intern(value) if isinstance(value, str) else value for value in values]
+
+
+class Table(object):
+    """Hold the rows of a table as columns, which takes much less memory than a list of dictionaries.
+
+    Each column name is stored once instead of once per row, numeric columns are stored in arrays, and string
+    values are interned.  A column that a row doesn't have is stored as MISSING, and left out of the row again, so
+    rows with None values come back unchanged.
+    """
+
+    __slots__ = ("__columns", "__length")
+
+    def __init__(self, columns):
+        """Initialize the class.
+
+        :param dict columns: The columns, as {name: list of values}, with MISSING where a row doesn't have the
+            column; all of the lists must be the same length
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All of the columns of a Table must be the same length")
+
+        self.__columns = {sys.intern(name): _compact(list(values)) for name, values in columns.items()}
+        self.__length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a Table from a list of dictionaries.
+
+        :param iter rows: The rows of the table
+        :return obj: A Table object
+        """
+        rows = list(rows)
+
+        # Keep the columns in the order they are first seen
+        names = {}
+        for row in rows:
+            names.update(dict.fromkeys(row))
+
+        return cls({name: [row.get(name, MISSING) for row in rows] for name in names})
+
+    def __len__(self):
+        """Return the number of rows."""
+        return self.__length
+
+    def __iter__(self):
+        """Iterate over the rows, as dictionaries."""
+        for i in range(self.__length):
+            yield self.row(i)
+
+    def __contains__(self, name):
+        """Return True if the table has a column."""
+        return name in self.__columns
+
+    def __getitem__(self, name):
+        """Return a column."""
+        return self.__columns[name]
+
+    @property
+    def columns(self):
+        """Return the names of the columns."""
+        return list(self.__columns)
+
+    def row(self, i):
+        """Return one row as a dictionary, leaving out the columns it doesn't have.
+
+        :param int i: The position of the row
+        :return dict: The row
+        """
+        return {name: values[i] for name, values in self.__columns.items() if values[i] is not MISSING}
+
+    def to_dicts(self):
+        """Return the rows as a list of dictionaries."""
+        return list(self)
+
+    def to_dict(self, key="Index"):
+        """Return the rows as a dictionary of dictionaries, like pyalteon.Real.combined.
+
+        :param str key: The column to key the dictionary on (default: "Index")
+        :return dict: The rows, as {row[key]: row}
+        """
+        return {row[key]: row for row in self}
+
+    def to_numpy(self):
+        """Return the table as a NumPy structured array.
+
+        Numeric columns keep their type, and all other columns are stored as Python objects, with None where a row
+        doesn't have the column.  This requires NumPy.
+
+        :return obj: A numpy.ndarray
+        """
+        import numpy
+
+        dtypes = []
+        for name, values in self.__columns.items():
+            if not isinstance(values, array):
+                dtypes.append((name, "O"))
+            elif values.typecode == "d":
+                dtypes.append((name, "f8"))
+            else:
+                dtypes.append((name, f"i{values.itemsize}"))
+
+        ret = numpy.empty(self.__length, dtype=dtypes)
+        for name, values in self.__columns.items():
+            ret[name] = values if isinstance(values, array) else self.__fill(values)
+
+        return ret
+
+    def to_pandas(self):
+        """Return the table as a pandas DataFrame, with None where a row doesn't have a column.  This requires pandas.
+
+        :return obj: A pandas.DataFrame
+        """
+        import pandas
+
+        return pandas.DataFrame(
+            {name: list(values) if isinstance(values, array) else self.__fill(values)
+             for name, values in self.__columns.items()}
+        )
+
+    @staticmethod
+    def __fill(values):
+        """Return the values of a column with None where a row doesn't have it."""
+        return [None if value is MISSING else value for value in values]
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""Define the pyalteon.topology.Topology class."""
+# pylint: disable=import-error
+# pylint: disable=import-outside-toplevel
+
+from collections import deque
+import logging
+
+from .vadc.group import Group
+from .vadc.real import Real
+from .vadc.virt import Virt
+
+LOGGER = logging.getLogger(__name__)
+
+# The kinds of nodes, from the top of the graph to the bottom
+VIRT = "virt"
+SERVICE = "service"
+GROUP = "group"
+REAL = "real"
+
+
+class Topology(object):
+    """Index how virtual servers, virtual services, groups and real servers of a device depend on each other.
+
+    Nodes are (kind, index) tuples, where kind is VIRT, SERVICE, GROUP or REAL; a service's index is its virtual
+    server index and service number joined with "/".  The edges point down, from virtual servers to their services,
+    from services to their group and from groups to their real servers.  They are kept in adjacency maps in both
+    directions, so the queries only visit the nodes they return (plus their direct neighbours), and refresh() only
+    updates the edges of the tables that changed:
+
+        topology = Topology(client)
+        topology.impact((REAL, "12"))
+        topology.dark_if_removed([(REAL, "12"), (REAL, "13")])
+    """
+
+    def __init__(self, client=None, max_workers=None):
+        """Initialize the class.
+
+        :param object client: An instantiated pyalteon.Client object to build the topology from; None builds an
+            empty topology to fill with update_services(), update_groups() and update_reals() (default: None)
+        :param int max_workers: The maximum number of part tables to fetch at the same time (default: None)
+        """
+        self.__down = {}
+        self.__up = {}
+        # The data each layer was last built from, so refresh() can skip the layers that didn't change
+        self.__sources = {}
+
+        self.__client = client
+        self.__virt = self.__group = self.__real = None
+        if client is not None:
+            self.__virt = Virt(client, max_workers=max_workers)
+            self.__group = Group(client)
+            self.__real = Real(client, max_workers=max_workers)
+            self.refresh()
+
+    def __contains__(self, node):
+        """Return True if a node is in the topology."""
+        return node in self.__down or node in self.__up
+
+    def __len__(self):
+        """Return the number of nodes in the topology."""
+        return len(set(self.__down) | set(self.__up))
+
+    def refresh(self, tables=(VIRT, GROUP, REAL)):
+        """Fetch some tables again and update the edges that come from them.
+
+        Without a cache on the client, the tables are always downloaded again.  With one, they are looked up in the
+        cache, and the tables whose data did not change are skipped.
+
+        :param list tables: The tables to refresh: VIRT for the virtual servers and services, GROUP for the groups
+            and REAL for the real servers (default: all of them)
+        """
+        if self.__virt is None:
+            raise ValueError("Topology: No client to refresh from")
+
+        # The endpoint objects keep their data for their whole life unless the client has a cache to check against
+        if self.__client.cache is None:
+            for table, endpoint in ((VIRT, self.__virt), (GROUP, self.__group), (REAL, self.__real)):
+                if table in tables:
+                    endpoint.invalidate()
+
+        if VIRT in tables:
+            self.__update(VIRT, (self.__virt.all, self.__virt.services), self.update_services)
+        if GROUP in tables:
+            self.__update(GROUP, (self.__group.all_combined, ), self.update_groups)
+        if REAL in tables:
+            self.__update(REAL, (self.__real.combined, ), self.update_reals)
+
+    def __update(self, name, sources, update):
+        """Call an update function with some sources, unless they are the ones it was last called with."""
+        old = self.__sources.get(name)
+        if old is not None and all(previous is new for previous, new in zip(old, sources)):
+            LOGGER.debug("Topology: %s unchanged", name)
+            return
+
+        update(*sources)
+        self.__sources[name] = sources
+
+    def __set_children(self, kind, children):
+        """Replace the edges from every node of a kind to the level below, only touching the edges that changed.
+
+        :param str kind: The kind of the parent nodes
+        :param dict children: The new children of each node of that kind, as {node: set of nodes}
+        """
+        # The nodes of that kind that are gone lose their children, without adding them to the caller's dictionary
+        gone = {node: set() for node in self.__down if node[0] == kind and node not in children}
+
+        for node, new in list(children.items()) + list(gone.items()):
+            old = self.__down.get(node, set())
+            for child in old - new:
+                self.__up[child].discard(node)
+            for child in new - old:
+                self.__up.setdefault(child, set()).add(node)
+
+            if new:
+                self.__down[node] = new
+            else:
+                self.__down.pop(node, None)
+                self.__up.setdefault(node, set())
+
+    def __set_nodes(self, kind, indexes):
+        """Replace the nodes of a kind that have no parents with the given ones, so that unused ones are listed too."""
+        indexes = {str(index) for index in indexes}
+        for node in [node for node, parents in self.__up.items() if node[0] == kind and not parents]:
+            if node[1] not in indexes and not self.__down.get(node):
+                del self.__up[node]
+
+        for index in indexes:
+            self.__up.setdefault((kind, index), set())
+
+    def update_services(self, servers, services):
+        """Replace the virtual servers, their services and the groups the services use.
+
+        :param list servers: The virtual servers, as returned by pyalteon.Virt.all
+        :param list services: The virtual services, as returned by pyalteon.Virt.services
+        """
+        virts = {(VIRT, str(srv["Index"])): set() for srv in servers}
+        groups = {}
+        nodes = []
+        for service in services:
+            node = (SERVICE, f"{service['ServIndex']}/{service['Index']}")
+            virts.setdefault((VIRT, str(service["ServIndex"])), set()).add(node)
+            nodes.append(node[1])
+            if service.get("RealGroup") not in (None, "", 0, "0"):
+                groups[node] = {(GROUP, str(service["RealGroup"]))}
+
+        self.__set_children(VIRT, virts)
+        self.__set_children(SERVICE, groups)
+        self.__set_nodes(VIRT, [node[1] for node in virts])
+        self.__set_nodes(SERVICE, nodes)
+
+    def update_groups(self, groups):
+        """Replace the groups and their real servers.
+
+        :param list groups: The groups, as returned by pyalteon.Group.all_combined
+        """
+        reals = {}
+        for group in groups:
+            reals[(GROUP, str(group["Index"]))] = {
+                (REAL, str(link[Group.REAL_KEY])) for link in group.get("RealServers", [])
+            }
+
+        self.__set_children(GROUP, reals)
+        self.__set_nodes(GROUP, [node[1] for node in reals])
+
+    def update_reals(self, reals):
+        """Replace the real servers, so that those not in any group are listed too.
+
+        :param dict reals: The real servers, as returned by pyalteon.Real.combined
+        """
+        self.__set_nodes(REAL, list(reals))
+
+    def nodes(self, kind=None):
+        """Return the nodes of the topology.
+
+        :param str kind: Only return the nodes of this kind (default: all of them)
+        :return list: (kind, index) tuples
+        """
+        return [node for node in set(self.__down) | set(self.__up) if kind is None or node[0] == kind]
+
+    def children(self, node):
+        """Return the nodes directly below a node, e.g. the real servers of a group."""
+        return set(self.__down.get(node, ()))
+
+    def parents(self, node):
+        """Return the nodes directly above a node, e.g. the groups a real server is in."""
+        return set(self.__up.get(node, ()))
+
+    @staticmethod
+    def __walk(start, adjacency, kind=None):
+        """Return the nodes reachable from some nodes through an adjacency map, visiting each node once."""
+        seen = set()
+        queue = deque(start)
+        while queue:
+            for neighbour in adjacency.get(queue.popleft(), ()):
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    queue.append(neighbour)
+
+        return {node for node in seen if kind is None or node[0] == kind}
+
+    def impact(self, node, kind=None):
+        """Return every node that depends on a node, e.g. the groups, services and virtual servers using a real server.
+
+        :param tuple node: A (kind, index) tuple
+        :param str kind: Only return the nodes of this kind (default: all of them)
+        :return set: (kind, index) tuples
+        """
+        return self.__walk([node], self.__up, kind)
+
+    def dependencies(self, node, kind=None):
+        """Return every node a node depends on, e.g. the services, groups and real servers of a virtual server.
+
+        :param tuple node: A (kind, index) tuple
+        :param str kind: Only return the nodes of this kind (default: all of them)
+        :return set: (kind, index) tuples
+        """
+        return self.__walk([node], self.__down, kind)
+
+    def dark_if_removed(self, nodes):
+        """Return the nodes left without anything to send traffic to if some nodes are removed or disabled.
+
+        A group goes dark when all of its real servers are gone, a service when its group is, and a virtual server
+        when all of its services are.
+
+        :param list nodes: The (kind, index) tuples of the nodes being removed, e.g. real servers
+        :return set: The (kind, index) tuples of the nodes that go dark, not including the removed ones
+        """
+        dark = set(nodes)
+        queue = deque(dark)
+        while queue:
+            for parent in self.__up.get(queue.popleft(), ()):
+                if parent not in dark and self.__down[parent] <= dark:
+                    dark.add(parent)
+                    queue.append(parent)
+
+        return dark.difference(nodes)
+
+    def edges(self):
+        """Return the edges of the topology, as (parent, child) tuples of nodes."""
+        return [(node, child) for node, children in self.__down.items() for child in children]
+
+    def to_dict(self):
+        """Return the topology as a node-link dictionary that can be serialized as JSON.
+
+        :return dict: {"nodes": [{"id", "kind", "index"}], "links": [{"source", "target"}]}, with node ids formatted
+            as "kind:index"
+        """
+        return {
+            "nodes": [{"id": f"{kind}:{index}", "kind": kind, "index": index} for kind, index in self.nodes()],
+            "links": [
+                {"source": f"{parent[0]}:{parent[1]}", "target": f"{child[0]}:{child[1]}"}
+                for parent, child in self.edges()
+            ],
+        }
+
+    def to_dot(self):
+        """Return the topology in the Graphviz DOT language."""
+        lines = ["digraph alteon {"]
+        lines.extend(f'  "{kind}:{index}" [shape=box, label="{kind} {index}"];' for kind, index in self.nodes())
+        lines.extend(
+            f'  "{parent[0]}:{parent[1]}" -> "{child[0]}:{child[1]}";' for parent, child in self.edges()
+        )
+        lines.append("}")
+
+        return "\n".join(lines) + "\n"
+
+    def to_networkx(self):
+        """Return the topology as a networkx DiGraph.  This requires networkx.
+
+        :return obj: A networkx.DiGraph whose nodes are (kind, index) tuples with a "kind" attribute
+        """
+        import networkx
+
+        graph = networkx.DiGraph()
+        graph.add_nodes_from((node, {"kind": node[0]}) for node in self.nodes())
+        graph.add_edges_from(self.edges())
+
+        return graph
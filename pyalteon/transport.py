@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Define the pyalteon.transport.TransportPolicy class, which controls how a Client talks to a device."""
+
+import random
+import threading
+import time
+
+
+class TokenBucket(object):  # pylint: disable=too-few-public-methods
+    """Limit the rate of requests, allowing short bursts."""
+
+    def __init__(self, rate, burst=None):
+        """Initialize the class.
+
+        :param float rate: The number of requests allowed per second
+        :param int burst: The number of requests that can be made at once after a quiet period (default: rate, at
+            least 1)
+        """
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1))
+        self.__tokens = self.burst
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def acquire(self):
+        """Wait until a request is allowed, and count it."""
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+                self.__tokens = min(self.burst, self.__tokens + (now - self.__updated) * self.rate)
+                self.__updated = now
+
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+
+                wait = (1 - self.__tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class TransportPolicy(object):  # pylint: disable=too-many-instance-attributes
+    """Hold the timeouts, retry, rate limit and connection pool settings of a pyalteon.Client.
+
+    One policy can be shared by many clients; each client gets its own rate limit.  The default policy behaves like a
+    plain requests.Session: no timeouts, no retries and no rate limit.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self, connect_timeout=None, read_timeout=None, retries=0, backoff_factor=0.5, backoff_max=30.0,
+        retry_methods=("GET", ), retry_statuses=(500, 502, 503, 504), rate=None, burst=None, pool_connections=10,
+        pool_maxsize=10
+    ):
+        """Initialize the class.
+
+        :param float connect_timeout: The number of seconds to wait for a connection; None waits forever
+        :param float read_timeout: The number of seconds to wait for the device to send data; None waits forever
+        :param int retries: The maximum number of times to retry a request (default: 0)
+        :param float backoff_factor: The base delay in seconds between retries, doubled after each one (default: 0.5)
+        :param float backoff_max: The maximum delay in seconds between retries (default: 30.0)
+        :param tuple retry_methods: The HTTP methods that are safe to retry (default: ("GET", ))
+        :param tuple retry_statuses: The HTTP status codes that are retried (default: 500, 502, 503 and 504)
+        :param float rate: The maximum number of requests per second to each device; None doesn't limit the rate
+        :param int burst: The number of requests that can be sent at once, if rate is set (default: rate)
+        :param int pool_connections: The number of hosts to keep connection pools for (default: 10)
+        :param int pool_maxsize: The maximum number of connections to keep open per host (default: 10)
+        """
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.retry_methods = tuple(method.upper() for method in retry_methods)
+        self.retry_statuses = tuple(retry_statuses)
+        self.rate = rate
+        self.burst = burst
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+
+    @property
+    def timeout(self):
+        """Return the timeout to pass to requests, or None if neither timeout is set."""
+        if self.connect_timeout is None and self.read_timeout is None:
+            return None
+
+        return (self.connect_timeout, self.read_timeout)
+
+    def rate_limiter(self):
+        """Return a new TokenBucket for one device, or None if the rate is not limited."""
+        if self.rate is None:
+            return None
+
+        return TokenBucket(self.rate, self.burst)
+
+    def can_retry(self, method, attempt):
+        """Return True if a request may be retried.
+
+        :param str method: The HTTP method of the request
+        :param int attempt: The number of times the request was already retried
+        :return bool: True if the method is safe to retry and the retries are not used up
+        """
+        return attempt < self.retries and method.upper() in self.retry_methods
+
+    def backoff(self, attempt, retry_after=None):
+        """Return the number of seconds to wait before a retry, using "full jitter" exponential backoff.
+
+        :param int attempt: The number of times the request was already retried
+        :param str retry_after: The value of a Retry-After header sent by the device, if any
+        :return float: The number of seconds to wait
+        """
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+
+        return random.uniform(0, min(self.backoff_max, self.backoff_factor * (2 ** attempt)))
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 """Define the pyalteon.vadc.group.Group class."""
 
-from copy import deepcopy
 import logging
 
 from pyalteon._endpoint import Endpoint
@@ -12,6 +11,14 @@ LOGGER = logging.getLogger(__name__)
 class Group(Endpoint):
     """Query the Radware Alteon REST API for group configurations."""
 
+    TABLE = "SlbNewCfgEnhGroupTable"
+
+    # The keys of SlbOperEnhGroupRealServerTable that link a real server to a group
+    GROUP_KEY = "RealServGroupIndex"
+    REAL_KEY = "RealServRealServIndex"
+
+    INDEX_KEYS = {"SlbOperEnhGroupRealServerTable": [GROUP_KEY, REAL_KEY]}
+
     def __init__(self, client):
         """Initialize the class.
 
@@ -19,8 +26,6 @@ class Group(Endpoint):
         """
         super().__init__(client=client)
 
-        self._reals = None
-
     @property
     def all(self):
         """Retrieve the groups list."""
@@ -30,31 +35,91 @@ class Group(Endpoint):
     @property
     def servers(self):
         """Retrieve the real servers that are in the SLB groups."""
-        # Return the cached copy if we've already fetched it
-        if self._reals:
-            return self._reals
+        endpoint = "SlbOperEnhGroupRealServerTable"
+        return self._cached("servers", [endpoint])
+
+    def iter_servers(self, params=None):
+        """Retrieve the real servers that are in the SLB groups, yielding each one as soon as it is parsed.
 
+        Unlike the servers property, this keeps memory use constant for very large tables, and caches nothing.
+
+        :param dict params: Any query string parameters to send, e.g. a filter the device supports
+        :return generator: The real server links
+        """
         endpoint = "SlbOperEnhGroupRealServerTable"
-        data = self._get_endpoint(endpoint)
+        return self._iter_endpoint(endpoint, params=params)
+
+    @staticmethod
+    def index(rows, key):
+        """Index a list of rows on the value of one of their keys.
+
+        :param list rows: The rows to index
+        :param str key: The key whose value to index on
+        :return dict: The rows, as {value: [rows with that value]}
+        """
+        ret = {}
+        for row in rows:
+            value = row[key]
+            if value not in ret:
+                ret[value] = []
+            ret[value].append(row)
+
+        return ret
+
+    @classmethod
+    def combine(cls, groups, servers):
+        """Attach the real server linking data to a copy of each group.
+
+        :param list groups: The groups list, as returned by the all property
+        :param list servers: The real server links, as returned by the servers property
+        :return list: The groups, each with a new "RealServers" list of its real server links
+        """
+        links = cls.index(servers, cls.GROUP_KEY)
 
-        # JSON returned has a top-level key that is the name of the endpoint, so return the list under that.
-        self._reals = data
+        ret = []
+        for group in groups:
+            # Copy the group so we can add to it, and create a new index for the real server info
+            group = dict(group)
+            group["RealServers"] = list(links.get(group["Index"], []))
+            ret.append(group)
 
-        return self._reals
+        return ret
 
     @property
     def all_combined(self):
         """Combine the groups list and the real server linking data into one dictionary."""
-        # Create a deepcopy of all the groups so we can modify the dictionaries in the list
-        groups = deepcopy(self.all)
-        servers = self.servers
+        return self._derive("all_combined", [self.all, self.servers], self.combine)
 
-        for group in groups:
-            index = group["Index"]
-            # Create a new index for the real server info
-            group["RealServers"] = []
-            for real in servers:
-                if real["RealServGroupIndex"] == index:
-                    group["RealServers"].append(real)
-
-        return groups
+    def get(self, index):
+        """Retrieve one group, combined with its real server linking data.
+
+        :param str index: The index of the group
+        :return dict: The group as in all_combined, or None if there is no such group
+        """
+        groups = self._derive(
+            "by_index", [self.all_combined], lambda groups: {str(grp["Index"]): grp for grp in groups}
+        )
+
+        return groups.get(str(index))
+
+    def containing(self, real_index):
+        """Retrieve the groups that a real server is in.
+
+        :param str real_index: The index of the real server
+        :return list: The groups as in all_combined
+        """
+        def build(groups, servers):
+            """Map each real server index to the groups it is in."""
+            by_index = {str(grp["Index"]): grp for grp in groups}
+
+            reals = {}
+            for real, links in self.index(servers, self.REAL_KEY).items():
+                # A real server is only listed once per group, but keep the first link just in case
+                group_indexes = dict.fromkeys(str(link[self.GROUP_KEY]) for link in links)
+                reals.setdefault(str(real), []).extend(by_index[idx] for idx in group_indexes if idx in by_index)
+
+            return reals
+
+        reals = self._derive("by_real", [self.all_combined, self.servers], build)
+
+        return list(reals.get(str(real_index), []))
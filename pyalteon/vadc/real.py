@@ -4,6 +4,7 @@
 import logging
 
 from pyalteon._endpoint import Endpoint
+from pyalteon.table import Table
 
 LOGGER = logging.getLogger(__name__)
 
@@ -11,14 +12,74 @@ LOGGER = logging.getLogger(__name__)
 class Real(Endpoint):
     """Query the Radware Alteon REST API for real server configuration."""
 
-    def __init__(self, client):
+    TABLE = "SlbNewCfgEnhRealServerTable"
+
+    # The real server configuration is split across these tables, all keyed on "Index"
+    PART_TABLES = [
+        "SlbNewCfgEnhRealServerTable",
+        "SlbNewCfgEnhRealServerSecondPartTable",
+        "SlbNewCfgEnhRealServerThirdPartTable",
+    ]
+
+    def __init__(self, client, max_workers=None, fields=None):
         """Initialize the class.
 
         :param object client: An instantiated pyalteon.Client object
+        :param int max_workers: The maximum number of part tables to fetch at the same time (default: None)
+        :param list fields: Only retrieve these columns, skipping the part tables that have none of them; the index
+            columns are always retrieved (default: None)
+        """
+        super().__init__(client=client, max_workers=max_workers, fields=fields)
+
+    @staticmethod
+    def merge(parts):
+        """Merge the rows of the real server part tables into one dictionary keyed on the real server index.
+
+        :param list parts: The data returned by each endpoint in PART_TABLES, in that order
+        :return dict: The merged real server configurations
         """
-        super().__init__(client=client)
+        ret = {}
+        for data in parts:
+            # Cycle through and merge the dictionaries together
+            for srv in data:
+                index = srv["Index"]
+                if index not in ret:
+                    # Copy the row so the endpoint data (which may be shared through a cache) is left untouched
+                    ret[index] = dict(srv)
+                else:
+                    ret[index].update(srv)
+
+        return ret
+
+    def __getitem__(self, index):
+        """Retrieve one real server, raising a KeyError if there is no such server."""
+        srv = self.get(index)
+        if srv is None:
+            raise KeyError(index)
+
+        return srv
+
+    def get(self, index):
+        """Retrieve one real server, merged from the part tables like the entries of the combined property.
 
-        self._combined = None
+        If this object already holds the combined configuration, the server is looked up in it.  Otherwise only the
+        rows of that server are retrieved, using their own URLs.
+
+        :param str index: The index of the real server
+        :return dict: The real server configuration, or None if there is no such server
+        """
+        if self._is_cached("combined", self.PART_TABLES):
+            # combined is keyed on the Index values as the device returns them, which may be integers
+            servers = self._derive(
+                "by_index", [self.combined], lambda servers: {str(key): srv for key, srv in servers.items()}
+            )
+            return servers.get(str(index))
+
+        rows = [row for row in self._get_rows(self.PART_TABLES, index) if row is not None]
+        if not rows:
+            return None
+
+        return next(iter(self.merge([rows]).values()))
 
     @property
     def all(self):
@@ -29,28 +90,17 @@ class Real(Endpoint):
     @property
     def combined(self):
         """Retrieve the real servers configuration from multiple endpoints and merge into one dictionary."""
-        # Return the cached copy if we've already fetched it
-        if self._combined:
-            return self._combined
+        return self._cached("combined", self.PART_TABLES, self.merge)
 
-        endpoint_list = [
-            "SlbNewCfgEnhRealServerTable",
-            "SlbNewCfgEnhRealServerSecondPartTable",
-            "SlbNewCfgEnhRealServerThirdPartTable",
-        ]
-
-        ret = {}
-        for endp in endpoint_list:
-            data = self._get_endpoint(endp)
-
-            # Cycle through and merge the dictionaries together
-            for srv in data:
-                index = srv["Index"]
-                if index not in ret:
-                    ret[index] = srv
-                else:
-                    ret[index].update(srv)
+    @property
+    def combined_table(self):
+        """Retrieve the merged real servers configuration as a compact pyalteon.table.Table, one row per server.
 
-        self._combined = ret
+        The merged dictionaries are only built temporarily, so this uses much less memory than the combined property.
+        Use Table.to_dict() to get the same structure as the combined property.
+        """
+        def build(parts):
+            """Merge the part tables and store the result as columns."""
+            return Table.from_rows(self.merge(parts).values())
 
-        return self._combined
+        return self._cached("combined_table", self.PART_TABLES, build)
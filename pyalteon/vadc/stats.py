@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""Define the pyalteon.vadc.stats.Stats and pyalteon.vadc.stats.StatsSampler classes."""
+
+from collections import deque
+import logging
+import threading
+import time
+
+from pyalteon._endpoint import Endpoint
+from pyalteon._helpers import BackgroundThread
+from pyalteon._helpers import decode_json
+from pyalteon._helpers import row_index
+
+LOGGER = logging.getLogger(__name__)
+
+
+def counter_delta(previous, current, wrap=None):
+    """Return how much a counter increased between two readings, allowing for it to wrap around.
+
+    A counter that went down is assumed to have wrapped once: at wrap if it is given, otherwise at 2**32 if the
+    previous reading fit in 32 bits and at 2**64 if not.  As with SNMP pollers, a counter reset (e.g. by a reboot)
+    looks like a wrap too.
+
+    :param int previous: The older reading
+    :param int current: The newer reading
+    :param int wrap: The value at which the counter wraps around to 0 (default: None)
+    :return int: The increase
+    """
+    if current >= previous:
+        return current - previous
+
+    if wrap is None:
+        wrap = 2 ** 32 if previous < 2 ** 32 else 2 ** 64
+
+    return current + wrap - previous
+
+
+class Stats(Endpoint):
+    """Query the Radware Alteon REST API for load balancing statistics.
+
+    Unlike the configuration classes, nothing is cached: every property fetches the current values.
+    """
+
+    # The statistics tables, by short name
+    TABLES = {
+        "real": "SlbStatEnhRServerTable",
+        "virt": "SlbStatEnhVirtServerTable",
+        "service": "SlbStatEnhVirtServiceTable",
+        "group": "SlbStatEnhGroupTable",
+    }
+
+    # The virtual service statistics are keyed on three columns
+    INDEX_KEYS = {TABLES["service"]: ["ServIndex", "Index", "RealServIndex"]}
+
+    # The columns that hold a current value rather than a counter that only goes up
+    GAUGES = frozenset(["CurrSessions", "HighestSessions", "MaxConns", "Status", "State"])
+
+    def __init__(self, client, max_workers=None, fields=None):
+        """Initialize the class.
+
+        :param object client: An instantiated pyalteon.Client object
+        :param int max_workers: The maximum number of tables to fetch at the same time in fetch_many() (default: None)
+        :param list fields: Only retrieve these columns; the index columns are always retrieved (default: None)
+        """
+        super().__init__(client=client, max_workers=max_workers, fields=fields)
+
+    def table_name(self, table):
+        """Return the name of a statistics table.
+
+        :param str table: A key of TABLES, or the name of any table
+        :return str: The name of the table
+        """
+        return self.TABLES.get(table, table)
+
+    def index_keys(self, endpoint):
+        """Return the index columns of a table.
+
+        :param str endpoint: A key of TABLES, or the name of any table
+        :return list: The names of the index columns
+        """
+        return super().index_keys(self.table_name(endpoint))
+
+    def fetch(self, table):
+        """Retrieve the current rows of a statistics table, bypassing any cache.
+
+        :param str table: A key of TABLES, or the name of any table
+        :return dict: The rows, keyed on their index (multi-column indexes are joined with "/")
+        """
+        endpoint = self.table_name(table)
+        keys = self.index_keys(endpoint)
+
+        params = None
+        if self._fields is not None:
+            fields = keys + [field for field in self._fields if field not in keys]
+            params = {"props": ",".join(fields)}
+
+        data = decode_json(self._client.get(self._url(endpoint), params=params))[endpoint]
+        if params is not None:
+            data = self.project(data, fields)
+
+        return {row_index(row, keys): row for row in data}
+
+    def fetch_many(self, tables):
+        """Retrieve the current rows of several statistics tables, in parallel if max_workers allows it.
+
+        :param list tables: Keys of TABLES, or the names of any tables
+        :return dict: The rows of each table, as returned by fetch(), keyed on the names given in tables
+        """
+        return dict(zip(tables, self._map(self.fetch, tables)))
+
+    @property
+    def real(self):
+        """Retrieve the real server statistics."""
+        return self.fetch("real")
+
+    @property
+    def virt(self):
+        """Retrieve the virtual server statistics."""
+        return self.fetch("virt")
+
+    @property
+    def service(self):
+        """Retrieve the virtual service statistics."""
+        return self.fetch("service")
+
+    @property
+    def group(self):
+        """Retrieve the real server group statistics."""
+        return self.fetch("group")
+
+
+class Sample(object):  # pylint: disable=too-few-public-methods
+    """Hold the rows of one statistics table at one point in time."""
+
+    __slots__ = ("taken_at", "monotonic", "rows")
+
+    def __init__(self, rows, taken_at=None, monotonic=None):
+        """Initialize the class.
+
+        :param dict rows: The rows of the table, keyed on their index
+        :param float taken_at: The time.time() when the sample was taken (default: now)
+        :param float monotonic: The time.monotonic() when the sample was taken, used to compute rates (default: now)
+        """
+        self.rows = rows
+        self.taken_at = time.time() if taken_at is None else taken_at
+        self.monotonic = time.monotonic() if monotonic is None else monotonic
+
+    def __repr__(self):
+        """Return a short description of the sample."""
+        return f"<Sample rows={len(self.rows)} taken_at={self.taken_at:.3f}>"
+
+
+class StatsSampler(object):  # pylint: disable=too-many-instance-attributes
+    """Poll statistics tables on an interval, keeping the latest samples and computing deltas and rates.
+
+    Only the tables given are fetched.  The samples of each table are kept in a ring buffer of maxlen samples, so
+    memory use is bounded however long the sampler runs.  Sampling can be driven by calling sample(), or by start(),
+    which samples from a background thread until stop() is called:
+
+        sampler = StatsSampler(client, tables=["real", "group"], interval=5)
+        sampler.start()
+        ...
+        rates = sampler.rates("real")
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self, client, tables=("real", ), interval=5.0, maxlen=720, fields=None, wrap=None, on_sample=None
+    ):
+        """Initialize the class.
+
+        :param object client: An instantiated pyalteon.Client object
+        :param list tables: The statistics tables to poll, as keys of Stats.TABLES or table names (default: ["real"])
+        :param float interval: The number of seconds between samples when started (default: 5.0)
+        :param int maxlen: The number of samples to keep for each table (default: 720)
+        :param list fields: Only retrieve these columns; the index columns are always retrieved (default: None)
+        :param int wrap: The value at which counters wrap around; None guesses 32 or 64 bits (default: None)
+        :param callable on_sample: A function called with the {table: Sample} dictionary after each sample
+            (default: None)
+        """
+        self._stats = Stats(client, max_workers=len(tables), fields=fields)
+        self.tables = list(tables)
+        self.interval = interval
+        self.wrap = wrap
+        self.on_sample = on_sample
+        self.__samples = {table: deque(maxlen=maxlen) for table in self.tables}
+        self.__lock = threading.Lock()
+        self.__thread = BackgroundThread(self.__run, "pyalteon-stats-sampler")
+
+    def samples(self, table):
+        """Return the samples kept for a table, oldest first.
+
+        :param str table: One of the tables given to the constructor
+        :return list: Sample objects
+        """
+        with self.__lock:
+            return list(self.__samples[table])
+
+    def sample(self):
+        """Fetch every table once, and keep the samples.
+
+        :return dict: The new samples, as {table: Sample}
+        """
+        data = self._stats.fetch_many(self.tables)
+        samples = {table: Sample(rows) for table, rows in data.items()}
+
+        with self.__lock:
+            for table, sample in samples.items():
+                self.__samples[table].append(sample)
+
+        if self.on_sample is not None:
+            self.on_sample(samples)
+
+        return samples
+
+    def deltas(self, table, previous=-2, current=-1):
+        """Return how much each counter increased between two samples of a table.
+
+        Gauge columns (Stats.GAUGES) and columns that are not numbers are left out, as are rows that are only in one
+        of the samples.
+
+        :param str table: One of the tables given to the constructor
+        :param int previous: The position of the older sample in samples() (default: -2, the one before the latest)
+        :param int current: The position of the newer sample in samples() (default: -1, the latest)
+        :return dict: The increases, as {index: {column: increase}}; empty if there are not enough samples
+        """
+        with self.__lock:
+            samples = self.__samples[table]
+            if len(samples) < 2:
+                return {}
+            old, new = samples[previous], samples[current]
+
+        ret = {}
+        for index, row in new.rows.items():
+            old_row = old.rows.get(index)
+            if old_row is None:
+                continue
+
+            ret[index] = {
+                column: counter_delta(old_row[column], value, self.wrap)
+                for column, value in row.items()
+                if column not in Stats.GAUGES and column in old_row
+                and isinstance(value, int) and not isinstance(value, bool) and isinstance(old_row[column], int)
+            }
+
+        return ret
+
+    def rates(self, table, previous=-2, current=-1):
+        """Return the per-second rate of each counter between two samples of a table.
+
+        :param str table: One of the tables given to the constructor
+        :param int previous: The position of the older sample in samples() (default: -2, the one before the latest)
+        :param int current: The position of the newer sample in samples() (default: -1, the latest)
+        :return dict: The rates, as {index: {column: rate}}; empty if there are not enough samples
+        """
+        with self.__lock:
+            samples = self.__samples[table]
+            if len(samples) < 2:
+                return {}
+            elapsed = samples[current].monotonic - samples[previous].monotonic
+
+        if elapsed <= 0:
+            return {}
+
+        deltas = self.deltas(table, previous=previous, current=current)
+
+        return {index: {column: delta / elapsed for column, delta in row.items()} for index, row in deltas.items()}
+
+    def __run(self):
+        """Take samples until stop() is called, keeping to the interval however long each sample takes.
+
+        A sample that overruns the interval moves the schedule rather than being caught up with samples taken back
+        to back, which would load a device that was just slow and compute rates over a few milliseconds.
+        """
+        next_at = time.monotonic()
+        while not self.__thread.stopping:
+            try:
+                self.sample()
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.warning("Sampling %s failed: %s", self.tables, exc)
+
+            next_at += self.interval
+            now = time.monotonic()
+            if next_at < now:
+                LOGGER.debug("Sampling %s fell behind by %.3fs", self.tables, now - next_at)
+                next_at = now + self.interval
+
+            self.__thread.wait(next_at - now)
+
+    def start(self):
+        """Start sampling from a background thread."""
+        self.__thread.start()
+
+    def stop(self, timeout=None):
+        """Stop sampling, waiting for the current sample to finish.
+
+        :param float timeout: The maximum number of seconds to wait (default: None)
+        """
+        self.__thread.stop(timeout)
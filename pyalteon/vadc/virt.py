@@ -4,6 +4,9 @@
 import logging
 
 from pyalteon._endpoint import Endpoint
+from pyalteon.table import Table
+from pyalteon.vadc.group import Group
+from pyalteon.vadc.real import Real
 
 LOGGER = logging.getLogger(__name__)
 
@@ -11,14 +14,46 @@ LOGGER = logging.getLogger(__name__)
 class Virt(Endpoint):
     """Query the Radware Alteon REST API for virtual service configuration."""
 
-    def __init__(self, client):
+    TABLE = "SlbNewCfgEnhVirtServerTable"
+
+    # See what I mean...
+    PART_TABLES = [
+        "SlbNewCfgEnhVirtServicesTable",
+        "SlbNewCfgEnhVirtServicesSecondPartTable",
+        "SlbNewCfgEnhVirtServicesThirdPartTable",
+        "SlbNewCfgEnhVirtServicesFourthPartTable",
+        "SlbNewCfgEnhVirtServicesFifthPartTable",
+        "SlbNewCfgEnhVirtServicesSixthPartTable",
+        "SlbNewCfgEnhVirtServicesSeventhPartTable",
+    ]
+
+    # Each part table is keyed on the virtual server index and the service number, in columns named after the part
+    INDEX_KEYS = {
+        table: [f"Serv{part}Index", f"{part}Index"]
+        for table, part in zip(
+            PART_TABLES, ["", "SecondPart", "ThirdPart", "FourthPart", "FifthPart", "SixthPart", "SeventhPart"]
+        )
+    }
+
+    # The column of the first part table holding the port of a service, which service() looks services up by
+    PORT_KEY = "VirtPort"
+
+    def __init__(self, client, max_workers=None, fields=None):
         """Initialize the class.
 
         :param object client: An instantiated pyalteon.Client object
+        :param int max_workers: The maximum number of part tables to fetch at the same time (default: None)
+        :param list fields: Only retrieve these columns, skipping the part tables that have none of them; the index
+            columns are always retrieved (default: None)
         """
-        super().__init__(client=client)
+        super().__init__(client=client, max_workers=max_workers, fields=fields)
 
-        self._combined = None
+        # The Group and Real objects used by linked_services
+        self.__related = self.__new_related()
+
+    def __new_related(self):
+        """Create the Group and Real objects used by linked_services."""
+        return (Group(self._client), Real(self._client, max_workers=self._max_workers))
 
     @staticmethod
     def index_name(index):
@@ -29,34 +64,28 @@ class Virt(Endpoint):
 
         return idx
 
-    @property
-    def all(self):
-        """Retrieve the virtual servers list."""
-        endpoint = "SlbNewCfgEnhVirtServerTable"
-        return self._all(endpoint)
+    def _projection(self, endpoint):
+        """Return the columns retrieved from an endpoint; the port is always retrieved from the first part table.
 
-    @property
-    def combined(self):
-        """Retrieve the virtual services configuration from multiple endpoints and merge into one dictionary."""
-        if self._combined:
-            return self._combined
-
-        # See what I mean...
-        endpoint_list = [
-            "SlbNewCfgEnhVirtServicesTable",
-            "SlbNewCfgEnhVirtServicesSecondPartTable",
-            "SlbNewCfgEnhVirtServicesThirdPartTable",
-            "SlbNewCfgEnhVirtServicesFourthPartTable",
-            "SlbNewCfgEnhVirtServicesFifthPartTable",
-            "SlbNewCfgEnhVirtServicesSixthPartTable",
-            "SlbNewCfgEnhVirtServicesSeventhPartTable",
-        ]
+        :param str endpoint: The name of the endpoint
+        :return list: The names of the columns, or None to retrieve all of them
+        """
+        fields = super()._projection(endpoint)
+        if fields is not None and endpoint == self.PART_TABLES[0] and self.PORT_KEY not in fields:
+            fields.append(self.PORT_KEY)
+
+        return fields
+
+    @classmethod
+    def merge(cls, parts):
+        """Group the rows of the virtual service part tables by virtual server index and part number.
 
+        :param list parts: The data returned by each endpoint in PART_TABLES, in that order
+        :return dict: The virtual services, as {virtual server index: {part number: [rows]}}
+        """
         ret = {}
-        i = 0
-        for endp in endpoint_list:
-            idx = "Serv" + self.index_name(i)
-            data = self._get_endpoint(endp)
+        for i, data in enumerate(parts):
+            idx = "Serv" + cls.index_name(i)
 
             # Cycle through and merge the dictionaries together
             for srv in data:
@@ -68,8 +97,140 @@ class Virt(Endpoint):
 
                 ret[index][i].append(srv)
 
-            i = i + 1
+        return ret
+
+    @classmethod
+    def flatten(cls, parts):
+        """Join the rows of the virtual service part tables into one record per service.
+
+        Each part table is read once and joined on its own (virtual server index, service number) columns through a
+        dictionary, so the time taken grows linearly with the number of services.
+
+        :param list parts: The data returned by each endpoint in PART_TABLES, in that order
+        :return list: One new dictionary per service with its columns from every part table, in the order of the first
+            part table that has it
+        """
+        ret = {}
+        for i, data in enumerate(parts):
+            idx = cls.index_name(i)
+            serv_idx = "Serv" + idx
+
+            for row in data:
+                key = (str(row[serv_idx]), str(row[idx]))
+                record = ret.get(key)
+                if record is None:
+                    ret[key] = dict(row)
+                else:
+                    record.update(row)
+
+        return list(ret.values())
+
+    @staticmethod
+    def link(services, servers, groups, reals):
+        """Attach the virtual server, group and real server records referenced by each service.
+
+        The records are attached as they are, not copied, so they are shared between the services referencing them.
+
+        :param list services: The services, as returned by the services property
+        :param list servers: The virtual servers, as returned by the all property
+        :param list groups: The groups, as returned by pyalteon.Group.all_combined
+        :param dict reals: The real servers, as returned by pyalteon.Real.combined
+        :return list: A copy of each service with "VirtServer" and "Group" records (None if not found) and a "Reals"
+            list of the real servers of its group
+        """
+        servers = {str(srv["Index"]): srv for srv in servers}
+        groups = {str(grp["Index"]): grp for grp in groups}
+        reals = {str(index): srv for index, srv in reals.items()}
+
+        ret = []
+        for service in services:
+            group = groups.get(str(service.get("RealGroup")))
+            links = group["RealServers"] if group is not None else []
+
+            service = dict(service)
+            service["VirtServer"] = servers.get(str(service["ServIndex"]))
+            service["Group"] = group
+            service["Reals"] = [
+                reals[str(link[Group.REAL_KEY])] for link in links if str(link[Group.REAL_KEY]) in reals
+            ]
+            ret.append(service)
+
+        return ret
+
+    @property
+    def services(self):
+        """Retrieve the virtual services configuration as one flat dictionary per service, joined across parts."""
+        return self._cached("services", self.PART_TABLES, self.flatten)
+
+    @property
+    def linked_services(self):
+        """Retrieve the virtual services as in the services property, with their virtual server, group and reals.
+
+        This also retrieves the virtual servers, groups and real servers, using the same client.
+        """
+        group, real = self.__related
+
+        return self._derive(
+            "linked_services", [self.services, self.all, group.all_combined, real.combined], self.link
+        )
+
+    def invalidate(self):
+        """Forget the data cached by this object, including the groups and real servers of linked_services."""
+        super().invalidate()
+        self.__related = self.__new_related()
+
+    def service(self, index, port):
+        """Retrieve one virtual service, merged from the part tables.
+
+        If this object already holds the services property, the service is looked up in an index built once over
+        it.  Otherwise the service is found in the first part table, and only its rows are retrieved from the
+        other part tables, using their own URLs.
+
+        :param str index: The index of the virtual server
+        :param int port: The port of the virtual service
+        :return dict: The service as in the services property, or None if there is no such service
+        """
+        key = (str(index), str(port))
+
+        def build(rows):
+            """Index the services or the rows of the first part table on their virtual server index and port."""
+            return {(str(row["ServIndex"]), str(row[self.PORT_KEY])): row for row in rows}
+
+        if self._is_cached("services", self.PART_TABLES):
+            return self._derive("services_by_port", [self.services], build).get(key)
+
+        first = self._derive("ports", [self._all(self.PART_TABLES[0])], build).get(key)
+        if first is None:
+            return None
+
+        ret = dict(first)
+        for row in self._get_rows(self.PART_TABLES[1:], f"{index}/{first['Index']}"):
+            if row is not None:
+                ret.update(row)
 
-        self._combined = ret
+        return ret
+
+    @property
+    def all(self):
+        """Retrieve the virtual servers list."""
+        endpoint = "SlbNewCfgEnhVirtServerTable"
+        return self._all(endpoint)
+
+    @property
+    def combined(self):
+        """Retrieve the virtual services configuration from multiple endpoints and merge into one dictionary."""
+        return self._cached("combined", self.PART_TABLES, self.merge)
+
+    @property
+    def combined_tables(self):
+        """Retrieve the virtual services configuration as one compact pyalteon.table.Table per part table.
+
+        Each Table holds the rows of the part table with the same number, so this uses much less memory than the
+        combined property.  Use Virt.merge([table.to_dicts() for table in tables]) to get the same structure as
+        the combined property.
+        """
+        def build(parts):
+            """Store each part table as columns."""
+            return [Table.from_rows(part) for part in parts]
 
-        return self._combined
+        return self._cached("combined_tables", self.PART_TABLES, build)
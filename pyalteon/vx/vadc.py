@@ -3,7 +3,11 @@
 
 import logging
 
+from pyalteon._compat import urlparse
 from pyalteon._endpoint import Endpoint
+from pyalteon.vadc.group import Group
+from pyalteon.vadc.real import Real
+from pyalteon.vadc.virt import Virt
 
 LOGGER = logging.getLogger(__name__)
 
@@ -11,6 +15,14 @@ LOGGER = logging.getLogger(__name__)
 class VADC(Endpoint):
     """Query the Radware Alteon REST API of a hardware appliance for vADC configurations."""
 
+    # The vADC tables are keyed on "Id"
+    INDEX_KEYS = {
+        "VADCNewCfgTable": ["Id"],
+        "VADCNewCfgSysTable": ["Id"],
+        "VADCNewCfgNetTable": ["Id"],
+        "VADCUsersPswdTable": ["Id"],
+    }
+
     def __init__(self, client):
         """Initialize the class.
 
@@ -18,9 +30,26 @@ class VADC(Endpoint):
         """
         super().__init__(client=client)
 
-        self._network = None
-        self._system = None
-        self._users = None
+    def get(self, vadc_id):
+        """Retrieve one vADC, with its rows from the vADC, system and network tables merged into one dictionary.
+
+        Tables this object already holds are looked up in an index built once over them; from the others, only the
+        row of that vADC is retrieved, using its own URL.
+
+        :param int vadc_id: The Id of the vADC
+        :return dict: The vADC configuration, or None if there is no such vADC
+        """
+        ret = {}
+        for name, endpoint in [
+            ("VADCNewCfgTable", "VADCNewCfgTable"),
+            ("system", "VADCNewCfgSysTable"),
+            ("network", "VADCNewCfgNetTable"),
+        ]:
+            row = self._lookup(name, endpoint, vadc_id)
+            if row is not None:
+                ret.update(row)
+
+        return ret or None
 
     @property
     def all(self):
@@ -31,35 +60,111 @@ class VADC(Endpoint):
     @property
     def system(self):
         """Retrieve the system configurations for all vADCs."""
-        # Return the cached copy if we've already fetched it
-        if self._system:
-            return self._system
-
         endpoint = "VADCNewCfgSysTable"
-        self._system = self._get_endpoint(endpoint)
-
-        return self._system
+        return self._cached("system", [endpoint])
 
     @property
     def network(self):
         """Retrieve the network configurations for all vADCs."""
-        # Return the cached copy if we've already fetched it
-        if self._network:
-            return self._network
-
         endpoint = "VADCNewCfgNetTable"
-        self._network = self._get_endpoint(endpoint)
-
-        return self._network
+        return self._cached("network", [endpoint])
 
     @property
     def users(self):
-        """Retrieve the network configurations for all vADCs."""
-        # Return the cached copy if we've already fetched it
-        if self._users:
-            return self._users
-
+        """Retrieve the user accounts and passwords for all vADCs."""
         endpoint = "VADCUsersPswdTable"
-        self._users = self._get_endpoint(endpoint)
+        return self._cached("users", [endpoint])
+
+    def addresses(self, address_field="MgmtAddr", scheme=None, port=None):
+        """Return the base URL of the REST API of each vADC, built from its network configuration.
 
-        return self._users
+        :param str address_field: The column of VADCNewCfgNetTable holding the address to connect to
+            (default: "MgmtAddr")
+        :param str scheme: The scheme of the URLs (default: the scheme used to reach the VX device)
+        :param int port: The port of the URLs (default: the default port of the scheme)
+        :return dict: The base URLs, as {vADC Id: base URL}; vADCs without an address are left out
+        """
+        scheme = scheme or urlparse(self._client.base_url).scheme
+        suffix = f":{port}" if port else ""
+
+        return {
+            row["Id"]: f"{scheme}://{row[address_field]}{suffix}"
+            for row in self.network
+            if row.get(address_field) and row[address_field] != "0.0.0.0"
+        }
+
+    def fleet(  # pylint: disable=too-many-arguments
+        self, username, password, address_field="MgmtAddr", scheme=None, port=None, verify_ssl=True, timeout=None,
+        max_workers=10, device_timeout=None, cache=None, metrics=None, policy=None
+    ):
+        """Return a pyalteon.Fleet of the vADCs, whose clients share one connection pool and the same TLS settings.
+
+        :param string username: The username with which to login to the vADCs
+        :param string password: The password with which to login to the vADCs
+        :param str address_field: The column of VADCNewCfgNetTable holding the address to connect to
+            (default: "MgmtAddr")
+        :param str scheme: The scheme of the URLs (default: the scheme used to reach the VX device)
+        :param int port: The port of the URLs (default: the default port of the scheme)
+        :param bool verify_ssl: Verify the certificates on the vADCs (default: True)
+        :param timeout: The timeout used for each request to a vADC, as accepted by pyalteon.Client; None uses the
+            timeouts of the policy, or else device_timeout (default: None)
+        :param int max_workers: The maximum number of vADCs to query at the same time (default: 10)
+        :param float device_timeout: The maximum number of seconds a query may take on one vADC (default: None)
+        :param obj cache: A pyalteon.cache.Cache object given to every client (default: None)
+        :param obj metrics: A pyalteon.metrics.Metrics object given to every client (default: None)
+        :param obj policy: A pyalteon.transport.TransportPolicy object given to every client (default: None)
+        :return obj: A pyalteon.Fleet object
+        """
+        from pyalteon.fleet import Fleet  # pylint: disable=import-outside-toplevel
+
+        devices = list(self.addresses(address_field=address_field, scheme=scheme, port=port).values())
+
+        return Fleet(
+            devices, username=username, password=password, verify_ssl=verify_ssl, timeout=timeout,
+            max_workers=max_workers, device_timeout=device_timeout, cache=cache, metrics=metrics, policy=policy
+        )
+
+    def collect(  # pylint: disable=too-many-arguments,too-many-locals
+        self, username, password, queries=None, address_field="MgmtAddr", scheme=None, port=None, verify_ssl=True,
+        timeout=None, max_workers=10, device_timeout=None, cache=None, metrics=None, policy=None
+    ):
+        """Collect data from every vADC concurrently.
+
+        :param string username: The username with which to login to the vADCs
+        :param string password: The password with which to login to the vADCs
+        :param dict queries: The data to collect from each vADC, as {name: function that takes a pyalteon.Client};
+            (default: the combined "groups", "reals" and "virts" configurations)
+        :param str address_field: The column of VADCNewCfgNetTable holding the address to connect to
+            (default: "MgmtAddr")
+        :param str scheme: The scheme of the URLs (default: the scheme used to reach the VX device)
+        :param int port: The port of the URLs (default: the default port of the scheme)
+        :param bool verify_ssl: Verify the certificates on the vADCs (default: True)
+        :param timeout: The timeout used for each request to a vADC, as accepted by pyalteon.Client; None uses the
+            timeouts of the policy, or else device_timeout (default: None)
+        :param int max_workers: The maximum number of vADCs to query at the same time (default: 10)
+        :param float device_timeout: The maximum number of seconds a query may take on one vADC (default: None)
+        :param obj cache: A pyalteon.cache.Cache object given to every client (default: None)
+        :param obj metrics: A pyalteon.metrics.Metrics object given to every client (default: None)
+        :param obj policy: A pyalteon.transport.TransportPolicy object given to every client (default: None)
+        :return dict: A pyalteon.fleet.FleetResult for each vADC, as {vADC Id: FleetResult}; the value of each
+            result is {name: data} for the queries
+        """
+        if queries is None:
+            queries = {
+                "groups": lambda client: Group(client).all_combined,
+                "reals": lambda client: Real(client).combined,
+                "virts": lambda client: Virt(client).combined,
+            }
+
+        ids = {url: vadc_id for vadc_id, url in self.addresses(address_field, scheme, port).items()}
+        fleet = self.fleet(
+            username, password, address_field=address_field, scheme=scheme, port=port, verify_ssl=verify_ssl,
+            timeout=timeout, max_workers=max_workers, device_timeout=device_timeout, cache=cache, metrics=metrics,
+            policy=policy
+        )
+
+        def query(client):
+            """Run every query against one vADC."""
+            return {name: func(client) for name, func in queries.items()}
+
+        return {ids[result.base_url]: result for result in fleet.run(query)}
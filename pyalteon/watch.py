@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""Define the pyalteon.watch.Watcher class."""
+
+import asyncio
+import hashlib
+import logging
+import queue
+import threading
+import time
+
+from ._helpers import BackgroundThread
+from ._helpers import HttpError
+from ._helpers import decode_json
+from .snapshot import Snapshot
+from .snapshot import table_index_keys
+
+LOGGER = logging.getLogger(__name__)
+
+# The tables watched when none are given
+DEFAULT_TABLES = ("SlbNewCfgEnhRealServerTable", "SlbOperEnhGroupRealServerTable")
+
+
+class ChangeEvent(object):  # pylint: disable=too-few-public-methods
+    """Describe a row that was added to, removed from or modified in a watched table."""
+
+    __slots__ = ("device", "table", "change", "index", "row", "previous")
+
+    def __init__(self, device, table, change, index, row=None, previous=None):  # pylint: disable=too-many-arguments
+        """Initialize the class.
+
+        :param str device: The base URL of the device
+        :param str table: The name of the table
+        :param str change: "added", "removed" or "modified"
+        :param str index: The index of the row; multi-column indexes are joined with "/"
+        :param dict row: The row as it is now, or None if it was removed
+        :param dict previous: The row as it was before, or None if it was added
+        """
+        self.device = device
+        self.table = table
+        self.change = change
+        self.index = index
+        self.row = row
+        self.previous = previous
+
+    def __repr__(self):
+        """Return a short description of the event."""
+        return f"<ChangeEvent {self.change} {self.table} {self.index}>"
+
+
+class Watcher(object):  # pylint: disable=too-many-instance-attributes
+    """Poll some tables of a device and send the rows that changed to any number of subscribers.
+
+    The device is polled once per interval, however many subscribers there are.  A table whose body is identical to
+    the last one (or that the device reports as not modified) is not decoded again.  Otherwise its rows are hashed,
+    compared with the previous poll as in pyalteon.snapshot.Snapshot.diff(), and a ChangeEvent is sent for each row
+    that was added, removed or modified.
+
+    The interval adapts to the device: it is halved (down to min_interval) after a poll that found changes, and grows
+    by half (up to max_interval) after a poll that found none.
+
+    Events can be received through a callback, a queue.Queue or an async iterator:
+
+        watcher = Watcher(client, interval=5)
+        watcher.subscribe(print)
+        changes = watcher.queue()
+        watcher.start()
+
+        async for event in watcher.events():
+            ...
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self, client, tables=DEFAULT_TABLES, interval=5.0, min_interval=1.0, max_interval=60.0, initial=True
+    ):
+        """Initialize the class.
+
+        :param object client: An instantiated pyalteon.Client object
+        :param list tables: The names of the tables to watch (default: the real servers and their group links)
+        :param float interval: The number of seconds between the first polls (default: 5.0)
+        :param float min_interval: The shortest number of seconds between polls (default: 1.0)
+        :param float max_interval: The longest number of seconds between polls (default: 60.0)
+        :param bool initial: Send an "added" event for every row found by the first poll (default: True)
+        """
+        self._client = client
+        self.tables = list(tables)
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.initial = initial
+
+        self.__keys = {table: table_index_keys(table) for table in self.tables}
+        # The state of each table after the last poll, as {table: (body hash, etag, Snapshot)}
+        self.__state = {}
+        self.__subscribers = []
+        self.__lock = threading.Lock()
+        self.__thread = BackgroundThread(self.__run, "pyalteon-watcher")
+
+    def subscribe(self, callback):
+        """Call a function with each ChangeEvent.
+
+        The function is called from the polling thread, so it should return quickly.
+
+        :param callable callback: A function that takes a ChangeEvent
+        :return callable: The callback, to pass to unsubscribe()
+        """
+        with self.__lock:
+            self.__subscribers = self.__subscribers + [callback]
+
+        return callback
+
+    def unsubscribe(self, callback):
+        """Stop calling a function subscribed with subscribe().
+
+        :param callable callback: The value returned by subscribe()
+        """
+        with self.__lock:
+            self.__subscribers = [subscriber for subscriber in self.__subscribers if subscriber is not callback]
+
+    def queue(self, maxsize=0):
+        """Return a new queue.Queue that receives each ChangeEvent.
+
+        :param int maxsize: The maximum number of events in the queue; the polling thread waits while it is full, so
+            an unbounded queue is safer if nothing may be reading it (default: 0, unbounded)
+        :return obj: A queue.Queue object
+        """
+        events = queue.Queue(maxsize=maxsize)
+        self.subscribe(events.put)
+
+        return events
+
+    async def events(self):
+        """Iterate over the ChangeEvents from within a running asyncio event loop.
+
+        :return async generator: The ChangeEvent objects, as they are found
+        """
+        loop = asyncio.get_running_loop()
+        events = asyncio.Queue()
+
+        def deliver(event):
+            """Hand an event from the polling thread to the event loop."""
+            loop.call_soon_threadsafe(events.put_nowait, event)
+
+        self.subscribe(deliver)
+        try:
+            while True:
+                yield await events.get()
+        finally:
+            self.unsubscribe(deliver)
+
+    def rows(self, table):
+        """Return the rows of a table as of the last poll, e.g. for a subscriber that joined late.
+
+        :param str table: One of the watched tables
+        :return dict: The rows, keyed on their index; empty if the table was not polled yet
+        """
+        state = self.__state.get(table)
+
+        return dict(state[2].rows.get(table, {})) if state is not None else {}
+
+    def __poll_table(self, table):  # pylint: disable=too-many-locals
+        """Poll one table, without changing the state kept for it.
+
+        :return tuple: The ChangeEvents for the rows that changed, and the new state of the table (None if it is
+            unchanged)
+        """
+        state = self.__state.get(table)
+        headers = {"If-None-Match": state[1]} if state is not None and state[1] else None
+
+        result = self._client.get(f"{self._client.base_url}/{table}", headers=headers, stream=True)
+        if result.status_code == 304:
+            result.close()
+            return [], None
+
+        body = result.content
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if state is not None and state[0] == digest:
+            return [], (digest, result.headers.get("ETag"), state[2])
+
+        document = decode_json(result)
+        if table not in document:
+            raise HttpError(result, data=document)
+
+        snapshot = Snapshot(device=self._client.base_url, keep_rows=True)
+        snapshot.add(table, document[table], self.__keys[table])
+        new_state = (digest, result.headers.get("ETag"), snapshot)
+
+        if state is None and not self.initial:
+            return [], new_state
+
+        previous = state[2] if state is not None else Snapshot(keep_rows=True)
+        changes = snapshot.diff(previous).get(table)
+        if changes is None:
+            return [], new_state
+
+        new_rows = snapshot.rows[table]
+        old_rows = previous.rows.get(table, {})
+        device = self._client.base_url
+
+        events = [ChangeEvent(device, table, "added", index, row=new_rows[index]) for index in changes.added]
+        events.extend(
+            ChangeEvent(device, table, "removed", index, previous=old_rows[index]) for index in changes.removed
+        )
+        events.extend(
+            ChangeEvent(device, table, "modified", index, row=new_rows[index], previous=old_rows[index])
+            for index in changes.modified
+        )
+
+        return events, new_state
+
+    def __dispatch(self, events):
+        """Send some ChangeEvents to every subscriber."""
+        for event in events:
+            for callback in self.__subscribers:
+                try:
+                    callback(event)
+                except Exception as exc:  # pylint: disable=broad-except
+                    LOGGER.warning("Subscriber %r failed on %r: %s", callback, event, exc)
+
+    def poll(self):
+        """Poll every watched table once, and send the ChangeEvents to the subscribers.
+
+        The state of a table is only updated once its events are sent.  A table that can't be polled keeps its
+        state, so its changes are found by the next poll, and doesn't stop the other tables from being polled; the
+        first such error is raised once they are.
+
+        :return list: The ChangeEvents sent
+        """
+        events = []
+        error = None
+        for table in self.tables:
+            try:
+                table_events, state = self.__poll_table(table)
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.warning("Polling %s of %s failed: %s", table, self._client.base_url, exc)
+                error = error or exc
+                continue
+
+            self.__dispatch(table_events)
+            if state is not None:
+                self.__state[table] = state
+            events.extend(table_events)
+
+        if error is not None:
+            raise error
+
+        return events
+
+    def __run(self):
+        """Poll until stop() is called, adapting the interval to how often the tables change."""
+        interval = self.interval
+        while not self.__thread.stopping:
+            start = time.monotonic()
+            try:
+                changed = bool(self.poll())
+            except Exception:  # pylint: disable=broad-except
+                # poll() already logged the tables that failed
+                changed = False
+
+            if changed:
+                interval = max(interval / 2, self.min_interval)
+            else:
+                interval = min(interval * 1.5, self.max_interval)
+
+            self.__thread.wait(interval - (time.monotonic() - start))
+
+    def start(self):
+        """Start polling from a background thread."""
+        self.__thread.start()
+
+    def stop(self, timeout=None):
+        """Stop polling, waiting for the current poll to finish.
+
+        :param float timeout: The maximum number of seconds to wait (default: None)
+        """
+        self.__thread.stop(timeout)
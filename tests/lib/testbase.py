@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Define the base classes of the pyalteon tests."""
+
+from testtools import TestCase
+
+from benchmarks.mock_alteon import start_in_thread
+from pyalteon import Client
+from pyalteon.metrics import Metrics
+
+
+class RecordingMetrics(Metrics):  # pylint: disable=too-few-public-methods
+    """Keep every RequestEvent a client reports."""
+
+    def __init__(self):
+        """Initialize the class."""
+        super().__init__()
+        self.events = []
+
+    def on_request(self, event):
+        """Keep the event."""
+        self.events.append(event)
+
+
+class MockServerTestCase(TestCase):
+    """Start a local mock Alteon server for each test, along with a Client for it."""
+
+    # The size of the tables the server generates, and how it answers; see benchmarks.mock_alteon
+    rows = 20
+    latency = 0.0
+    fail_first = 0
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """Start the server and create the client."""
+        super().setUp()
+
+        self.server = start_in_thread(rows=self.rows, latency=self.latency, fail_first=self.fail_first)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.client = self.new_client()
+
+    def new_client(self, **kwargs):
+        """Return a new Client for the server.
+
+        :param dict kwargs: Any keyword arguments to pass to pyalteon.Client
+        :return obj: A pyalteon.Client object
+        """
+        return Client(self.server.base_url, "user", "pass", **kwargs)
+
+    @property
+    def requests_made(self):
+        """Return the number of requests the server answered so far."""
+        return self.server.stats["requests"]
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the pyalteon.aio module, which must return the same data as the synchronous classes."""
+
+import asyncio
+import unittest
+import warnings
+
+import requests
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from pyalteon import VADC
+from pyalteon import Group
+from pyalteon import Real
+from pyalteon import Virt
+from pyalteon.aio import AsyncClient
+from pyalteon.aio import AsyncGroup
+from pyalteon.aio import AsyncReal
+from pyalteon.aio import AsyncVADC
+from pyalteon.aio import AsyncVirt
+from pyalteon.client import USER_AGENT
+from tests.lib.testbase import MockServerTestCase
+
+
+@unittest.skipIf(aiohttp is None, "pyalteon.aio requires aiohttp")
+class TestAsyncEndpoints(MockServerTestCase):
+    """Compare each asynchronous endpoint class with its synchronous counterpart against the mock server."""
+
+    def fetch(self, endpoint_class, *attributes):
+        """Await some properties of an asynchronous endpoint object, sharing one AsyncClient.
+
+        :param class endpoint_class: The pyalteon.aio endpoint class to instantiate
+        :param list attributes: The names of the properties to await
+        :return list: The value of each property, in the same order
+        """
+        async def run():
+            """Await each property in turn."""
+            async with AsyncClient(self.server.base_url, "user", "pass") as client:
+                endpoint = endpoint_class(client)
+                return [await getattr(endpoint, attribute) for attribute in attributes]
+
+        return asyncio.run(run())
+
+    def test_real(self):
+        """AsyncReal returns the same real servers as Real."""
+        real = Real(self.client)
+        self.assertEqual(self.fetch(AsyncReal, "all", "combined"), [real.all, real.combined])
+
+    def test_group(self):
+        """AsyncGroup returns the same groups as Group."""
+        group = Group(self.client)
+        self.assertEqual(self.fetch(AsyncGroup, "all", "all_combined"), [group.all, group.all_combined])
+
+    def test_virt(self):
+        """AsyncVirt returns the same virtual servers and services as Virt."""
+        virt = Virt(self.client)
+        self.assertEqual(self.fetch(AsyncVirt, "all", "combined"), [virt.all, virt.combined])
+
+    def test_vadc(self):
+        """AsyncVADC returns the same vADC configurations as VADC."""
+        vadc = VADC(self.client)
+        self.assertEqual(
+            self.fetch(AsyncVADC, "all", "system", "network", "users"),
+            [vadc.all, vadc.system, vadc.network, vadc.users],
+        )
+
+    def test_headers(self):
+        """The client sends the same user agent and Authorization header as Client, without deprecated aiohttp calls."""
+        async def run():
+            """Make a request, returning the headers of the session."""
+            async with AsyncClient(self.server.base_url, "user", "pass") as client:
+                await AsyncReal(client).all
+                return client.user_agent, dict(client.session.headers)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            user_agent, headers = asyncio.run(run())
+
+        self.assertIs(user_agent, USER_AGENT)
+        request = requests.Request("GET", self.server.base_url, auth=("user", "pass")).prepare()
+        self.assertEqual(headers["Authorization"], request.headers["Authorization"])
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the pyalteon.bulk.BulkWriter class."""
+
+import json
+
+from pyalteon import Real
+from pyalteon._helpers import HttpError
+from pyalteon.bulk import BulkWriter
+from pyalteon.cache import MemoryCache
+from tests.lib.testbase import MockServerTestCase
+
+TABLE = "SlbNewCfgEnhRealServerTable"
+
+
+class TestBulkWriter(MockServerTestCase):
+    """Test BulkWriter against the mock server, which records the changes it receives."""
+
+    def actions(self):
+        """Return the apply and save calls the server received."""
+        return [path for _, path, _ in self.server.writes if "?action=" in path]
+
+    def test_all_rows_written(self):
+        """Every row is sent, followed by exactly one apply and one save."""
+        writer = Real(self.client).bulk()
+        writer.update("1", {"Weight": 10})
+        writer.update(2, {"Weight": 20})
+        writer.create("30", {"IpAddr": "10.0.0.30"})
+        writer.delete("4")
+        self.assertEqual(len(writer), 4)
+
+        result = writer.commit()
+
+        self.assertTrue(result.ok)
+        self.assertEqual(sorted(result.succeeded), [(TABLE, "1"), (TABLE, "2"), (TABLE, "30"), (TABLE, "4")])
+        self.assertTrue(result.applied and result.saved)
+        self.assertEqual(self.actions(), ["/config?action=apply", "/config?action=save"])
+        self.assertEqual(len(writer), 0)
+
+        rows = {(method, path): body for method, path, body in self.server.writes[:4]}
+        self.assertEqual(json.loads(rows[("PUT", f"/config/{TABLE}/2")]), {"Weight": 20})
+        self.assertEqual(json.loads(rows[("POST", f"/config/{TABLE}/30")]), {"IpAddr": "10.0.0.30"})
+        self.assertIn(("DELETE", f"/config/{TABLE}/4"), rows)
+
+    def test_partial_failure(self):
+        """A row that fails is kept in the result, and the configuration is neither applied nor saved."""
+        self.server.rejected.add(f"/config/{TABLE}/2")
+        writer = Real(self.client).bulk()
+        for index in ("1", "2", "3"):
+            writer.update(index, {"Weight": 5})
+
+        result = writer.commit()
+
+        self.assertFalse(result.ok)
+        self.assertEqual(sorted(result.succeeded), [(TABLE, "1"), (TABLE, "3")])
+        self.assertEqual(list(result.errors), [(TABLE, "2")])
+        self.assertIsInstance(result.errors[(TABLE, "2")], HttpError)
+        self.assertEqual(result.errors[(TABLE, "2")].http_result.status_code, 400)
+        self.assertFalse(result.applied or result.saved)
+        self.assertEqual(self.actions(), [])
+
+    def test_apply_without_save(self):
+        """The configuration can be applied without being saved."""
+        writer = Real(self.client).bulk()
+        writer.update("1", {"Weight": 10})
+
+        result = writer.commit(save=False)
+
+        self.assertTrue(result.applied)
+        self.assertFalse(result.saved)
+        self.assertEqual(self.actions(), ["/config?action=apply"])
+
+    def test_cache_invalidated(self):
+        """The tables written to are dropped from the client's cache and from the endpoint object."""
+        cache = MemoryCache()
+        client = self.new_client(cache=cache)
+        real = Real(client)
+        self.assertEqual(len(real.all), self.rows)
+        requests_made = self.requests_made
+
+        writer = real.bulk()
+        writer.update("1", {"Weight": 10})
+        writer.commit()
+
+        self.assertIsNone(cache.get((client.base_url, TABLE)))
+        self.assertEqual(len(real.all), self.rows)
+        # The update, the apply, the save and the table downloaded again
+        self.assertEqual(self.requests_made, requests_made + 4)
+
+    def test_context_manager(self):
+        """The changes are committed when the block exits, unless it raised an exception."""
+        with Real(self.client).bulk() as writer:
+            writer.update("1", {"Weight": 10})
+        self.assertTrue(writer.result.applied)
+
+        writer = Real(self.client).bulk()
+        try:
+            with writer:
+                writer.update("2", {"Weight": 10})
+                raise RuntimeError("stop")
+        except RuntimeError:
+            pass
+        self.assertIsNone(writer.result)
+        self.assertEqual(len(self.server.writes), 3)
+
+    def test_nothing_queued(self):
+        """Committing nothing sends nothing, not even an apply."""
+        result = Real(self.client).bulk().commit()
+
+        self.assertFalse(result.applied)
+        self.assertEqual(self.server.writes, [])
+
+    def test_no_endpoint(self):
+        """A change needs a table."""
+        writer = BulkWriter(self.client)
+        self.assertRaises(ValueError, writer.update, "1", {"Weight": 1})
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the response caches."""
+
+import os
+
+from fixtures import TempDir
+from testtools import TestCase
+
+from pyalteon import Real
+from pyalteon.cache import Cache
+from pyalteon.cache import CacheEntry
+from pyalteon.cache import MemoryCache
+from pyalteon.cache import SqliteCache
+from tests.lib.testbase import MockServerTestCase
+
+TABLE = "SlbNewCfgEnhRealServerTable"
+
+
+class TestCacheClass(TestCase):
+    """Test the Cache superclass."""
+
+    def test_abstract(self):
+        """A subclass missing one of the abstract methods can't be created."""
+        class Incomplete(Cache):  # pylint: disable=abstract-method
+            """Only implement get()."""
+
+            def get(self, key):
+                """Return nothing."""
+                return None
+
+        self.assertRaises(TypeError, Incomplete)
+
+    def test_lru(self):
+        """MemoryCache evicts the least recently used entries beyond maxsize."""
+        cache = MemoryCache(maxsize=2)
+        cache.set(("dev", "a"), CacheEntry([1]))
+        cache.set(("dev", "b"), CacheEntry([2]))
+        cache.get(("dev", "a"))
+        cache.set(("dev", "c"), CacheEntry([3]))
+
+        self.assertIsNone(cache.get(("dev", "b")))
+        self.assertEqual(cache.get(("dev", "a")).data, [1])
+        self.assertEqual(len(cache), 2)
+
+
+class CacheTestMixin(object):
+    """Test a cache shared by clients against the mock server; subclasses set new_cache()."""
+
+    def new_cache(self, ttl):
+        """Return a new cache with a TTL."""
+        raise NotImplementedError
+
+    def test_fresh_entry_not_fetched(self):
+        """A fresh entry is used without contacting the device."""
+        client = self.new_client(cache=self.new_cache(ttl=60))
+        data = Real(client).all
+        requests_made = self.requests_made
+
+        self.assertIs(Real(client).all, data)
+        self.assertEqual(self.requests_made, requests_made)
+
+    def test_stale_entry_revalidated(self):
+        """A stale entry is revalidated with a conditional GET, and kept if the device answers 304."""
+        cache = self.new_cache(ttl=0)
+        client = self.new_client(cache=cache)
+        data = Real(client).all
+        requests_made = self.requests_made
+
+        self.assertEqual(Real(client).all, data)
+        self.assertEqual(self.requests_made, requests_made + 1)
+        self.assertIsNotNone(cache.get((client.base_url, TABLE)).etag)
+
+    def test_changed_entry_replaced(self):
+        """A stale entry that changed on the device is replaced."""
+        client = self.new_client(cache=self.new_cache(ttl=0))
+        real = Real(client)
+        self.assertEqual(real.all[0]["Weight"], 1)
+
+        rows = [dict(row) for row in self.server.tables[TABLE]]
+        rows[0]["Weight"] = 7
+        self.server.set_table(TABLE, rows)
+
+        self.assertEqual(real.all[0]["Weight"], 7)
+
+    def test_projected_tables_cached(self):
+        """Tables retrieved with only some columns are cached too."""
+        client = self.new_client(cache=self.new_cache(ttl=60))
+        data = Real(client, fields=["Weight"]).combined
+        requests_made = self.requests_made
+
+        self.assertEqual(Real(client, fields=["Weight"]).combined, data)
+        self.assertEqual(self.requests_made, requests_made)
+        self.assertEqual(set(data["1"]), {"Index", "Weight"})
+
+    def test_invalidate(self):
+        """Invalidating an endpoint object drops its tables from the cache, so they are fetched again."""
+        cache = self.new_cache(ttl=60)
+        real = Real(self.new_client(cache=cache))
+        self.assertEqual(len(real.all), self.rows)
+        requests_made = self.requests_made
+
+        real.invalidate()
+        self.assertEqual(len(real.all), self.rows)
+        self.assertEqual(self.requests_made, requests_made + 1)
+
+
+class TestMemoryCache(CacheTestMixin, MockServerTestCase):
+    """Test MemoryCache against the mock server."""
+
+    def new_cache(self, ttl):
+        """Return a new MemoryCache."""
+        return MemoryCache(ttl=ttl)
+
+
+class TestSqliteCache(CacheTestMixin, MockServerTestCase):
+    """Test SqliteCache against the mock server."""
+
+    def new_cache(self, ttl):
+        """Return a new SqliteCache in a temporary directory."""
+        directory = self.useFixture(TempDir()).path
+        cache = SqliteCache(os.path.join(directory, "cache.db"), ttl=ttl)
+        self.addCleanup(cache.close)
+
+        return cache
+
+    def test_persistent(self):
+        """The entries outlive the cache object."""
+        cache = self.new_cache(ttl=60)
+        data = Real(self.new_client(cache=cache)).all
+        cache.close()
+
+        cache = SqliteCache(cache.path, ttl=60)
+        self.addCleanup(cache.close)
+        requests_made = self.requests_made
+
+        self.assertEqual(Real(self.new_client(cache=cache)).all, data)
+        self.assertEqual(self.requests_made, requests_made)
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the pyalteon._endpoint.Endpoint base class."""
+
+import threading
+
+from pyalteon import Real
+from pyalteon._helpers import HttpError
+from pyalteon import Virt
+from pyalteon.metrics import Metrics
+from pyalteon.vadc.stats import Stats
+from tests.lib.testbase import MockServerTestCase
+
+
+class ThreadMetrics(Metrics):  # pylint: disable=too-few-public-methods
+    """Keep the name of the thread each request was made from."""
+
+    def __init__(self):
+        """Initialize the class."""
+        super().__init__()
+        self.threads = set()
+
+    def on_request(self, event):
+        """Keep the name of the current thread."""
+        self.threads.add(threading.current_thread().name)
+
+
+class TestParallelFetch(MockServerTestCase):
+    """Test that fetching tables in parallel returns the same data as fetching them one after another."""
+
+    def parallel_client(self):
+        """Return a client and the metrics that tell which threads it was used from."""
+        metrics = ThreadMetrics()
+
+        return self.new_client(metrics=metrics), metrics
+
+    def test_get_endpoints(self):
+        """The part tables are the same, in the same order, with any number of workers."""
+        client, metrics = self.parallel_client()
+
+        self.assertEqual(Real(client, max_workers=3).combined, Real(self.client).combined)
+        self.assertEqual(Virt(client, max_workers=4).combined, Virt(self.client).combined)
+        self.assertEqual(Virt(client, max_workers=100).services, Virt(self.client).services)
+        self.assertGreater(len(metrics.threads), 1)
+
+    def test_get_rows(self):
+        """The rows of a service are the same when retrieved from each part table in parallel."""
+        client, metrics = self.parallel_client()
+
+        self.assertEqual(Virt(client, max_workers=7).service("1", 80), Virt(self.client).service("1", 80))
+        self.assertEqual(Real(client, max_workers=3).get("2"), Real(self.client).get("2"))
+        self.assertGreater(len(metrics.threads), 1)
+
+    def test_fetch_many(self):
+        """The statistics tables are the same, keyed on the names given, with any number of workers."""
+        client, metrics = self.parallel_client()
+        tables = ["real", "group", "SlbStatEnhRServerTable"]
+
+        self.assertEqual(Stats(client, max_workers=3).fetch_many(tables), Stats(self.client).fetch_many(tables))
+        self.assertEqual(list(Stats(client, max_workers=3).fetch_many(tables)), tables)
+        self.assertGreater(len(metrics.threads), 1)
+
+
+class TestRowLookup(MockServerTestCase):
+    """Test the retrieval of single rows."""
+
+    # pylint: disable=protected-access
+
+    def test_get_row(self):
+        """A row is retrieved using its own URL, and a 404 means there is no such row."""
+        real = Real(self.client)
+
+        self.assertEqual(real._get_row(Real.TABLE, "3"), self.server.tables[Real.TABLE][2])
+        self.assertEqual(real._get_row(Real.TABLE, 3), self.server.tables[Real.TABLE][2])
+        self.assertIsNone(real._get_row(Real.TABLE, "999"))
+        self.assertEqual(self.requests_made, 3)
+
+    def test_get_row_projected(self):
+        """A row holds the index columns and the requested fields."""
+        real = Real(self.client, fields=["Name"])
+
+        self.assertEqual(real._get_row(Real.TABLE, "3"), {"Index": "3", "Name": "real3"})
+
+    def test_get_row_error(self):
+        """Errors other than a 404 reach the caller."""
+        self.server.fail_first = 1
+
+        exc = self.assertRaises(HttpError, Real(self.client)._get_row, Real.TABLE, "3")
+        self.assertEqual(exc.http_result.status_code, 503)
+
+    def test_get_rows(self):
+        """The rows with an index are returned in the order of the tables, with None where there is no such row."""
+        real = Real(self.client, max_workers=3)
+        self.server.set_table(Real.PART_TABLES[1], self.server.tables[Real.PART_TABLES[1]][:2])
+
+        rows = real._get_rows(Real.PART_TABLES, "3")
+
+        self.assertEqual([row["Index"] for row in rows if row is not None], ["3", "3"])
+        self.assertIn("Name", rows[0])
+        self.assertIsNone(rows[1])
+        self.assertIn("Delete", rows[2])
+        self.assertEqual(real._get_rows(Real.PART_TABLES, "999"), [None, None, None])
+
+    def test_lookup(self):
+        """A row is retrieved using its own URL until the table is held, then found in it without any request."""
+        real = Real(self.client)
+
+        self.assertEqual(real._lookup(Real.TABLE, Real.TABLE, "3")["Name"], "real3")
+        self.assertEqual(self.requests_made, 1)
+
+        table = real.all
+        requests = self.requests_made
+        self.assertIs(real._lookup(Real.TABLE, Real.TABLE, "3"), table[2])
+        self.assertIs(real._lookup(Real.TABLE, Real.TABLE, 3), table[2])
+        self.assertIsNone(real._lookup(Real.TABLE, Real.TABLE, "999"))
+        self.assertEqual(self.requests_made, requests)
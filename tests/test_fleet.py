@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of running queries across a fleet of devices."""
+
+import time
+
+from benchmarks.mock_alteon import start_in_thread
+from pyalteon import Fleet
+from pyalteon import Real
+from pyalteon.cache import MemoryCache
+from pyalteon.metrics import Metrics
+from pyalteon.transport import TransportPolicy
+from tests.lib.testbase import MockServerTestCase
+
+
+class TestFleet(MockServerTestCase):
+    """Test a Fleet against the mock server."""
+
+    def test_run(self):
+        """The query runs against every device, and errors are returned rather than raised."""
+        fleet = Fleet([self.server.base_url, "http://127.0.0.1:1"], "user", "pass")
+
+        results = {result.base_url: result for result in fleet.run(lambda client: len(Real(client).all))}
+
+        self.assertEqual(results[self.server.base_url].value, self.rows)
+        self.assertFalse(results["http://127.0.0.1:1"].ok)
+
+    def test_device_timeout(self):
+        """A device past its deadline gets a TimeoutError without holding up the others."""
+        slow = self.server.base_url
+        fast = slow.replace("127.0.0.1", "localhost")
+
+        def query(client):
+            """Take too long on one of the devices."""
+            if client.base_url.startswith(slow):
+                time.sleep(1)
+            return len(Real(client).all)
+
+        fleet = Fleet([slow, fast], "user", "pass", device_timeout=0.3, max_workers=2)
+        start = time.monotonic()
+        results = {}
+        for result in fleet.run(query):
+            results[result.base_url] = (result, time.monotonic() - start)
+
+        self.assertIsInstance(results[slow][0].error, TimeoutError)
+        self.assertLess(results[slow][1], 0.9)
+        self.assertEqual(results[fast][0].value, self.rows)
+
+    def test_client_options(self):
+        """The cache, metrics and policy are given to every client."""
+        cache = MemoryCache()
+        metrics = Metrics()
+        policy = TransportPolicy(retries=2)
+        fleet = Fleet([self.server.base_url], "user", "pass", cache=cache, metrics=metrics, policy=policy)
+
+        list(fleet.run(lambda client: Real(client).all))
+        client = fleet.client(self.server.base_url)
+
+        self.assertIs(client.cache, cache)
+        self.assertIs(client.metrics, metrics)
+        self.assertIs(client.policy, policy)
+        self.assertIsNotNone(cache.get((client.base_url, "SlbNewCfgEnhRealServerTable")))
+
+    def test_device_timeout_frees_worker(self):
+        """A device that doesn't answer frees its worker, so the devices queued behind it still run in time."""
+        slow = start_in_thread(rows=self.rows, latency=3)
+        self.addCleanup(slow.server_close)
+        self.addCleanup(slow.shutdown)
+        fast = [self.server.base_url, self.server.base_url.replace("127.0.0.1", "localhost")]
+
+        fleet = Fleet([slow.base_url] + fast, "user", "pass", device_timeout=0.3, max_workers=1)
+        start = time.monotonic()
+        results = {result.base_url: result for result in fleet.run(lambda client: len(Real(client).all))}
+
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertFalse(results[slow.base_url].ok)
+        self.assertEqual([results[base_url].value for base_url in fast], [self.rows, self.rows])
+
+    def test_request_timeout(self):
+        """Requests time out after device_timeout, unless a timeout is given directly or by the policy."""
+        base_url = self.server.base_url
+
+        self.assertEqual(Fleet([base_url], device_timeout=5).client(base_url).timeout, 5)
+        self.assertEqual(Fleet([base_url], timeout=2, device_timeout=5).client(base_url).timeout, 2)
+        policy = TransportPolicy(connect_timeout=1, read_timeout=3)
+        self.assertEqual(Fleet([base_url], device_timeout=5, policy=policy).client(base_url).timeout, policy.timeout)
+        self.assertIsNone(Fleet([base_url]).client(base_url).timeout)
+
+    def test_pool_size(self):
+        """The shared connection pool is sized by the policy if one is given, and by max_workers otherwise."""
+        base_url = self.server.base_url
+        policy = TransportPolicy(pool_maxsize=3)
+
+        for fleet, size in ((Fleet([base_url], policy=policy), 3), (Fleet([base_url], max_workers=7), 7)):
+            adapter = fleet.client(base_url).session.get_adapter(base_url)
+            self.assertEqual(adapter._pool_maxsize, size)  # pylint: disable=protected-access
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the pyalteon.vadc.group.Group class."""
+
+from pyalteon import Group
+from tests.lib.testbase import MockServerTestCase
+
+GROUPS = "SlbNewCfgEnhGroupTable"
+LINKS = "SlbOperEnhGroupRealServerTable"
+
+
+class TestGroup(MockServerTestCase):
+    """Test the group lookups against the mock server, whose real server i is in group i % 2 + 1."""
+
+    def test_all_combined(self):
+        """Each group gets the links of its real servers."""
+        groups = Group(self.client).all_combined
+
+        self.assertEqual([grp["Index"] for grp in groups], ["1", "2"])
+        self.assertEqual(len(groups[0]["RealServers"]), self.rows // 2)
+        self.assertTrue(all(link[Group.GROUP_KEY] == "1" for link in groups[0]["RealServers"]))
+
+    def test_get(self):
+        """A group is found by its index as a str or an int."""
+        group = Group(self.client)
+
+        self.assertEqual(group.get("2")["Name"], "group2")
+        self.assertIs(group.get(2), group.get("2"))
+        self.assertIsNone(group.get("3"))
+
+    def test_containing(self):
+        """The groups of a real server are found by its index as a str or an int."""
+        group = Group(self.client)
+
+        self.assertEqual([grp["Index"] for grp in group.containing("1")], ["2"])
+        self.assertEqual(group.containing(1), group.containing("1"))
+        self.assertEqual(group.containing("999"), [])
+
+    def test_real_in_several_groups(self):
+        """A real server linked to several groups is in each of them, once."""
+        links = self.server.tables[LINKS] + [
+            {Group.GROUP_KEY: "1", Group.REAL_KEY: "1", "State": 1, "Status": 2},
+            {Group.GROUP_KEY: "1", Group.REAL_KEY: "1", "State": 1, "Status": 2},
+        ]
+        self.server.set_table(LINKS, links)
+
+        self.assertEqual([grp["Index"] for grp in Group(self.client).containing("1")], ["2", "1"])
+
+    def test_integer_indexes(self):
+        """The lookups work the same when the device returns the indexes as integers."""
+        self.server.set_table(GROUPS, [dict(row, Index=int(row["Index"])) for row in self.server.tables[GROUPS]])
+        self.server.set_table(
+            LINKS,
+            [
+                dict(row, **{Group.GROUP_KEY: int(row[Group.GROUP_KEY]), Group.REAL_KEY: int(row[Group.REAL_KEY])})
+                for row in self.server.tables[LINKS]
+            ],
+        )
+        group = Group(self.client)
+
+        self.assertEqual(group.get("1")["Index"], 1)
+        self.assertIs(group.get(1), group.get("1"))
+        self.assertEqual(len(group.get(1)["RealServers"]), self.rows // 2)
+        self.assertEqual([grp["Index"] for grp in group.containing("1")], [2])
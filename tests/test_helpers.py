@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the pyalteon._helpers module."""
+
+import json
+import sys
+import threading
+import time
+import types
+from unittest import mock
+
+from testtools import TestCase
+
+from pyalteon import Real
+from pyalteon import _compat
+from pyalteon._compat import json_loads
+from pyalteon._helpers import BackgroundThread
+from pyalteon._helpers import HttpError
+from pyalteon._helpers import SingleFlight
+from pyalteon._helpers import decode_json
+from pyalteon._helpers import iter_json_rows
+from pyalteon._helpers import row_index
+from tests.lib.testbase import MockServerTestCase
+
+
+def chunked(data, size):
+    """Split bytes into chunks of a given size."""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestIterJsonRows(TestCase):
+    """Test the incremental parsing of a table."""
+
+    ROWS = [
+        {"Index": "1", "Name": "café ☃", "Weight": 1},
+        {"Index": "2", "Name": "a } ] string with \"brackets\"", "Nested": {"List": [1, 2, {"A": []}]}},
+        {"Index": "3", "Name": "", "Weight": -1.5e3},
+    ]
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """Encode a document with some awkward rows."""
+        super().setUp()
+        self.document = json.dumps({"Other": [{"Index": "9"}], "Table": self.ROWS, "After": 1}).encode("utf-8")
+
+    def test_every_chunk_size(self):
+        """The rows are the same however the document is split, including inside multi-byte characters."""
+        for size in range(1, len(self.document) + 1):
+            self.assertEqual(list(iter_json_rows(chunked(self.document, size), "Table")), self.ROWS, size)
+
+    def test_whitespace(self):
+        """Whitespace between the tokens is allowed."""
+        document = json.dumps({"Table": self.ROWS}, indent=4).encode("utf-8")
+        self.assertEqual(list(iter_json_rows(chunked(document, 7), "Table")), self.ROWS)
+
+    def test_empty_table(self):
+        """An empty table yields no rows."""
+        self.assertEqual(list(iter_json_rows([b'{"Table": [', b"]}"], "Table")), [])
+
+    def test_missing_key(self):
+        """Without the key, no rows are yielded and the document is returned."""
+        document = {"status": "err", "description": "Table%20not%20found"}
+        rows = iter_json_rows(chunked(json.dumps(document).encode("utf-8"), 5), "Table")
+
+        try:
+            next(rows)
+        except StopIteration as exc:
+            self.assertEqual(exc.value, document)
+        else:
+            self.fail("A row was yielded from a document without the key")
+
+
+class TestRowIndex(TestCase):
+    """Test how rows are identified."""
+
+    def test_row_index(self):
+        """The index columns are joined with "/"."""
+        row = {"ServIndex": "web", "Index": 2, "Name": "x"}
+        self.assertEqual(row_index(row, ["Index"]), "2")
+        self.assertEqual(row_index(row, ["ServIndex", "Index"]), "web/2")
+
+
+class TestSingleFlight(TestCase):
+    """Test that concurrent calls for the same key share one call."""
+
+    def test_shared_call(self):
+        """Threads asking for a key in flight wait for it and get its result."""
+        flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def work():
+            """Take long enough for the other threads to arrive."""
+            calls.append(1)
+            started.set()
+            time.sleep(0.2)
+            return object()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("key", work))) for _ in range(5)]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_keys_are_independent(self):
+        """Different keys don't wait for each other."""
+        flight = SingleFlight()
+        self.assertEqual(flight.do("a", lambda: 1), 1)
+        self.assertEqual(flight.do("b", lambda: 2), 2)
+
+    def test_released_after_call(self):
+        """A key can be called again once its call is finished."""
+        flight = SingleFlight()
+        self.assertEqual(flight.do("key", lambda: 1), 1)
+        self.assertEqual(flight.do("key", lambda: 2), 2)
+
+    def test_exception_shared(self):
+        """The exception raised by the call is raised in every caller, and the key is released."""
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def fail():
+            """Raise once the other thread is waiting."""
+            started.set()
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        errors = []
+
+        def call():
+            """Record the error of a call."""
+            try:
+                flight.do("key", fail)
+            except ValueError as exc:
+                errors.append(exc)
+
+        first = threading.Thread(target=call)
+        first.start()
+        started.wait()
+        second = threading.Thread(target=call)
+        second.start()
+        first.join()
+        second.join()
+
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(flight.do("key", lambda: "ok"), "ok")
+
+
+class TestDecodeJson(MockServerTestCase):
+    """Test that each response is decoded only once."""
+
+    def decodes(self):
+        """Count the calls to json_loads made by pyalteon._helpers."""
+        return mock.patch("pyalteon._helpers.json_loads", wraps=json_loads)
+
+    def test_cached_on_response(self):
+        """The decoded body is kept on the response and returned again."""
+        result = self.client.get(f"{self.client.base_url}/SlbNewCfgEnhRealServerTable")
+
+        with self.decodes() as loads:
+            data = decode_json(result)
+            self.assertIs(decode_json(result), data)
+
+        loads.assert_not_called()
+        self.assertIs(result._pyalteon_json, data)  # pylint: disable=protected-access
+        self.assertEqual(len(data["SlbNewCfgEnhRealServerTable"]), self.rows)
+
+    def test_once_per_response(self):
+        """The client's error test and the endpoint share one decode."""
+        with self.decodes() as loads:
+            self.assertEqual(len(Real(self.client).all), self.rows)
+
+        self.assertEqual(loads.call_count, self.requests_made)
+
+    def test_http_error(self):
+        """An error response is decoded once, for the message of the HttpError."""
+        with self.decodes() as loads:
+            exc = self.assertRaises(HttpError, self.client.get, f"{self.client.base_url}/NoSuchTable")
+
+        self.assertEqual(loads.call_count, 1)
+        self.assertEqual(str(exc), "404s: Table NoSuchTable not found")
+        self.assertEqual(exc.http_result._pyalteon_json["status"], "err")  # pylint: disable=protected-access
+
+    def test_200_error(self):
+        """A 200 response carrying an error is decoded once by the client's error test and the HttpError."""
+        self.server.bodies["ErrTable"] = (b'{"status": "err", "description": "Invalid%20value"}', '"err"')
+
+        with self.decodes() as loads:
+            exc = self.assertRaises(HttpError, self.client.get, f"{self.client.base_url}/ErrTable")
+
+        self.assertEqual(loads.call_count, 1)
+        self.assertEqual(str(exc), "200s: Invalid value")
+
+    def test_invalid_json(self):
+        """A body that isn't JSON raises a ValueError, and isn't cached."""
+        result = mock.Mock(spec=["content"], content=b"<html>")
+
+        self.assertRaises(ValueError, decode_json, result)
+        self.assertFalse(hasattr(result, "_pyalteon_json"))
+
+
+class TestJsonLoads(TestCase):
+    """Test the choice of JSON decoder: orjson, then ujson, then the json module."""
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """Forget the decoder chosen so far."""
+        super().setUp()
+        patcher = mock.patch.object(_compat, "_JSON_LOADS", [])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def fake(name):
+        """Return a fake JSON module which tags what it decodes with its name."""
+        module = types.ModuleType(name)
+        module.loads = lambda data: {"decoder": name, "data": json.loads(data)}
+        return module
+
+    def decoder(self, **modules):
+        """Return the decoder chosen when only some modules can be imported."""
+        with mock.patch.dict(sys.modules, modules):
+            data = json_loads(b'{"a": 1}')
+
+        return data.get("decoder", "json")
+
+    def test_orjson(self):
+        """orjson is preferred."""
+        self.assertEqual(self.decoder(orjson=self.fake("orjson"), ujson=self.fake("ujson")), "orjson")
+
+    def test_ujson(self):
+        """ujson is used without orjson."""
+        self.assertEqual(self.decoder(orjson=None, ujson=self.fake("ujson")), "ujson")
+
+    def test_json(self):
+        """The json module is the last resort."""
+        self.assertEqual(self.decoder(orjson=None, ujson=None), "json")
+        self.assertIs(_compat._JSON_LOADS[0], json.loads)  # pylint: disable=protected-access
+
+    def test_chosen_once(self):
+        """The decoder is chosen on first use and kept."""
+        self.decoder(orjson=self.fake("orjson"))
+
+        self.assertEqual(self.decoder(orjson=None, ujson=None), "orjson")
+
+
+class TestBackgroundThread(TestCase):
+    """Test the thread the polling loops run in."""
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """Create a thread that counts its loops, each followed by a long wait."""
+        super().setUp()
+        self.loops = []
+        self.thread = BackgroundThread(self.run_loop, "pyalteon-test")
+        self.addCleanup(self.thread.stop, 1)
+
+    def run_loop(self):
+        """Loop until stopped."""
+        while not self.thread.stopping:
+            self.loops.append(threading.current_thread().name)
+            self.thread.wait(60)
+
+    def test_stop_interrupts_wait(self):
+        """stop() wakes the thread up and waits for it to return."""
+        self.thread.start()
+        self.thread.start()
+        time.sleep(0.1)
+
+        start = time.monotonic()
+        self.thread.stop()
+
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(self.loops, ["pyalteon-test"])
+        self.assertTrue(self.thread.stopping)
+
+    def test_restart(self):
+        """A stopped thread can be started again."""
+        self.thread.start()
+        time.sleep(0.1)
+        self.thread.stop()
+        self.thread.start()
+        time.sleep(0.1)
+
+        self.assertFalse(self.thread.stopping)
+        self.assertEqual(len(self.loops), 2)
+
+    def test_wait(self):
+        """wait() returns True once stopped, and doesn't sleep for a negative number of seconds."""
+        self.assertFalse(self.thread.wait(-1))
+        self.thread.stop()
+        self.assertTrue(self.thread.wait(60))
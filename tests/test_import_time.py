@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the import time of pyalteon, using the statements and budgets of benchmarks.import_time."""
+
+import os
+import unittest
+
+from testtools import TestCase
+
+from benchmarks.import_time import STATEMENTS
+from benchmarks.import_time import measure
+
+# Multiply the budgets by this, e.g. on slow machines
+SCALE = float(os.environ.get("PYALTEON_IMPORT_TIME_SCALE", "1.0"))
+
+# Set to skip the wall-clock budgets, e.g. on a busy CI runner; the forbidden imports are still checked
+SKIP_TIMING = bool(os.environ.get("PYALTEON_SKIP_TIMING_TESTS"))
+
+# Runs of each statement, in fresh interpreters; the fastest is kept
+REPEAT = 5
+
+
+class TestImportTime(TestCase):
+    """Run each statement in fresh interpreters, as benchmarks/import_time.py does."""
+
+    @unittest.skipIf(SKIP_TIMING, "PYALTEON_SKIP_TIMING_TESTS is set")
+    def test_budget(self):
+        """Each statement runs within its budget."""
+        for statement, (budget, _) in STATEMENTS.items():
+            best = min(measure(statement)[0] for _ in range(REPEAT))
+            self.assertLessEqual(best * 1000, budget * SCALE, statement)
+
+    def test_forbidden_imports(self):
+        """No statement imports a module it doesn't need, e.g. the endpoint classes don't import requests."""
+        for statement, (_, forbidden) in STATEMENTS.items():
+            self.assertEqual(sorted(set(measure(statement)[1]).intersection(forbidden)), [], statement)
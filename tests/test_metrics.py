@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the request metrics hooks."""
+
+import unittest
+
+import requests
+
+from pyalteon import Group
+from pyalteon import Real
+from pyalteon._helpers import HttpError
+from pyalteon.client import Client
+from pyalteon.metrics import CounterMetrics
+from pyalteon.metrics import PrometheusMetrics
+from pyalteon.transport import TransportPolicy
+from tests.lib.testbase import MockServerTestCase
+from tests.lib.testbase import RecordingMetrics
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+REALS = "SlbNewCfgEnhRealServerTable"
+
+
+class TestRequestEvent(MockServerTestCase):
+    """Test the events a Client reports for its requests."""
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """Create a client that records its events."""
+        super().setUp()
+        self.metrics = RecordingMetrics()
+        self.client = self.new_client(metrics=self.metrics)
+
+    def test_success(self):
+        """A table download reports its device, endpoint, status, size and timings."""
+        self.assertEqual(len(Real(self.client).all), self.rows)
+        event = self.metrics.events[-1]
+
+        self.assertEqual((event.device, event.method, event.endpoint), (self.client.base_url, "GET", REALS))
+        self.assertEqual(event.url, f"{self.client.base_url}/{REALS}")
+        self.assertEqual(event.status_code, 200)
+        self.assertEqual(event.response_size, len(self.server.bodies[REALS][0]))
+        self.assertGreater(event.elapsed, 0)
+        self.assertGreater(event.decode_time, 0)
+        self.assertEqual(event.retries, 0)
+        self.assertIsNone(event.error)
+        self.assertEqual(event.attributes["endpoint"], REALS)
+        self.assertIsNone(event.attributes["error"])
+
+    def test_http_error(self):
+        """A request the device refuses reports its status and the exception raised."""
+        self.server.rejected.add(f"/config/{REALS}/1")
+        self.assertRaises(HttpError, self.client.put, f"{self.client.base_url}/{REALS}/1", data="{}")
+        event = self.metrics.events[-1]
+
+        self.assertEqual((event.method, event.endpoint, event.status_code), ("PUT", REALS, 400))
+        self.assertEqual(event.attributes["error"], "HttpError")
+
+    def test_connection_error(self):
+        """A request that gets no response reports no status code."""
+        client = Client("http://127.0.0.1:1", "user", "pass", metrics=self.metrics)
+        self.assertRaises(requests.ConnectionError, lambda: Real(client).all)
+        event = self.metrics.events[-1]
+
+        self.assertIsNone(event.status_code)
+        self.assertIsInstance(event.error, requests.ConnectionError)
+
+    def test_device_action(self):
+        """Device-wide actions are reported under the "config" endpoint."""
+        self.client.post(self.client.base_url + "?action=apply")
+        self.assertEqual(self.metrics.events[-1].endpoint, "config")
+
+
+class TestRetriedEvent(MockServerTestCase):
+    """Test the events of retried requests."""
+
+    fail_first = 1
+
+    def test_retries(self):
+        """Only the final outcome of a retried request is reported, with the number of retries."""
+        metrics = RecordingMetrics()
+        client = self.new_client(metrics=metrics, policy=TransportPolicy(retries=2, backoff_factor=0.01))
+        self.assertEqual(len(Real(client).all), self.rows)
+
+        self.assertEqual(
+            [(event.endpoint, event.status_code, event.retries) for event in metrics.events], [(REALS, 200, 1)]
+        )
+
+
+class TestCounterMetrics(MockServerTestCase):
+    """Test the aggregation of events per device and endpoint."""
+
+    def test_counters(self):
+        """Requests are counted per (device, endpoint), and top() sorts on any counter."""
+        metrics = CounterMetrics()
+        client = self.new_client(metrics=metrics)
+        self.assertEqual(len(Real(client).combined), self.rows)
+        self.assertEqual(len(Real(client).all), self.rows)
+        self.assertEqual(len(Group(client).all), self.rows // 10)
+
+        counters = metrics.counters()
+        self.assertEqual(len(counters), 4)
+        self.assertEqual(counters[(client.base_url, REALS)]["requests"], 2)
+        self.assertEqual(counters[(client.base_url, REALS)]["bytes"], 2 * len(self.server.bodies[REALS][0]))
+        self.assertEqual(counters[(client.base_url, REALS)]["errors"], 0)
+
+        top = metrics.top(count=2, counter="requests")
+        self.assertEqual([(device, endpoint) for device, endpoint, _ in top][0], (client.base_url, REALS))
+        self.assertEqual(len(top), 2)
+        self.assertEqual(metrics.top(count=1, counter="bytes")[0][2]["bytes"], max(
+            value["bytes"] for value in counters.values()
+        ))
+
+    def test_errors(self):
+        """Failed requests are counted as errors."""
+        metrics = CounterMetrics()
+        client = Client("http://127.0.0.1:1", "user", "pass", metrics=metrics)
+        self.assertRaises(requests.ConnectionError, lambda: Real(client).all)
+
+        self.assertEqual(metrics.counters()[(client.base_url, REALS)]["errors"], 1)
+
+    def test_reset(self):
+        """reset() clears every counter."""
+        metrics = CounterMetrics()
+        self.assertEqual(len(Real(self.new_client(metrics=metrics)).all), self.rows)
+        metrics.reset()
+
+        self.assertEqual(metrics.counters(), {})
+        self.assertEqual(metrics.top(), [])
+
+
+@unittest.skipIf(prometheus_client is None, "PrometheusMetrics requires prometheus_client")
+class TestPrometheusMetrics(MockServerTestCase):
+    """Test the export of events to a Prometheus registry."""
+
+    fail_first = 1
+
+    def test_metrics(self):
+        """The latency, size, decode time and retries are exported, labelled with the request."""
+        registry = prometheus_client.CollectorRegistry()
+        metrics = PrometheusMetrics(registry=registry)
+        client = self.new_client(metrics=metrics, policy=TransportPolicy(retries=1, backoff_factor=0.01))
+        self.assertEqual(len(Real(client).all), self.rows)
+
+        labels = {"device": client.base_url, "endpoint": REALS, "method": "GET", "status": "200"}
+        self.assertEqual(registry.get_sample_value("pyalteon_request_seconds_count", labels), 1)
+        self.assertEqual(
+            registry.get_sample_value("pyalteon_response_bytes_total", labels), len(self.server.bodies[REALS][0])
+        )
+        self.assertGreater(registry.get_sample_value("pyalteon_decode_seconds_total", labels), 0)
+        self.assertEqual(registry.get_sample_value("pyalteon_retries_total", labels), 1)
+
+    def test_error_label(self):
+        """A request without a response is labelled with the name of its exception."""
+        registry = prometheus_client.CollectorRegistry()
+        client = Client("http://127.0.0.1:1", "user", "pass", metrics=PrometheusMetrics(registry=registry))
+        self.assertRaises(requests.ConnectionError, lambda: Real(client).all)
+
+        labels = {"device": client.base_url, "endpoint": REALS, "method": "GET", "status": "ConnectionError"}
+        self.assertEqual(registry.get_sample_value("pyalteon_request_seconds_count", labels), 1)
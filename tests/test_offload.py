@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the pyalteon.offload.Offload class."""
+
+import socket
+
+import requests
+
+from pyalteon import Client
+from pyalteon import Group
+from pyalteon import Real
+from pyalteon import Virt
+from pyalteon._helpers import HttpError
+from pyalteon.offload import Offload
+from tests.lib.testbase import MockServerTestCase
+
+
+class TestOffload(MockServerTestCase):
+    """Test that the tables processed in worker processes match those of the endpoint classes."""
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """Start the worker processes."""
+        super().setUp()
+
+        self.offload = Offload(max_workers=2)
+        self.addCleanup(self.offload.shutdown)
+
+    def test_real(self):
+        """The real servers match pyalteon.Real.combined."""
+        self.assertEqual(self.offload.real(self.client).to_dict(), Real(self.client).combined)
+
+    def test_virt(self):
+        """The virtual services match pyalteon.Virt.services."""
+        self.assertEqual(self.offload.virt(self.client).to_dicts(), Virt(self.client).services)
+
+    def test_group(self):
+        """The groups match pyalteon.Group.all_combined."""
+        self.assertEqual(self.offload.group(self.client), Group(self.client).all_combined)
+
+    def test_fetch_raw(self):
+        """The bodies are downloaded as they are, in the order of the tables."""
+        results = Offload.fetch_raw(self.client, Real.PART_TABLES, max_workers=2)
+
+        self.assertEqual(
+            [result.content for result in results], [self.server.bodies[endpoint][0] for endpoint in Real.PART_TABLES]
+        )
+
+    def test_missing_table(self):
+        """An HTTP error downloading a table reaches the caller."""
+        self.server.remove_table(Real.PART_TABLES[1])
+
+        exc = self.assertRaises(HttpError, self.offload.real, self.client)
+        self.assertEqual(exc.http_result.status_code, 404)
+        self.assertRaises(HttpError, Offload.fetch_raw, self.client, Real.PART_TABLES)
+
+    def test_table_error(self):
+        """A 200 response holding an error instead of its table raises an HttpError with its description."""
+        self.server.bodies[Virt.PART_TABLES[2]] = (b'{"status": "err", "description": "Invalid%20table"}', '"err"')
+
+        exc = self.assertRaises(HttpError, self.offload.virt, self.client)
+        self.assertEqual(str(exc), "200s: Invalid table")
+
+    def test_connection_error(self):
+        """A connection error reaches the caller."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        client = Client(f"http://127.0.0.1:{port}", "user", "pass")
+
+        self.assertRaises(requests.exceptions.ConnectionError, self.offload.group, client)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of retrieving only some columns of the tables."""
+
+import os
+from unittest import mock
+
+from fixtures import TempDir
+
+from pyalteon import Real
+from pyalteon._endpoint import COLUMNS
+from pyalteon._endpoint import MISSING
+from pyalteon.cache import SqliteCache
+from tests.lib.testbase import MockServerTestCase
+
+
+class TestProjection(MockServerTestCase):
+    """Count the requests the projected properties make, through the mock server's counters."""
+
+    def test_columns(self):
+        """Only the fields asked for are returned, along with the index columns."""
+        reals = Real(self.client, fields=["Weight", "Submac"]).combined
+
+        self.assertEqual(len(reals), self.rows)
+        self.assertEqual(set(reals["1"]), {"Index", "Weight", "Submac"})
+
+    def test_missing_fields_learned(self):
+        """The part tables found to have none of the fields are skipped by the next objects."""
+        self.assertEqual(set(Real(self.client, fields=["Weight"]).combined["1"]), {"Index", "Weight"})
+        self.assertEqual(self.requests_made, 3)
+
+        self.assertEqual(set(Real(self.new_client(), fields=["Weight"]).combined["1"]), {"Index", "Weight"})
+        self.assertEqual(self.requests_made, 4)
+
+    def test_index_only(self):
+        """Asking for the index columns only still requests every part table."""
+        self.assertEqual(set(Real(self.client, fields=["Index"]).combined["1"]), {"Index"})
+        self.assertEqual(self.requests_made, 3)
+
+    def test_columns_learned_from_whole_tables(self):
+        """The columns of a whole table let the projections skip it from the start."""
+        self.assertEqual(len(Real(self.client).combined), self.rows)
+        self.assertEqual(self.requests_made, 3)
+
+        self.assertEqual(len(Real(self.new_client(), fields=["Weight"]).combined), self.rows)
+        self.assertEqual(self.requests_made, 4)
+
+    def test_columns_learned_from_cache(self):
+        """The columns of whole tables found in a persistent cache are learned by a new process too."""
+        path = os.path.join(self.useFixture(TempDir()).path, "cache.db")
+        cache = SqliteCache(path, ttl=60)
+        self.assertEqual(len(Real(self.new_client(cache=cache)).combined), self.rows)
+        cache.close()
+        self.assertEqual(self.requests_made, 3)
+
+        # Start again from what the cache file holds, as a new process would
+        with mock.patch.dict(COLUMNS, clear=True), mock.patch.dict(MISSING, clear=True):
+            cache = SqliteCache(path, ttl=60)
+            self.addCleanup(cache.close)
+
+            self.assertEqual(len(Real(self.new_client(cache=cache), fields=["Weight"]).combined), self.rows)
+            self.assertEqual(self.requests_made, 3)
+
+            self.assertEqual(len(Real(self.new_client(), fields=["Weight"]).combined), self.rows)
+            self.assertEqual(self.requests_made, 4)
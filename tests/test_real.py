@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the pyalteon.vadc.real.Real class."""
+
+from pyalteon import Real
+from tests.lib.testbase import MockServerTestCase
+
+
+class TestReal(MockServerTestCase):
+    """Test the real server lookups against the mock server."""
+
+    def integer_indexes(self):
+        """Make the mock server return the real server indexes as integers."""
+        for endpoint in Real.PART_TABLES:
+            self.server.set_table(
+                endpoint, [dict(row, Index=int(row["Index"])) for row in self.server.tables[endpoint]]
+            )
+
+    def test_get(self):
+        """A real server is merged from the rows of its index in each part table, using their own URLs."""
+        real = Real(self.client)
+
+        srv = real.get("3")
+
+        self.assertEqual(srv, Real(self.client).combined["3"])
+        self.assertEqual(self.requests_made, 3 + 3)
+        self.assertEqual(real.get(3), srv)
+        self.assertIsNone(real.get("999"))
+
+    def test_get_combined(self):
+        """Once the combined configuration is held, servers are found in it without any request."""
+        real = Real(self.client)
+        combined = real.combined
+        requests = self.requests_made
+
+        self.assertIs(real.get("3"), combined["3"])
+        self.assertIs(real.get(3), combined["3"])
+        self.assertIsNone(real.get("999"))
+        self.assertEqual(self.requests_made, requests)
+
+    def test_integer_indexes(self):
+        """The lookups work the same when the device returns the indexes as integers."""
+        self.integer_indexes()
+        real = Real(self.client)
+
+        self.assertEqual(real.get("3")["Index"], 3)
+        self.assertEqual(real.get(3)["Name"], "real3")
+
+        combined = real.combined
+        self.assertIs(real.get("3"), combined[3])
+        self.assertIs(real.get(3), combined[3])
+        self.assertIsNone(real.get("999"))
+
+    def test_getitem(self):
+        """A missing real server raises a KeyError."""
+        real = Real(self.client)
+
+        self.assertEqual(real["3"]["Name"], "real3")
+        self.assertRaises(KeyError, real.__getitem__, "999")
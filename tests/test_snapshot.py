@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the table snapshots."""
+
+import os
+
+from fixtures import TempDir
+from testtools import TestCase
+
+from pyalteon.snapshot import Snapshot
+from pyalteon.snapshot import row_hash
+from pyalteon.snapshot import table_index_keys
+from tests.lib.testbase import MockServerTestCase
+
+ROWS = [{"Index": "1", "Weight": 1}, {"Index": "2", "Weight": 1}, {"Index": "3", "Weight": 1}]
+
+
+class TestSnapshot(TestCase):
+    """Test the snapshots without a device."""
+
+    def test_row_hash(self):
+        """The hash of a row doesn't depend on the order of its keys."""
+        self.assertEqual(row_hash({"a": 1, "b": 2}), row_hash({"b": 2, "a": 1}))
+        self.assertNotEqual(row_hash({"a": 1}), row_hash({"a": 2}))
+
+    def test_diff(self):
+        """Rows added, removed and modified are found, and unchanged tables are left out."""
+        old = Snapshot()
+        old.add("Table", ROWS)
+        old.add("Same", ROWS)
+
+        new = Snapshot()
+        new.add("Table", [ROWS[0], {"Index": "2", "Weight": 5}, {"Index": "4", "Weight": 1}])
+        new.add("Same", list(reversed(ROWS)))
+
+        diff = new.diff(old)
+        self.assertEqual(list(diff), ["Table"])
+        self.assertEqual(diff["Table"].added, ["4"])
+        self.assertEqual(diff["Table"].removed, ["3"])
+        self.assertEqual(diff["Table"].modified, ["2"])
+
+    def test_new_table(self):
+        """A table that is only in the new snapshot is all added."""
+        new = Snapshot()
+        new.add("Table", ROWS)
+
+        self.assertEqual(sorted(new.diff(Snapshot())["Table"].added), ["1", "2", "3"])
+
+    def test_multi_column_index(self):
+        """Rows of tables with several index columns are identified by all of them."""
+        keys = table_index_keys("SlbOperEnhGroupRealServerTable")
+        self.assertEqual(keys, ["RealServGroupIndex", "RealServRealServIndex"])
+
+        snapshot = Snapshot()
+        snapshot.add("Links", [{"RealServGroupIndex": "1", "RealServRealServIndex": "2"}], keys)
+        self.assertEqual(list(snapshot.tables["Links"]), ["1/2"])
+
+    def test_save_and_load(self):
+        """A snapshot saved to a gzipped file is the same once loaded."""
+        snapshot = Snapshot(device="https://alteon", keep_rows=True)
+        snapshot.add("Table", ROWS)
+
+        path = os.path.join(self.useFixture(TempDir()).path, "snapshot.json.gz")
+        snapshot.save(path)
+        loaded = Snapshot.load(path)
+
+        self.assertEqual(loaded.to_dict(), snapshot.to_dict())
+        self.assertEqual(loaded.diff(snapshot), {})
+
+
+class TestCapture(MockServerTestCase):
+    """Test capturing snapshots from the mock server."""
+
+    def test_capture_and_diff(self):
+        """A change on the device shows up in the diff of two captures."""
+        before = Snapshot.capture(self.client)
+
+        table = "SlbOperEnhGroupRealServerTable"
+        self.server.set_table(table, self.server.tables[table][1:])
+        diff = Snapshot.capture(self.client).diff(before)
+
+        self.assertEqual(list(diff), [table])
+        self.assertEqual(diff[table].removed, ["2/1"])
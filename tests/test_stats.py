@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the statistics endpoints and sampler."""
+
+from testtools import TestCase
+
+from pyalteon import Stats
+from pyalteon import StatsSampler
+from pyalteon.vadc.stats import counter_delta
+from tests.lib.testbase import MockServerTestCase
+
+
+class TestCounterDelta(TestCase):
+    """Test how counter increases are computed."""
+
+    def test_increase(self):
+        """A counter that went up increased by the difference."""
+        self.assertEqual(counter_delta(100, 250), 150)
+        self.assertEqual(counter_delta(5, 5), 0)
+
+    def test_wrap_32(self):
+        """A 32-bit counter that went down wrapped at 2**32."""
+        self.assertEqual(counter_delta(2 ** 32 - 10, 5), 15)
+
+    def test_wrap_64(self):
+        """A counter past 32 bits that went down wrapped at 2**64."""
+        self.assertEqual(counter_delta(2 ** 40, 3), 2 ** 64 - 2 ** 40 + 3)
+
+    def test_explicit_wrap(self):
+        """The wrap value given is used instead of a guess."""
+        self.assertEqual(counter_delta(65530, 4, wrap=65536), 10)
+
+
+class TestStatsSampler(MockServerTestCase):
+    """Test the sampler against the mock server."""
+
+    TABLE = "SlbStatEnhRServerTable"
+
+    def test_rates(self):
+        """The counters increase between samples and the gauges are left out."""
+        sampler = StatsSampler(self.client, tables=["real"], interval=60, maxlen=2)
+        sampler.sample()
+
+        rows = [dict(row, TotalSessions=row["TotalSessions"] + 10) for row in self.server.tables[self.TABLE]]
+        self.server.set_table(self.TABLE, rows)
+        sampler.sample()
+
+        deltas = sampler.deltas("real")
+        self.assertEqual(deltas["1"]["TotalSessions"], 10)
+        self.assertEqual(deltas["1"]["HCOctets"], 0)
+        self.assertNotIn("CurrSessions", deltas["1"])
+        self.assertGreater(sampler.rates("real")["1"]["TotalSessions"], 0)
+
+        sampler.sample()
+        self.assertEqual(len(sampler.samples("real")), 2)
+
+    def test_fields(self):
+        """Only the fields asked for are kept, along with the index columns."""
+        rows = Stats(self.client, fields=["TotalSessions"]).real
+        self.assertEqual(set(rows["1"]), {"Index", "TotalSessions"})
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the pyalteon.table.Table class."""
+
+from array import array
+import pickle
+import unittest
+
+from testtools import TestCase
+
+from pyalteon import Real
+from pyalteon import Virt
+from pyalteon.table import MISSING
+from pyalteon.table import Table
+from tests.lib.testbase import MockServerTestCase
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+ROWS = [
+    {"Index": "1", "Weight": 1, "Ratio": 0.5, "Name": "web1", "Backup": None},
+    {"Index": "2", "Weight": 300, "Ratio": 1.5, "Name": "web2", "Extra": True},
+    {"Index": "3", "Weight": -2, "Ratio": 2.0, "Backup": "web1"},
+]
+
+
+class TestTable(TestCase):
+    """Test that a Table gives back the rows it was built from."""
+
+    def test_to_dicts(self):
+        """The rows come back with the same columns and values, including None values."""
+        self.assertEqual(Table.from_rows(ROWS).to_dicts(), ROWS)
+
+    def test_to_dict(self):
+        """The rows come back keyed on a column."""
+        table = Table.from_rows(ROWS)
+
+        self.assertEqual(table.to_dict(), {row["Index"]: row for row in ROWS})
+        self.assertEqual(table.to_dict(key="Weight")[300], ROWS[1])
+
+    def test_columns(self):
+        """The columns are kept in the order they are first seen, and stored compactly."""
+        table = Table.from_rows(ROWS)
+
+        self.assertEqual(table.columns, ["Index", "Weight", "Ratio", "Name", "Backup", "Extra"])
+        self.assertEqual(len(table), 3)
+        self.assertIn("Extra", table)
+        self.assertEqual((table["Weight"].typecode, table["Ratio"].typecode), ("h", "d"))
+        self.assertEqual(list(table["Name"]), ["web1", "web2", MISSING])
+        self.assertNotIsInstance(table["Backup"], array)
+
+    def test_empty(self):
+        """A table without rows has no columns."""
+        table = Table.from_rows([])
+
+        self.assertEqual((len(table), table.columns, table.to_dicts()), (0, [], []))
+
+    def test_unequal_columns(self):
+        """Columns of different lengths are refused."""
+        self.assertRaises(ValueError, Table, {"Index": ["1", "2"], "Weight": [1]})
+
+    def test_pickle(self):
+        """A pickled table, e.g. returned by a worker process, still leaves out the columns rows don't have."""
+        table = pickle.loads(pickle.dumps(Table.from_rows(ROWS)))
+
+        self.assertIs(pickle.loads(pickle.dumps(MISSING)), MISSING)
+        self.assertEqual(table.to_dicts(), ROWS)
+
+    @unittest.skipIf(numpy is None, "to_numpy() requires numpy")
+    def test_to_numpy(self):
+        """Numeric columns keep their type, and missing values become None."""
+        result = Table.from_rows(ROWS).to_numpy()
+
+        self.assertEqual(list(result["Weight"]), [1, 300, -2])
+        self.assertEqual(list(result["Name"]), ["web1", "web2", None])
+
+
+class TestCombinedTables(MockServerTestCase):
+    """Test the Tables built by the endpoint classes against the mock server."""
+
+    def test_real(self):
+        """Real.combined_table holds the same rows as Real.combined, including JSON null values."""
+        table = "SlbNewCfgEnhRealServerTable"
+        self.server.set_table(table, [dict(row, Name=None) for row in self.server.tables[table]])
+        real = Real(self.client)
+
+        self.assertIsNone(real.combined["1"]["Name"])
+        self.assertEqual(real.combined_table.to_dict(), real.combined)
+
+    def test_virt(self):
+        """Virt.combined_tables merge into the same structure as Virt.combined."""
+        virt = Virt(self.client)
+        self.assertEqual(Virt.merge([table.to_dicts() for table in virt.combined_tables]), virt.combined)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the topology index."""
+
+from testtools import TestCase
+
+from pyalteon.cache import MemoryCache
+from pyalteon.topology import GROUP
+from pyalteon.topology import REAL
+from pyalteon.topology import SERVICE
+from pyalteon.topology import Topology
+from pyalteon.topology import VIRT
+from tests.lib.testbase import MockServerTestCase
+
+
+def build_topology():
+    """Build a small topology by hand.
+
+    Virtual server 1 has services 80 (group 1) and 443 (group 2); virtual server 2 has service 80 (group 2).  Group 1
+    has reals 1 and 2, group 2 has real 2 and group 3 has real 3.
+    """
+    topology = Topology()
+    topology.update_services(
+        [{"Index": "1"}, {"Index": "2"}],
+        [
+            {"ServIndex": "1", "Index": 1, "RealGroup": "1"},
+            {"ServIndex": "1", "Index": 2, "RealGroup": "2"},
+            {"ServIndex": "2", "Index": 1, "RealGroup": "2"},
+        ],
+    )
+    topology.update_groups([
+        {"Index": "1", "RealServers": [{"RealServRealServIndex": "1"}, {"RealServRealServIndex": "2"}]},
+        {"Index": "2", "RealServers": [{"RealServRealServIndex": "2"}]},
+        {"Index": "3", "RealServers": [{"RealServRealServIndex": "3"}]},
+    ])
+    topology.update_reals({"1": {}, "2": {}, "3": {}, "4": {}})
+
+    return topology
+
+
+class TestTopology(TestCase):
+    """Test the queries of a topology built by hand."""
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """Build the topology."""
+        super().setUp()
+        self.topology = build_topology()
+
+    def test_impact(self):
+        """Everything above a real server depends on it."""
+        self.assertEqual(
+            self.topology.impact((REAL, "2")),
+            {(GROUP, "1"), (GROUP, "2"), (SERVICE, "1/1"), (SERVICE, "1/2"), (SERVICE, "2/1"), (VIRT, "1"),
+             (VIRT, "2")},
+        )
+        self.assertEqual(self.topology.impact((REAL, "1"), kind=VIRT), {(VIRT, "1")})
+        self.assertEqual(self.topology.impact((REAL, "4")), set())
+
+    def test_dependencies(self):
+        """A virtual server depends on everything below it."""
+        self.assertEqual(self.topology.dependencies((VIRT, "2"), kind=REAL), {(REAL, "2")})
+
+    def test_dark_if_removed(self):
+        """Only the nodes left with nothing below them go dark."""
+        self.assertEqual(self.topology.dark_if_removed([(REAL, "1")]), set())
+        self.assertEqual(
+            self.topology.dark_if_removed([(REAL, "2")]),
+            {(GROUP, "2"), (SERVICE, "1/2"), (SERVICE, "2/1"), (VIRT, "2")},
+        )
+        self.assertEqual(
+            self.topology.dark_if_removed([(REAL, "1"), (REAL, "2")]),
+            {(GROUP, "1"), (GROUP, "2"), (SERVICE, "1/1"), (SERVICE, "1/2"), (SERVICE, "2/1"), (VIRT, "1"),
+             (VIRT, "2")},
+        )
+
+    def test_unused_nodes(self):
+        """Nodes without parents are listed too."""
+        self.assertIn((REAL, "4"), self.topology.nodes(REAL))
+        self.assertIn((GROUP, "3"), self.topology.nodes(GROUP))
+
+    def test_update_removes_edges(self):
+        """Updating a layer only keeps its new edges."""
+        self.topology.update_groups([
+            {"Index": "1", "RealServers": [{"RealServRealServIndex": "1"}]},
+            {"Index": "2", "RealServers": [{"RealServRealServIndex": "2"}]},
+        ])
+
+        self.assertEqual(self.topology.parents((REAL, "2")), {(GROUP, "2")})
+        self.assertNotIn((GROUP, "3"), self.topology.nodes(GROUP))
+
+
+class TestRefresh(MockServerTestCase):
+    """Test building and refreshing a topology from the mock server."""
+
+    LINKS = "SlbOperEnhGroupRealServerTable"
+
+    def remove_real_links(self, real):
+        """Remove a real server from every group on the server."""
+        self.server.set_table(
+            self.LINKS, [row for row in self.server.tables[self.LINKS] if row["RealServRealServIndex"] != real]
+        )
+
+    def test_refresh_without_cache(self):
+        """refresh() finds changes even when the client has no cache."""
+        topology = Topology(self.client)
+        self.assertNotEqual(topology.impact((REAL, "1")), set())
+
+        self.remove_real_links("1")
+        topology.refresh()
+
+        self.assertEqual(topology.impact((REAL, "1")), set())
+
+    def test_refresh_with_cache(self):
+        """refresh() finds changes through a client cache, and skips the tables that didn't change."""
+        topology = Topology(self.new_client(cache=MemoryCache(ttl=0)))
+        self.assertNotEqual(topology.impact((REAL, "1")), set())
+
+        self.remove_real_links("1")
+        topology.refresh([GROUP])
+
+        self.assertEqual(topology.impact((REAL, "1")), set())
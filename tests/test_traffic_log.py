@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the traffic_log decorator used by pyalteon.Client."""
+
+import logging
+from unittest import mock
+
+from testtools import TestCase
+
+from pyalteon import Real
+from pyalteon._helpers import TRAFFIC_LOG_OPTIONS
+from pyalteon._helpers import set_traffic_log_options
+from pyalteon._helpers import traffic_log
+from tests.lib.testbase import MockServerTestCase
+
+REALS = "SlbNewCfgEnhRealServerTable"
+
+
+class RecordingHandler(logging.Handler):
+    """Keep the log records without formatting them."""
+
+    def __init__(self):
+        """Initialize the class."""
+        super().__init__(level=logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        """Keep the record."""
+        self.records.append(record)
+
+
+class Response(object):  # pylint: disable=too-few-public-methods
+    """Stand in for a requests.Response, counting how many times its body is read."""
+
+    status_code = 200
+    headers = {}
+
+    def __init__(self, content):
+        """Initialize the class."""
+        self.reads = 0
+        self.__content = content
+
+    @property
+    def content(self):
+        """Return the body, counting the read."""
+        self.reads += 1
+        return self.__content
+
+
+class Unprintable(object):  # pylint: disable=too-few-public-methods
+    """Fail the test if it is ever turned into a string."""
+
+    def __str__(self):
+        """Fail."""
+        raise AssertionError("formatted while DEBUG is disabled")
+
+    __repr__ = __str__
+
+
+def restore_options(test):
+    """Put the traffic log options back as they were once a test is finished."""
+    test.addCleanup(TRAFFIC_LOG_OPTIONS.update, dict(TRAFFIC_LOG_OPTIONS))
+
+
+class TestClientTraffic(MockServerTestCase):
+    """Test the traffic a Client logs against the mock server."""
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """Keep the traffic log options of each test to itself."""
+        super().setUp()
+        restore_options(self)
+
+    def messages(self, fields=None):
+        """Download the real servers with DEBUG enabled, returning the messages logged by pyalteon."""
+        with self.assertLogs("pyalteon", logging.DEBUG) as logs:
+            self.assertEqual(len(Real(self.client, fields=fields).all), self.rows)
+
+        return [record.getMessage() for record in logs.records]
+
+    def test_truncated_body(self):
+        """The body of a response is truncated to max_body bytes, followed by its size."""
+        set_traffic_log_options(max_body=10)
+        body = self.server.bodies[REALS][0]
+
+        messages = self.messages()
+
+        self.assertIn(f"Performing a GET on url: {self.client.base_url}/{REALS}", messages)
+        self.assertIn("Result code: 200", messages)
+        self.assertIn(f"Text result: {body[:10].decode()}... ({len(body)} bytes)", messages)
+
+    def test_whole_body(self):
+        """A max_body of None logs the whole body."""
+        set_traffic_log_options(max_body=None)
+
+        self.assertIn(f"Text result: {self.server.bodies[REALS][0].decode()}", self.messages())
+
+    def test_sample_rate(self):
+        """Only the sampled requests are logged."""
+        set_traffic_log_options(sample_rate=0.5)
+
+        with mock.patch("pyalteon._helpers.random.random", return_value=0.7):
+            self.assertFalse([message for message in self.messages() if message.startswith("Performing")])
+        with mock.patch("pyalteon._helpers.random.random", return_value=0.2):
+            self.assertTrue([message for message in self.messages() if message.startswith("Performing")])
+
+        set_traffic_log_options(sample_rate=0.0)
+        self.assertFalse([message for message in self.messages() if message.startswith("Performing")])
+
+
+class TestTrafficLog(TestCase):
+    """Test the traffic_log decorator on its own."""
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """Create a logger for the test."""
+        super().setUp()
+        restore_options(self)
+
+        self.logger = logging.getLogger(f"{__name__}.{self.id()}")
+        self.logger.propagate = False
+        self.handler = RecordingHandler()
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+
+    def wrap(self, result):
+        """Return a function that returns a result, wrapped by traffic_log."""
+        @traffic_log(traffic_logger=self.logger)
+        def get(client, url, headers=None, stream=False):  # pylint: disable=unused-argument
+            """Return the result."""
+            return result
+
+        return get
+
+    def test_disabled(self):
+        """Without DEBUG, nothing is formatted, sampled or read, and the result is returned as-is."""
+        self.logger.setLevel(logging.INFO)
+        result = Response(b"{}")
+
+        with mock.patch("pyalteon._helpers.random.random") as sample:
+            self.assertIs(self.wrap(result)(None, Unprintable(), headers=Unprintable()), result)
+
+        sample.assert_not_called()
+        self.assertEqual(result.reads, 0)
+        self.assertEqual(self.handler.records, [])
+
+    def test_lazy_body(self):
+        """The body is only read when the message is rendered."""
+        self.logger.setLevel(logging.DEBUG)
+        result = Response(b'{"Table": []}')
+
+        self.wrap(result)(None, "http://device/config/Table")
+
+        self.assertEqual(result.reads, 0)
+        self.assertEqual(self.handler.records[-1].getMessage(), 'Text result: {"Table": []}')
+        self.assertEqual(result.reads, 1)
+
+    def test_stream_not_read(self):
+        """The body of a streamed response is left for the caller."""
+        self.logger.setLevel(logging.DEBUG)
+        result = Response(b"{}")
+
+        self.wrap(result)(None, "http://device/config/Table", stream=True)
+
+        self.assertFalse([record for record in self.handler.records if record.getMessage().startswith("Text")])
+        self.assertEqual(result.reads, 0)
+
+    def test_logger_required(self):
+        """The decorator needs a logging.Logger."""
+        self.assertRaises(Exception, traffic_log, traffic_logger=None)
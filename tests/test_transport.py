@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the transport policy: retries, backoff, timeouts and the rate limit."""
+
+import time
+
+import requests
+from testtools import TestCase
+
+from pyalteon import Real
+from pyalteon._helpers import HttpError
+from pyalteon.transport import TokenBucket
+from pyalteon.transport import TransportPolicy
+from tests.lib.testbase import MockServerTestCase
+from tests.lib.testbase import RecordingMetrics
+
+
+class TestRetries(MockServerTestCase):
+    """Test that a Client retries the requests its policy allows."""
+
+    fail_first = 2
+
+    def test_retry_on_503(self):
+        """A GET answered with 503 is retried until it succeeds."""
+        metrics = RecordingMetrics()
+        client = self.new_client(policy=TransportPolicy(retries=3, backoff_factor=0.01), metrics=metrics)
+
+        data = Real(client).all
+
+        self.assertEqual(len(data), self.rows)
+        self.assertEqual(self.requests_made, 3)
+        self.assertEqual(metrics.events[-1].retries, 2)
+        self.assertEqual(metrics.events[-1].status_code, 200)
+
+    def test_retries_used_up(self):
+        """The last 503 is raised once the retries are used up."""
+        client = self.new_client(policy=TransportPolicy(retries=1, backoff_factor=0.01))
+
+        exc = self.assertRaises(HttpError, lambda: Real(client).all)
+        self.assertEqual(exc.http_result.status_code, 503)
+        self.assertEqual(self.requests_made, 2)
+
+    def test_no_retries_by_default(self):
+        """The default policy doesn't retry."""
+        exc = self.assertRaises(HttpError, lambda: Real(self.client).all)
+        self.assertEqual(exc.http_result.status_code, 503)
+        self.assertEqual(self.requests_made, 1)
+
+    def test_unsafe_methods_not_retried(self):
+        """Only the methods in retry_methods are retried."""
+        policy = TransportPolicy(retries=3)
+        self.assertTrue(policy.can_retry("get", 0))
+        self.assertFalse(policy.can_retry("PUT", 0))
+        self.assertFalse(policy.can_retry("GET", 3))
+
+
+class TestTimeouts(MockServerTestCase):
+    """Test the timeouts of the policy."""
+
+    latency = 0.5
+
+    def test_read_timeout(self):
+        """A device slower than the read timeout raises requests.Timeout."""
+        client = self.new_client(policy=TransportPolicy(connect_timeout=1, read_timeout=0.05))
+
+        self.assertRaises(requests.Timeout, lambda: Real(client).all)
+
+    def test_timeout_retried(self):
+        """A timed out GET is retried like a 503."""
+        client = self.new_client(policy=TransportPolicy(read_timeout=0.05, retries=2, backoff_factor=0.01))
+
+        self.assertRaises(requests.Timeout, lambda: Real(client).all)
+        # The server counts a request once it answers it, so wait for the last one
+        time.sleep(self.latency + 0.2)
+        self.assertEqual(self.requests_made, 3)
+
+    def test_client_timeout_overrides_policy(self):
+        """The timeout given to the Client wins over the policy's."""
+        client = self.new_client(timeout=2, policy=TransportPolicy(read_timeout=0.05))
+
+        self.assertEqual(len(Real(client).all), self.rows)
+
+
+class TestBackoff(TestCase):
+    """Test how long the policy waits between retries."""
+
+    def test_full_jitter(self):
+        """The delay is random, up to the backoff factor doubled after each retry and capped at backoff_max."""
+        policy = TransportPolicy(backoff_factor=0.5, backoff_max=3)
+        for attempt, cap in ((0, 0.5), (1, 1.0), (2, 2.0), (5, 3)):
+            for _ in range(50):
+                delay = policy.backoff(attempt)
+                self.assertGreaterEqual(delay, 0)
+                self.assertLessEqual(delay, cap)
+
+    def test_retry_after(self):
+        """A Retry-After header in seconds is followed, up to backoff_max."""
+        policy = TransportPolicy(backoff_max=10)
+        self.assertEqual(policy.backoff(0, retry_after="2"), 2.0)
+        self.assertEqual(policy.backoff(0, retry_after="120"), 10)
+
+    def test_retry_after_date_ignored(self):
+        """A Retry-After header that isn't a number of seconds falls back to the backoff."""
+        policy = TransportPolicy(backoff_factor=0.1)
+        self.assertLessEqual(policy.backoff(0, retry_after="Wed, 21 Oct 2015 07:28:00 GMT"), 0.1)
+
+
+class TestTokenBucket(TestCase):
+    """Test the rate limit."""
+
+    def test_burst_then_rate(self):
+        """The burst is allowed at once, and the requests after it at the rate."""
+        bucket = TokenBucket(rate=50, burst=5)
+
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.05)
+
+        for _ in range(5):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_policy_rate_limiter(self):
+        """A policy gives each client its own bucket, and none without a rate."""
+        self.assertIsNone(TransportPolicy().rate_limiter())
+
+        policy = TransportPolicy(rate=10)
+        self.assertIsNot(policy.rate_limiter(), policy.rate_limiter())
+
+
+class TestRateLimitedClient(MockServerTestCase):
+    """Test that a Client keeps to the rate of its policy."""
+
+    def test_rate(self):
+        """Requests beyond the burst wait for the rate."""
+        client = self.new_client(policy=TransportPolicy(rate=20, burst=1))
+
+        start = time.monotonic()
+        for endpoint in ("SlbNewCfgEnhRealServerTable", "SlbNewCfgEnhGroupTable", "SlbNewCfgEnhVirtServerTable"):
+            client.get(f"{client.base_url}/{endpoint}")
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
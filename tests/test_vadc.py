@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the pyalteon.vx.vadc.VADC class."""
+
+from urllib.parse import urlparse
+
+from pyalteon import VADC
+from pyalteon import Group
+from pyalteon import Real
+from pyalteon import Virt
+from pyalteon.fleet import Fleet
+from tests.lib.testbase import MockServerTestCase
+
+
+def merged(*rows):
+    """Merge rows into one dictionary."""
+    ret = {}
+    for row in rows:
+        ret.update(row)
+
+    return ret
+
+
+class TestVADC(MockServerTestCase):
+    """Test the vADC lookups against the mock server, whose vADC tables are keyed on an integer Id."""
+
+    rows = 300
+
+    def test_get(self):
+        """A vADC is merged from its rows of the vADC, system and network tables, using their own URLs."""
+        vadc = VADC(self.client)
+
+        ret = vadc.get(2)
+
+        self.assertEqual(
+            ret,
+            {
+                "Id": 2, "State": 2, "CapacityUnits": 2, "HostName": "vadc2", "Ntp": 1, "MgmtAddr": "172.16.0.2",
+                "MgmtMask": "255.255.255.0",
+            },
+        )
+        self.assertEqual(self.requests_made, 3)
+        self.assertEqual(vadc.get("2"), ret)
+        self.assertIsNone(vadc.get(999))
+
+    def test_get_cached(self):
+        """The tables already held are looked up without any request."""
+        vadc = VADC(self.client)
+        self.assertEqual(len(vadc.all), 3)
+        self.assertEqual(len(vadc.system), 3)
+        self.assertEqual(len(vadc.network), 3)
+        requests = self.requests_made
+
+        ret = vadc.get("3")
+        self.assertEqual(ret, merged(vadc.all[2], vadc.system[2], vadc.network[2]))
+        self.assertEqual(vadc.get(3), ret)
+        self.assertIsNone(vadc.get(999))
+        self.assertEqual(self.requests_made, requests)
+
+    def test_get_partly_cached(self):
+        """Only the rows of the tables not held are queried."""
+        vadc = VADC(self.client)
+        self.assertEqual(len(vadc.network), 3)
+        requests = self.requests_made
+
+        ret = vadc.get(1)
+
+        self.assertEqual(self.requests_made, requests + 2)
+        self.assertEqual(ret, merged(vadc.all[0], vadc.system[0], vadc.network[0]))
+
+
+class TestVADCFleet(MockServerTestCase):
+    """Test reaching the vADCs listed in the network table of the mock server."""
+
+    rows = 300
+
+    def serve_vadcs(self):
+        """Point the vADCs at the mock server, the third one having no address; return the port of the server."""
+        self.server.set_table(
+            "VADCNewCfgNetTable",
+            [
+                {"Id": 1, "MgmtAddr": "127.0.0.1", "MgmtMask": "255.0.0.0"},
+                {"Id": 2, "MgmtAddr": "localhost", "MgmtMask": "255.0.0.0"},
+                {"Id": 3, "MgmtAddr": "0.0.0.0", "MgmtMask": "0.0.0.0"},
+            ],
+        )
+
+        return urlparse(self.server.base_url).port
+
+    def test_addresses(self):
+        """The URLs are built from the scheme of the VX device and the addresses in the network table."""
+        vadc = VADC(self.client)
+
+        self.assertEqual(vadc.addresses(), {1: "http://172.16.0.1", 2: "http://172.16.0.2", 3: "http://172.16.0.3"})
+        self.assertEqual(vadc.addresses(scheme="https", port=8443)[2], "https://172.16.0.2:8443")
+        self.assertEqual(vadc.addresses(address_field="HostName"), {})
+
+    def test_addresses_skipped(self):
+        """vADCs without an address, or with 0.0.0.0, are left out."""
+        port = self.serve_vadcs()
+        self.server.set_table(
+            "VADCNewCfgNetTable", self.server.tables["VADCNewCfgNetTable"] + [{"Id": 4, "MgmtAddr": ""}, {"Id": 5}]
+        )
+
+        self.assertEqual(
+            VADC(self.client).addresses(port=port),
+            {1: f"http://127.0.0.1:{port}", 2: f"http://localhost:{port}"},
+        )
+
+    def test_fleet(self):
+        """The fleet holds a device for each vADC with an address."""
+        port = self.serve_vadcs()
+
+        fleet = VADC(self.client).fleet("user", "pass", port=port, max_workers=2)
+
+        self.assertIsInstance(fleet, Fleet)
+        self.assertEqual(fleet.devices, [f"http://127.0.0.1:{port}", f"http://localhost:{port}"])
+        self.assertTrue(all(result.ok for result in fleet.run_endpoint(Real, "all")))
+
+    def test_collect(self):
+        """The groups, real servers and virtual servers of each vADC are collected, keyed on the vADC Id."""
+        port = self.serve_vadcs()
+        expected = {
+            "groups": Group(self.client).all_combined,
+            "reals": Real(self.client).combined,
+            "virts": Virt(self.client).combined,
+        }
+
+        results = VADC(self.client).collect("user", "pass", port=port)
+
+        self.assertEqual(sorted(results), [1, 2])
+        for result in results.values():
+            self.assertTrue(result.ok, result.error)
+            self.assertEqual(result.value, expected)
+
+    def test_collect_queries(self):
+        """Custom queries are run instead, and their errors are kept in the result of each vADC."""
+        port = self.serve_vadcs()
+
+        def fail(client):
+            """Fail on the second vADC."""
+            if "localhost" in client.base_url:
+                raise ValueError("no such table")
+            return len(Real(client).all)
+
+        results = VADC(self.client).collect("user", "pass", queries={"reals": fail}, port=port)
+
+        self.assertEqual(results[1].value, {"reals": self.rows})
+        self.assertIsInstance(results[2].error, ValueError)
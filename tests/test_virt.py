@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the pyalteon.vadc.virt.Virt class."""
+
+from pyalteon import Group
+from pyalteon import Real
+from pyalteon import Virt
+from tests.lib.testbase import MockServerTestCase
+
+
+class TestVirt(MockServerTestCase):
+    """Test the virtual service lookups against the mock server, whose virtual servers have services on 80 and 81."""
+
+    def integer_indexes(self):
+        """Make the mock server return the virtual server indexes and service numbers as integers."""
+        for endpoint in Virt.PART_TABLES + [Virt.TABLE]:
+            rows = []
+            for row in self.server.tables[endpoint]:
+                row = dict(row)
+                for key in Virt.INDEX_KEYS.get(endpoint, ["Index"]) + ["RealGroup"]:
+                    if key in row:
+                        row[key] = int(row[key])
+                rows.append(row)
+            self.server.set_table(endpoint, rows)
+
+    def test_service(self):
+        """A service is found by its virtual server and port, and merged from the part tables."""
+        virt = Virt(self.client)
+
+        svc = virt.service("1", 81)
+
+        self.assertIn(svc, Virt(self.client).services)
+        self.assertEqual((svc["ServIndex"], svc["VirtPort"], svc["Index"]), ("1", 81, 2))
+        self.assertEqual(virt.service(1, "81"), svc)
+        self.assertIsNone(virt.service("1", 443))
+        self.assertIsNone(virt.service("999", 80))
+
+    def test_service_rows(self):
+        """Only the first part table is downloaded; the other rows are retrieved using their own URLs."""
+        Virt(self.client).service("1", 80)
+
+        self.assertEqual(self.requests_made, len(Virt.PART_TABLES))
+
+    def test_service_cached(self):
+        """Once the services are held, they are found without any request."""
+        virt = Virt(self.client)
+        services = virt.services
+        requests = self.requests_made
+
+        svc = virt.service("2", 80)
+
+        self.assertTrue(any(svc is service for service in services))
+        self.assertIs(virt.service(2, 80), svc)
+        self.assertEqual(self.requests_made, requests)
+
+    def test_integer_indexes(self):
+        """The lookups work the same when the device returns the indexes as integers."""
+        self.integer_indexes()
+        virt = Virt(self.client)
+
+        self.assertEqual(virt.service("1", 81)["ServIndex"], 1)
+
+        services = virt.services
+        self.assertEqual(virt.service("1", 81), [svc for svc in services if svc["ServIndex"] == 1][1])
+
+    def test_flatten(self):
+        """The rows of each service are joined across the part tables, whatever the type of their indexes."""
+        parts = [
+            [{"ServIndex": "1", "Index": 1, "VirtPort": 80}, {"ServIndex": "1", "Index": 2, "VirtPort": 443}],
+            [{"ServSecondPartIndex": 1, "SecondPartIndex": "2", "Setting": "b"}],
+            [
+                {"ServThirdPartIndex": "1", "ThirdPartIndex": "1", "Other": "a"},
+                {"ServThirdPartIndex": "9", "ThirdPartIndex": "1"},
+            ],
+        ]
+
+        self.assertEqual(
+            Virt.flatten(parts),
+            [
+                {"ServIndex": "1", "Index": 1, "VirtPort": 80, "ServThirdPartIndex": "1", "ThirdPartIndex": "1",
+                 "Other": "a"},
+                {"ServIndex": "1", "Index": 2, "VirtPort": 443, "ServSecondPartIndex": 1, "SecondPartIndex": "2",
+                 "Setting": "b"},
+                {"ServThirdPartIndex": "9", "ThirdPartIndex": "1"},
+            ],
+        )
+        self.assertEqual(parts[0][0], {"ServIndex": "1", "Index": 1, "VirtPort": 80})
+
+    def test_link(self):
+        """Each service gets its virtual server, group and real servers, whatever the type of their indexes."""
+        services = [
+            {"ServIndex": 1, "Index": 1, "RealGroup": "1"},
+            {"ServIndex": "2", "Index": 1, "RealGroup": 9},
+            {"ServIndex": "3", "Index": 1},
+        ]
+        servers = [{"Index": "1", "Name": "virt1"}, {"Index": 2, "Name": "virt2"}]
+        groups = [
+            {"Index": 1, "RealServers": [{Group.REAL_KEY: "1"}, {Group.REAL_KEY: 2}, {Group.REAL_KEY: "3"}]},
+        ]
+        reals = {1: {"Index": 1}, "2": {"Index": "2"}}
+
+        linked = Virt.link(services, servers, groups, reals)
+
+        self.assertIs(linked[0]["VirtServer"], servers[0])
+        self.assertIs(linked[0]["Group"], groups[0])
+        self.assertEqual(linked[0]["Reals"], [reals[1], reals["2"]])
+        self.assertIs(linked[1]["VirtServer"], servers[1])
+        self.assertIsNone(linked[1]["Group"])
+        self.assertEqual(linked[1]["Reals"], [])
+        self.assertIsNone(linked[2]["VirtServer"])
+        self.assertNotIn("VirtServer", services[0])
+
+    def test_linked_services(self):
+        """The services of the device are linked to its virtual servers, groups and real servers."""
+        linked = Virt(self.client).linked_services
+        reals = Real(self.client).combined
+
+        self.assertEqual(len(linked), self.rows)
+        for service in linked:
+            self.assertEqual(service["VirtServer"]["Index"], service["ServIndex"])
+            self.assertEqual(service["Group"]["Index"], service["RealGroup"])
+            self.assertEqual(
+                [srv["Index"] for srv in service["Reals"]],
+                [idx for idx in reals if int(idx) % 2 + 1 == int(service["RealGroup"])],
+            )
+
+    def test_linked_services_integer_indexes(self):
+        """The services are linked the same when the device returns the indexes as integers."""
+        expected = Virt(self.client).linked_services
+        self.integer_indexes()
+        for endpoint in Real.PART_TABLES + ["SlbNewCfgEnhGroupTable"]:
+            self.server.set_table(
+                endpoint, [dict(row, Index=int(row["Index"])) for row in self.server.tables[endpoint]]
+            )
+        self.server.set_table(
+            "SlbOperEnhGroupRealServerTable",
+            [
+                dict(row, **{Group.GROUP_KEY: int(row[Group.GROUP_KEY]), Group.REAL_KEY: int(row[Group.REAL_KEY])})
+                for row in self.server.tables["SlbOperEnhGroupRealServerTable"]
+            ],
+        )
+
+        linked = Virt(self.client).linked_services
+
+        self.assertEqual(
+            [[srv["Name"] for srv in service["Reals"]] for service in linked],
+            [[srv["Name"] for srv in service["Reals"]] for service in expected],
+        )
+        self.assertTrue(all(service["VirtServer"] and service["Group"] for service in linked))
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Define the tests of the pyalteon.watch.Watcher class."""
+
+from pyalteon._helpers import HttpError
+from pyalteon.watch import Watcher
+from tests.lib.testbase import MockServerTestCase
+
+REALS = "SlbNewCfgEnhRealServerTable"
+LINKS = "SlbOperEnhGroupRealServerTable"
+
+
+class TestWatcher(MockServerTestCase):
+    """Test a Watcher against the mock server."""
+
+    rows = 5
+
+    def change_weight(self, index, weight):
+        """Change the weight of a real server on the server."""
+        rows = [dict(row) for row in self.server.tables[REALS]]
+        rows[index]["Weight"] = weight
+        self.server.set_table(REALS, rows)
+
+    def test_initial_poll(self):
+        """The first poll sends an "added" event per row, unless initial is False."""
+        events = Watcher(self.client).poll()
+        self.assertEqual(len(events), 2 * self.rows)
+        self.assertEqual({event.change for event in events}, {"added"})
+
+        self.assertEqual(Watcher(self.client, initial=False).poll(), [])
+
+    def test_modified(self):
+        """A changed row is sent as "modified", with its old and new values, to every subscriber."""
+        watcher = Watcher(self.client, tables=[REALS], initial=False)
+        received = []
+        watcher.subscribe(received.append)
+        changes = watcher.queue()
+        watcher.poll()
+
+        self.change_weight(0, 9)
+        events = watcher.poll()
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual((events[0].change, events[0].index), ("modified", "1"))
+        self.assertEqual((events[0].previous["Weight"], events[0].row["Weight"]), (1, 9))
+        self.assertEqual(received, events)
+        self.assertIs(changes.get_nowait(), events[0])
+        self.assertEqual(watcher.rows(REALS)["1"]["Weight"], 9)
+
+    def test_unchanged(self):
+        """A poll that finds nothing new sends nothing."""
+        watcher = Watcher(self.client, initial=False)
+        watcher.poll()
+        self.assertEqual(watcher.poll(), [])
+
+    def test_failed_table(self):
+        """A table that can't be polled doesn't lose the changes found in the others, and is caught up later."""
+        watcher = Watcher(self.client, tables=[REALS, LINKS], initial=False)
+        received = []
+        watcher.subscribe(received.append)
+        watcher.poll()
+
+        self.change_weight(1, 5)
+        links = self.server.tables[LINKS]
+        self.server.remove_table(LINKS)
+        self.assertRaises(HttpError, watcher.poll)
+        self.assertEqual([(event.table, event.index) for event in received], [(REALS, "2")])
+
+        self.server.set_table(LINKS, links[1:])
+        events = watcher.poll()
+        self.assertEqual([(event.table, event.change) for event in events], [(LINKS, "removed")])